@@ -0,0 +1,111 @@
+import os
+import time
+
+import jwt
+import pytest
+import requests
+from furl import furl
+
+BASE_URL = furl("http://localhost:8000/")
+
+
+def generate_token(client_id: str, secret: str) -> str:
+    payload = {
+        "iss": "openzaak",
+        "iat": int(time.time()),
+        "client_id": client_id,
+        "user_id": client_id,
+        "user_representation": client_id,
+    }
+    return jwt.encode(payload, secret, algorithm="HS256")
+
+
+TOKEN_SUPERUSER = generate_token("superuser", "superuser")
+HEADERS = {"Authorization": f"Bearer {TOKEN_SUPERUSER}"}
+
+FILE_SIZE = 64 * 2**20
+RANGE_SIZE = 2**20
+
+
+@pytest.fixture(scope="module")
+def download_url():
+    """
+    Upload a large document (through the large file upload flow) to download.
+    """
+    response = requests.get(
+        BASE_URL / "catalogi/api/v1/informatieobjecttypen",
+        params={"status": "definitief"},
+        headers=HEADERS,
+    )
+    response.raise_for_status()
+    informatieobjecttype = response.json()["results"][0]["url"]
+
+    response = requests.post(
+        BASE_URL / "documenten/api/v1/enkelvoudiginformatieobjecten",
+        json={
+            "bronorganisatie": "517439943",
+            "creatiedatum": "2026-01-01",
+            "titel": "large file",
+            "auteur": "performance test",
+            "taal": "nld",
+            "bestandsnaam": "large_file.bin",
+            "bestandsomvang": FILE_SIZE,
+            "informatieobjecttype": informatieobjecttype,
+            "vertrouwelijkheidaanduiding": "openbaar",
+        },
+        headers=HEADERS,
+    )
+    response.raise_for_status()
+    eio = response.json()
+
+    content = os.urandom(FILE_SIZE)
+    offset = 0
+    for part in eio["bestandsdelen"]:
+        response = requests.put(
+            part["url"],
+            data={"lock": eio["lock"]},
+            files={"inhoud": content[offset : offset + part["omvang"]]},
+            headers=HEADERS,
+        )
+        response.raise_for_status()
+        offset += part["omvang"]
+
+    response = requests.post(
+        f"{eio['url']}/unlock", json={"lock": eio["lock"]}, headers=HEADERS
+    )
+    response.raise_for_status()
+
+    return f"{eio['url']}/download"
+
+
+@pytest.mark.benchmark(max_time=60, min_rounds=5)
+def test_documenten_download_range(benchmark, benchmark_assertions, download_url):
+    start = FILE_SIZE // 2
+    headers = {**HEADERS, "Range": f"bytes={start}-{start + RANGE_SIZE - 1}"}
+
+    def make_request():
+        return requests.get(download_url, headers=headers)
+
+    result = benchmark(make_request)
+
+    assert result.status_code == 206
+    assert len(result.content) == RANGE_SIZE
+
+    benchmark_assertions(mean=0.2, median=0.2)
+
+
+@pytest.mark.benchmark(max_time=60, min_rounds=5)
+def test_documenten_download_not_modified(
+    benchmark, benchmark_assertions, download_url
+):
+    etag = requests.get(download_url, headers=HEADERS, stream=True).headers["ETag"]
+    headers = {**HEADERS, "If-None-Match": etag}
+
+    def make_request():
+        return requests.get(download_url, headers=headers)
+
+    result = benchmark(make_request)
+
+    assert result.status_code == 304
+
+    benchmark_assertions(mean=0.2, median=0.2)
@@ -94,3 +94,96 @@ def test_zaken_list_non_superuser_many_authorized_types(
     assert len(data["results"]) == 100
 
     benchmark_assertions(mean=1, median=1)
+
+
+@pytest.mark.benchmark(max_time=60, min_rounds=5)
+def test_zaken_list_non_superuser_many_authorized_types_small_page(
+    benchmark, benchmark_assertions
+):
+    """
+    With small pages, resolving the authorizations to zaaktypen dominates the
+    response time, which is avoided by caching the resolved authorization filters
+    """
+    params = {"pageSize": 10, "page": 1}
+
+    def make_request():
+        return requests.get(
+            (BASE_URL / "zaken").set(params), headers=HEADERS_NON_SUPERUSER_MANY_TYPES
+        )
+
+    result = benchmark(make_request)
+
+    assert result.status_code == 200
+    data = result.json()
+    assert data["count"] == 3300
+    assert len(data["results"]) == 10
+
+    benchmark_assertions(mean=0.3, median=0.3)
+
+
+@pytest.mark.benchmark(max_time=60, min_rounds=5)
+def test_zaken_list_hyperlinked_collections(benchmark, benchmark_assertions):
+    """
+    The nested collections (rollen, zaakobjecten, ...) are only rendered as URLs, so
+    only their UUIDs should be fetched
+    """
+    params = {"pageSize": 100, "page": 1}
+
+    def make_request():
+        return requests.get((BASE_URL / "zaken").set(params), headers=HEADERS)
+
+    result = benchmark(make_request)
+
+    assert result.status_code == 200
+    data = result.json()
+    assert len(data["results"]) == 100
+    for zaak in data["results"]:
+        for field in ("rollen", "zaakobjecten", "zaakinformatieobjecten"):
+            assert all(url.startswith("http") for url in zaak[field])
+
+    benchmark_assertions(mean=1, median=1)
+
+
+@pytest.mark.benchmark(max_time=60, min_rounds=5)
+def test_zaken_list_expand_hyperlinked_collections(benchmark, benchmark_assertions):
+    """
+    Expanding the nested collections requires the full objects, as comparison for
+    `test_zaken_list_hyperlinked_collections`
+    """
+    params = {"pageSize": 100, "page": 1, "expand": "rollen,zaakobjecten"}
+
+    def make_request():
+        return requests.get((BASE_URL / "zaken").set(params), headers=HEADERS)
+
+    result = benchmark(make_request)
+
+    assert result.status_code == 200
+    data = result.json()
+    assert len(data["results"]) == 100
+
+    benchmark_assertions(mean=2, median=2)
+
+
+@pytest.mark.benchmark(max_time=60, min_rounds=5)
+def test_zaken_list_expand_full_page(benchmark, benchmark_assertions):
+    """
+    Expanding multiple (nested) inclusions for a full page builds a large inclusion
+    tree, which should scale linearly with the number of included objects
+    """
+    params = {
+        "pageSize": 100,
+        "page": 1,
+        "expand": "rollen,status,status.statustype,zaakinformatieobjecten,zaakobjecten",
+    }
+
+    def make_request():
+        return requests.get((BASE_URL / "zaken").set(params), headers=HEADERS)
+
+    result = benchmark(make_request)
+
+    assert result.status_code == 200
+    data = result.json()
+    assert len(data["results"]) == 100
+    assert all("_expand" in zaak for zaak in data["results"])
+
+    benchmark_assertions(mean=2, median=2)
@@ -4,14 +4,146 @@
 Provide utilities to interact with other APIs as a client.
 """
 
-from vng_api_common.client import Client, get_client, to_internal_data
+import math
+import os
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+from django.conf import settings
+
+import requests
+import requests_cache
+from requests.adapters import HTTPAdapter
+from vng_api_common.client import (
+    Client,
+    NoServiceConfigured,
+    get_client,
+    to_internal_data,
+)
+from zgw_consumers.constants import AuthTypes
+
+__all__ = [
+    "Client",
+    "fetch_object",
+    "get_client",
+    "get_pooled_client",
+    "get_session",
+]
+
+# pooled clients are rebuilt this many seconds before their JWT expires
+JWT_EXPIRY_MARGIN = 60
+
+# service pk -> (service configuration, expiry, client)
+_clients: Dict[Optional[int], Tuple[tuple, float, requests.Session]] = {}
+_clients_pid: Optional[int] = None
+_clients_lock = threading.Lock()
+
+
+def _get_configuration(service) -> tuple:
+    if service is None:
+        return (settings.EXTERNAL_HTTP_CACHE,)
+
+    return (
+        settings.EXTERNAL_HTTP_CACHE,
+        service.api_root,
+        service.auth_type,
+        service.client_id,
+        service.secret,
+        service.user_id,
+        service.user_representation,
+        service.jwt_valid_for,
+        service.header_key,
+        service.header_value,
+        service.timeout,
+        service.client_certificate_id,
+        service.server_certificate_id,
+    )
+
+
+def _build_client(service) -> requests.Session:
+    from zgw_consumers.client import build_client
+
+    from openzaak.utils.cache import CachedClient, DjangoCachedSession
+
+    use_cache = bool(settings.EXTERNAL_HTTP_CACHE)
+
+    if service is None:
+        session = DjangoCachedSession() if use_cache else requests.Session()
+    else:
+        client_factory = CachedClient if use_cache else Client
+        session = build_client(service, client_factory=client_factory)
+        # keep the connection pool open in between requests
+        session.__enter__()
+
+    pool_size = settings.EXTERNAL_OBJECTS_MAX_WORKERS
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def get_pooled_client(service) -> requests.Session:
+    """
+    ⚡️ Return the HTTP client for a ``zgw_consumers`` service, shared by the process.
+
+    Connections are kept alive in between requests. The client (and thereby its JWT)
+    is rebuilt when the configuration of the service changes, or shortly before the
+    JWT expires. Without a service, a session without any authentication is returned.
+    """
+    global _clients_pid
+
+    key = service.pk if service else None
+    configuration = _get_configuration(service)
+    now = time.monotonic()
+
+    with _clients_lock:
+        # connection pools can't be shared with forked processes
+        if _clients_pid != os.getpid():
+            _clients.clear()
+            _clients_pid = os.getpid()
+
+        entry = _clients.get(key)
+        if entry and entry[0] == configuration and entry[1] > now:
+            return entry[2]
+
+        client = _build_client(service)
+        expires = (
+            now + service.jwt_valid_for - JWT_EXPIRY_MARGIN
+            if service and service.auth_type == AuthTypes.zgw
+            else math.inf
+        )
+        _clients[key] = (configuration, expires, client)
+
+    return client
+
+
+def get_session(url: str) -> requests.Session:
+    """
+    Return the pooled client for the service the URL belongs to.
+    """
+    from openzaak.utils.services import get_service
+
+    return get_pooled_client(get_service(url))
 
 
 def fetch_object(url: str) -> dict | list | None:
     """
     Fetch a remote object by URL.
     """
-    client: Client = get_client(url, raise_exceptions=True)
+    # `requests_cache_enabled` patches the client class, which is not used by the
+    # clients that were already pooled
+    if requests_cache.is_installed():
+        client: Client = get_client(url, raise_exceptions=True)
+
+        with client:
+            return to_internal_data(client.get(url=url))
+
+    from openzaak.utils.services import get_service
+
+    service = get_service(url)
+    if not service:
+        raise NoServiceConfigured(f"{url} API should be added to Service model")
 
-    with client:
-        return to_internal_data(client.get(url=url))
+    client = get_pooled_client(service)
+    return to_internal_data(client.get(url=url))
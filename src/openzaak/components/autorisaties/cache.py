@@ -0,0 +1,60 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+"""
+Versioned cache for the authorization filters of list endpoints.
+
+Resolving the ``Autorisatie`` and ``CatalogusAutorisatie`` records of an
+``Applicatie`` to the allowed (zaak/informatieobject/besluit)typen requires a number
+of queries that yield the same result for every request of the same client. The
+resolved filters are cached under a key that contains a version, which is replaced
+whenever the authorizations or the catalogi change (see ``signals.py``), so stale
+entries are never read again and simply expire.
+"""
+
+from typing import Iterable
+from uuid import uuid4
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+VERSION_CACHE_KEY = "autorisaties:filters:version"
+
+
+def get_autorisaties_version() -> str:
+    version = cache.get(VERSION_CACHE_KEY)
+    if version is None:
+        # a random initial value makes sure entries from before an eviction of the
+        # version key are never reused
+        cache.add(VERSION_CACHE_KEY, uuid4().hex, timeout=None)
+        version = cache.get(VERSION_CACHE_KEY)
+    return version
+
+
+def bump_autorisaties_version() -> None:
+    cache.set(VERSION_CACHE_KEY, uuid4().hex, timeout=None)
+
+
+def invalidate_autorisaties_cache() -> None:
+    """
+    Invalidate all cached authorization filters.
+
+    The version is replaced immediately, so the current transaction doesn't see stale
+    filters, and once more after commit, to discard filters that were cached by
+    concurrent requests from the old state in the meantime.
+    """
+    bump_autorisaties_version()
+    transaction.on_commit(bump_autorisaties_version)
+
+
+def get_filters_cache_key(applicatie_ids: Iterable[int], component: str) -> str:
+    """
+    Return the (versioned) cache key prefix for the filters of a set of applicaties.
+
+    Returns an empty string if the cache is disabled.
+    """
+    if not settings.AUTORISATIES_FILTERS_CACHE_TIMEOUT:
+        return ""
+
+    ids = ",".join(str(pk) for pk in sorted(applicatie_ids))
+    return f"autorisaties:filters:{get_autorisaties_version()}:{component}:{ids}"
@@ -13,6 +13,7 @@ from vng_api_common.authorizations.middleware import (
 )
 from vng_api_common.authorizations.models import Autorisatie
 
+from openzaak.components.autorisaties.cache import get_filters_cache_key
 from openzaak.components.autorisaties.models import CatalogusAutorisatie
 from openzaak.utils.constants import COMPONENT_MAPPING
 
@@ -75,6 +76,19 @@ class JWTAuth(_JWTAuth):
 
         return self._catalogus_cache[init_component]
 
+    def get_filters_cache_key(self, init_component: str) -> str:
+        """
+        Return the key prefix to cache the authorization filters of this component.
+
+        The key is derived from the applicaties of the client rather than the
+        client itself, so clients sharing an applicatie share the cached filters.
+        """
+        if not self.applicaties:
+            return ""
+
+        component = COMPONENT_MAPPING.get(init_component, init_component)
+        return get_filters_cache_key([app.id for app in self.applicaties], component)
+
     def has_auth(self, scopes: List[str], init_component: str = None, **fields) -> bool:
         if scopes is None:
             return False
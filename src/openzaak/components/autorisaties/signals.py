@@ -0,0 +1,65 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+from django.db.models.base import ModelBase
+from django.db.models.signals import ModelSignal, post_delete, post_save
+from django.dispatch import receiver
+
+import structlog
+from vng_api_common.authorizations.models import Applicatie, Autorisatie
+
+from openzaak.components.catalogi.models import (
+    BesluitType,
+    Catalogus,
+    InformatieObjectType,
+    ZaakType,
+)
+
+from .cache import invalidate_autorisaties_cache
+from .models import CatalogusAutorisatie
+
+logger = structlog.stdlib.get_logger(__name__)
+
+
+@receiver(
+    [post_save, post_delete],
+    sender=Applicatie,
+    dispatch_uid="autorisaties.invalidate_cache_applicatie",
+)
+@receiver(
+    [post_save, post_delete],
+    sender=Autorisatie,
+    dispatch_uid="autorisaties.invalidate_cache_autorisatie",
+)
+@receiver(
+    [post_save, post_delete],
+    sender=CatalogusAutorisatie,
+    dispatch_uid="autorisaties.invalidate_cache_catalogusautorisatie",
+)
+@receiver(
+    [post_save, post_delete],
+    sender=Catalogus,
+    dispatch_uid="autorisaties.invalidate_cache_catalogus",
+)
+# (un)publishing, creating and deleting types changes the types that are covered
+# by a CatalogusAutorisatie
+@receiver(
+    [post_save, post_delete],
+    sender=ZaakType,
+    dispatch_uid="autorisaties.invalidate_cache_zaaktype",
+)
+@receiver(
+    [post_save, post_delete],
+    sender=InformatieObjectType,
+    dispatch_uid="autorisaties.invalidate_cache_informatieobjecttype",
+)
+@receiver(
+    [post_save, post_delete],
+    sender=BesluitType,
+    dispatch_uid="autorisaties.invalidate_cache_besluittype",
+)
+def invalidate_cache(sender: ModelBase, signal: ModelSignal, **kwargs) -> None:
+    if kwargs.get("raw"):
+        return
+
+    logger.debug("invalidating_autorisaties_cache", signal=signal, sender=sender)
+    invalidate_autorisaties_cache()
@@ -19,20 +19,21 @@ from notifications_api_common.viewsets import (
 from rest_framework import mixins, status, viewsets
 from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
-from vng_api_common.audittrails.viewsets import (
-    AuditTrailCreateMixin,
-    AuditTrailDestroyMixin,
-    AuditTrailMixin,
-    AuditTrailViewsetMixin,
-)
 from vng_api_common.caching import conditional_retrieve
 from vng_api_common.constants import CommonResourceAction
 from vng_api_common.viewsets import CheckQueryParamsMixin
 
+from openzaak.components.documenten.models import prefetch_latest_version
 from openzaak.components.zaken.api.mixins import ClosedZaakMixin
 from openzaak.components.zaken.api.utils import delete_remote_zaakbesluit
 from openzaak.notifications.viewsets import MultipleNotificationMixin
 from openzaak.utils.api import delete_remote_oio
+from openzaak.utils.audittrails import (
+    AuditTrailCreateMixin,
+    AuditTrailDestroyMixin,
+    AuditTrailMixin,
+    AuditTrailViewsetMixin,
+)
 from openzaak.utils.data_filtering import ListFilterByAuthorizationsMixin
 from openzaak.utils.help_text import mark_experimental
 from openzaak.utils.mixins import CacheQuerysetMixin
@@ -256,7 +257,7 @@ class BesluitInformatieObjectViewSet(
 
     queryset = (
         BesluitInformatieObject.objects.select_related("besluit", "_informatieobject")
-        .prefetch_related("_informatieobject__enkelvoudiginformatieobject_set")
+        .prefetch_related(prefetch_latest_version("_informatieobject"))
         .all()
     )
     serializer_class = BesluitInformatieObjectSerializer
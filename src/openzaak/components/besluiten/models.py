@@ -13,11 +13,15 @@ from vng_api_common.fields import RSINField
 from vng_api_common.models import APIMixin
 from vng_api_common.utils import generate_unique_identification
 from vng_api_common.validators import UntilTodayValidator
-from zgw_consumers.models import ServiceUrlField
 
 from openzaak.components.documenten.loaders import EIOLoader
 from openzaak.loaders import AuthorizedRequestsLoader
-from openzaak.utils.fields import FkOrServiceUrlField, RelativeURLField, ServiceFkField
+from openzaak.utils.fields import (
+    FkOrServiceUrlField,
+    RelativeURLField,
+    ServiceFkField,
+    ServiceUrlField,
+)
 from openzaak.utils.mixins import AuditTrailMixin
 
 from .constants import VervalRedenen
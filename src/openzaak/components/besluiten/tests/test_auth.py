@@ -645,3 +645,8 @@ class ExternalBesluittypeScopeTests(JWTAuthMixin, APITestCase):
         self.assertEqual(
             response2.status_code, status.HTTP_403_FORBIDDEN, response2.data
         )
+
+
+@override_settings(AUTORISATIES_FILTERS_VALUES_JOIN=True)
+class BesluitReadCorrectScopeValuesJoinTests(BesluitReadCorrectScopeTests):
+    pass
@@ -1,7 +1,7 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2019 - 2020 Dimpact
 from django import forms
-from django.contrib import admin
+from django.contrib import admin, messages
 from django.db.models import CharField, F
 from django.db.models.functions import Concat
 from django.utils.translation import gettext_lazy as _
@@ -21,12 +21,14 @@ from .api import viewsets
 from .constants import ObjectInformatieObjectTypes
 from .models import (
     BestandsDeel,
+    DocumentAssembly,
     EnkelvoudigInformatieObject,
     EnkelvoudigInformatieObjectCanonical,
     Gebruiksrechten,
     ObjectInformatieObject,
     Verzending,
 )
+from .tasks import retry_assemblies
 from .views import PrivateMediaView
 from .widgets import PrivateFileWidget
 
@@ -435,3 +437,47 @@ class BestandsDeelAdmin(PrivateMediaMixin, admin.ModelAdmin):
     )
     list_filter = ("informatieobject",)
     private_media_fields = ("inhoud",)
+
+
+@admin.register(DocumentAssembly)
+class DocumentAssemblyAdmin(admin.ModelAdmin):
+    list_display = (
+        "informatieobject",
+        "status",
+        "get_progress_display",
+        "created_on",
+        "started_on",
+        "finished_on",
+    )
+    list_filter = ("status",)
+    list_select_related = ("informatieobject",)
+    ordering = ("-created_on",)
+    raw_id_fields = ("informatieobject",)
+    actions = ["retry"]
+    readonly_fields = (
+        "informatieobject",
+        "status",
+        "total",
+        "processed",
+        "comment",
+        "created_on",
+        "started_on",
+        "finished_on",
+        "updated_on",
+    )
+
+    @admin.display(description=_("voortgang"))
+    def get_progress_display(self, obj) -> str:
+        return f"{obj.processed} / {obj.total}"
+
+    @admin.action(description=_("Start the selected %(verbose_name_plural)s again"))
+    def retry(self, request, queryset):
+        assembly_pks = retry_assemblies(queryset)
+        self.message_user(
+            request,
+            _("%(count)d assemblies are started again.") % {"count": len(assembly_pks)},
+            messages.SUCCESS,
+        )
+
+    def has_add_permission(self, request):
+        return False
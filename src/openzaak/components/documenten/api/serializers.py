@@ -6,19 +6,21 @@ Serializers of the Document Registratie Component REST API
 
 import binascii
 import math
+import tempfile
 import uuid
 from base64 import b64decode
-from pathlib import Path
+from collections.abc import Mapping
 from typing import Optional
 
 from django.conf import settings
 from django.core.exceptions import ValidationError
-from django.core.files.base import ContentFile, File
+from django.core.files.base import ContentFile
+from django.core.files.uploadedfile import UploadedFile
 from django.db import transaction
 from django.utils.http import urlencode
 from django.utils.translation import gettext_lazy as _
 
-from drf_extra_fields.fields import Base64FileField
+from drf_extra_fields.fields import Base64FieldMixin, Base64FileField
 from humanize import naturalsize
 from privates.storages import PrivateMediaFileSystemStorage
 from rest_framework import serializers
@@ -52,6 +54,7 @@ from ...zaken.api.serializers import (
     ZaakInformatieObjectSubSerializer,
 )
 from ..constants import (
+    AssemblyStatus,
     ChecksumAlgoritmes,
     ObjectInformatieObjectTypes,
     OndertekeningSoorten,
@@ -59,6 +62,7 @@ from ..constants import (
 )
 from ..models import (
     BestandsDeel,
+    DocumentAssembly,
     EnkelvoudigInformatieObject,
     EnkelvoudigInformatieObjectCanonical,
     Gebruiksrechten,
@@ -67,7 +71,7 @@ from ..models import (
     Verzending,
 )
 from .fields import OnlyRemoteOrFKOrURLField
-from .utils import create_filename, merge_files
+from .utils import decode_base64, merge_bestandsdelen
 from .validators import (
     InformatieObjectUniqueValidator,
     StatusValidator,
@@ -93,7 +97,54 @@ class AnyBase64File(Base64FileField):
     def get_file_extension(self, filename, decoded_file):
         return "bin"
 
+    def _get_expected_size(self) -> Optional[int]:
+        initial_data = getattr(self.parent, "initial_data", None)
+        if not isinstance(initial_data, Mapping):
+            return None
+        size = initial_data.get("bestandsomvang")
+        if isinstance(size, int) and not isinstance(size, bool) and size >= 0:
+            return size
+        return None
+
     def to_internal_value(self, base64_data):
+        if not isinstance(base64_data, str) or base64_data in self.EMPTY_VALUES:
+            return self._decode_in_memory(base64_data)
+
+        file_mime_type = None
+        if ";base64," in base64_data:
+            header, base64_data = base64_data.split(";base64,")
+            if self.trust_provided_content_type:
+                file_mime_type = header.replace("data:", "")
+
+        # ⚡️ decode to a (spooled) temporary file, instead of decoding the complete
+        # content in memory. The file is closed together with the uploaded file
+        output = tempfile.SpooledTemporaryFile(  # noqa: SIM115
+            max_size=settings.FILE_UPLOAD_MAX_MEMORY_SIZE,
+            dir=settings.FILE_UPLOAD_TEMP_DIR,
+        )
+        try:
+            # a size mismatch with `bestandsomvang` is reported by the serializer
+            size, sha256 = decode_base64(
+                base64_data, output, max_size=self._get_expected_size()
+            )
+        except binascii.Error as e:
+            output.close()
+            if str(e) == "Incorrect padding":
+                raise ValidationError(
+                    _("The provided base64 data has incorrect padding"),
+                    code="incorrect-base64-padding",
+                )
+            raise ValidationError(str(e), code="invalid-base64")
+        output.seek(0)
+
+        file_name = f"{uuid.uuid4()}.{self.get_file_extension(None, None)}"
+        data = UploadedFile(
+            output, name=file_name, content_type=file_mime_type, size=size
+        )
+        data.sha256 = sha256
+        return super(Base64FieldMixin, self).to_internal_value(data)
+
+    def _decode_in_memory(self, base64_data):
         try:
             return super().to_internal_value(base64_data)
         except Exception:
@@ -496,11 +547,20 @@ class EnkelvoudigInformatieObjectSerializer(serializers.HyperlinkedModelSerializ
             if canonical
             else {"informatieobject_uuid": eio_uuid}
         )
-        parts = math.ceil(full_size / settings.DOCUMENTEN_UPLOAD_CHUNK_SIZE)
-        for i in range(parts):
-            chunk_size = min(settings.DOCUMENTEN_UPLOAD_CHUNK_SIZE, full_size)
-            BestandsDeel.objects.create(omvang=chunk_size, volgnummer=i + 1, **kwargs)
-            full_size -= chunk_size
+        chunk_size = settings.DOCUMENTEN_UPLOAD_CHUNK_SIZE
+        parts = math.ceil(full_size / chunk_size)
+        # ⚡️ insert the parts in batches, instead of with one query per part
+        BestandsDeel.objects.bulk_create(
+            (
+                BestandsDeel(
+                    omvang=min(chunk_size, full_size - i * chunk_size),
+                    volgnummer=i + 1,
+                    **kwargs,
+                )
+                for i in range(parts)
+            ),
+            batch_size=1000,
+        )
 
     @transaction.atomic
     def create(self, validated_data):
@@ -739,6 +799,11 @@ class LockEnkelvoudigInformatieObjectSerializer(serializers.ModelSerializer):
             raise serializers.ValidationError(
                 _("The document is already locked"), code="existing-lock"
             )
+        if self.instance.is_being_assembled:
+            raise serializers.ValidationError(
+                _("The part files of the document are still being merged"),
+                code="being-assembled",
+            )
         return valid_attrs
 
     @transaction.atomic
@@ -756,6 +821,9 @@ class UnlockEnkelvoudigInformatieObjectSerializer(serializers.ModelSerializer):
     model
     """
 
+    # set if the part files must still be merged in the background
+    assembly: Optional[DocumentAssembly] = None
+
     class Meta:
         model = EnkelvoudigInformatieObjectCanonical
         fields = ("lock",)
@@ -811,23 +879,24 @@ class UnlockEnkelvoudigInformatieObjectSerializer(serializers.ModelSerializer):
         if empty_bestandsdelen:
             return self.instance
 
+        if complete_upload and settings.DOCUMENTEN_UPLOAD_ASYNC_ASSEMBLY:
+            # ⚡️ the files are merged in the background by the caller, instead of
+            # blocking the request until all parts are merged
+            self.assembly, _created = DocumentAssembly.objects.update_or_create(
+                informatieobject=self.instance.canonical,
+                defaults={
+                    "status": AssemblyStatus.pending,
+                    "total": bestandsdelen.count(),
+                    "processed": 0,
+                    "comment": "",
+                    "started_on": None,
+                    "finished_on": None,
+                },
+            )
+            return self.instance
+
         if complete_upload:
-            part_files = [p.inhoud.file for p in bestandsdelen]
-            # create the name of target file using the storage backend to the serializer
-            name = create_filename(self.instance.bestandsnaam)
-            file_field = self.instance._meta.get_field("inhoud")
-            rel_path = file_field.generate_filename(self.instance, name)
-            file_name = Path(rel_path).name
-            # merge files
-            file_dir = Path(settings.PRIVATE_MEDIA_ROOT)
-            target_file = merge_files(part_files, file_dir, file_name)
-            # save full file to the instance FileField
-            with open(target_file, "rb") as file_obj:
-                self.instance.inhoud = File(file_obj, name=file_name)
-                self.instance.save()
-
-            # Remove the merged file
-            target_file.unlink()
+            merge_bestandsdelen(self.instance, bestandsdelen)
         else:
             self.instance.bestandsomvang = None
             self.instance.save()
@@ -1,27 +1,288 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2022 Dimpact
+import binascii
+import errno
+import hashlib
+import os
 import re
 import shutil
+import tempfile
 import uuid
 from datetime import date
 from pathlib import Path, PurePath
+from typing import BinaryIO, Callable, Iterable, Optional, Tuple
 from urllib.parse import urlparse
 
 from django.conf import settings
+from django.core.files import File
+from django.core.files.storage import FileSystemStorage
 from django.db.models import Max
 
+from openzaak.utils.db import pg_advisory_lock
 
-def merge_files(part_files, file_dir, file_name) -> str:
-    file_dir_path = Path(file_dir)
-    file_dir_path.mkdir(exist_ok=True)
-    file_path = file_dir_path / file_name
-    with open(file_path, "wb") as output:
-        for file in part_files:
-            with file.open("rb") as fileobj:
-                shutil.copyfileobj(
-                    fileobj, output, settings.DOCUMENTEN_UPLOAD_READ_CHUNK
-                )
-    return file_path
+# errors that indicate that kernel space copying is not supported for the files
+_FALLBACK_ERRNOS = {
+    errno.EXDEV,
+    errno.ENOSYS,
+    errno.EINVAL,
+    errno.EOPNOTSUPP,
+    errno.EBADF,
+    errno.ETXTBSY,
+}
+
+# errors that indicate that hard links are not supported for the files
+_NO_LINK_ERRNOS = {
+    errno.EPERM,
+    errno.EXDEV,
+    errno.EOPNOTSUPP,
+    errno.EMLINK,
+}
+
+
+# characters that are discarded when decoding base64 data
+_NON_BASE64_CHARS = re.compile(rb"[^A-Za-z0-9+/=]")
+
+
+def decode_base64(
+    data: str, output: BinaryIO, max_size: Optional[int] = None
+) -> Tuple[int, Optional[str]]:
+    """
+    Decode the base64 encoded ``data`` into ``output`` and return the size and the
+    SHA-256 hex digest of the decoded content.
+
+    ⚡️ The data is decoded chunk by chunk, so the decoded content is never completely
+    in memory. Characters outside of the base64 alphabet are discarded, like
+    ``base64.b64decode`` does. Decoding stops as soon as more than ``max_size`` bytes
+    are decoded, in which case no digest is returned.
+
+    :raises binascii.Error: if the data is not valid base64.
+    """
+    chunk_size = settings.DOCUMENTEN_UPLOAD_READ_CHUNK
+    digest = hashlib.sha256()
+    size = 0
+    remainder = b""
+    for start in range(0, len(data), chunk_size):
+        try:
+            encoded = data[start : start + chunk_size].encode("ascii")
+        except UnicodeEncodeError as exc:
+            raise binascii.Error("Only ASCII characters are allowed") from exc
+        chunk = remainder + _NON_BASE64_CHARS.sub(b"", encoded)
+        # only decode complete groups of 4 characters
+        end = len(chunk) - len(chunk) % 4
+        remainder = chunk[end:]
+
+        decoded = binascii.a2b_base64(chunk[:end])
+        size += len(decoded)
+        if max_size is not None and size > max_size:
+            return size, None
+        digest.update(decoded)
+        output.write(decoded)
+
+    if remainder:
+        # incomplete group, which raises the same error as ``b64decode``
+        binascii.a2b_base64(remainder)
+
+    return size, digest.hexdigest()
+
+
+def _copy_file_range(src_fd: int, dst_fd: int, size: int) -> int:
+    copied = 0
+    while copied < size:
+        count = os.copy_file_range(src_fd, dst_fd, size - copied)
+        if count == 0:
+            break
+        copied += count
+    return copied
+
+
+def _sendfile(src_fd: int, dst_fd: int, size: int) -> int:
+    copied = 0
+    while copied < size:
+        count = os.sendfile(dst_fd, src_fd, None, size - copied)
+        if count == 0:
+            break
+        copied += count
+    return copied
+
+
+def copy_file_contents(src: BinaryIO, dst: BinaryIO) -> None:
+    """
+    ⚡️ Append the contents of ``src`` to ``dst``, copying in kernel space with
+    ``copy_file_range`` or ``sendfile`` where the platform and file systems support
+    it, and falling back to copying through userspace buffers.
+    """
+    size = os.fstat(src.fileno()).st_size
+    for copy_func in (
+        getattr(os, "copy_file_range", None) and _copy_file_range,
+        getattr(os, "sendfile", None) and _sendfile,
+    ):
+        if copy_func is None:
+            continue
+        try:
+            copied = copy_func(src.fileno(), dst.fileno(), size)
+        except OSError as exc:
+            # only fall back if nothing was copied yet (unsupported file system or
+            # platform), anything else is a real error
+            if exc.errno not in _FALLBACK_ERRNOS or src.tell() != 0:
+                raise
+            continue
+        if copied == size:
+            return
+        raise OSError(f"Expected to copy {size} bytes, copied {copied}")
+
+    shutil.copyfileobj(src, dst, settings.DOCUMENTEN_UPLOAD_READ_CHUNK)
+
+
+def _copy_exclusive(src_path: str, dst_path: str, mode: int) -> None:
+    """
+    Copy ``src_path`` to ``dst_path``, which must not exist yet.
+    """
+    fd = os.open(dst_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, mode)
+    try:
+        with (
+            os.fdopen(fd, "wb", buffering=0) as output,
+            open(src_path, "rb", buffering=0) as src,
+        ):
+            os.fchmod(output.fileno(), mode)
+            copy_file_contents(src, output)
+            os.fsync(output.fileno())
+    except BaseException:
+        os.unlink(dst_path)
+        raise
+
+
+def merge_files(
+    part_paths: Iterable[str],
+    storage: FileSystemStorage,
+    name: str,
+    progress: Optional[Callable[[int], None]] = None,
+) -> str:
+    """
+    Concatenate the part files into a new file in ``storage`` and return its name.
+
+    ⚡️ The parts are written straight to a temporary file next to the final location,
+    which is moved into place once complete, rather than being written to disk
+    twice. An available name is determined like ``Storage.save`` does.
+
+    If given, ``progress`` is called with the number of merged parts after each part.
+    """
+    name = storage.get_available_name(name)
+    target_dir = Path(storage.path(name)).parent
+    target_dir.mkdir(parents=True, exist_ok=True)
+
+    fd, temp_path = tempfile.mkstemp(dir=target_dir, prefix=".", suffix=".merge")
+    try:
+        with os.fdopen(fd, "wb", buffering=0) as output:
+            for index, part_path in enumerate(part_paths, start=1):
+                with open(part_path, "rb", buffering=0) as part:
+                    copy_file_contents(part, output)
+                if progress is not None:
+                    progress(index)
+            os.fsync(output.fileno())
+
+        mode = storage.file_permissions_mode or 0o644
+        os.chmod(temp_path, mode)
+
+        # link the file to claim the name atomically, another file could have been
+        # saved under the same name in the meantime
+        while True:
+            try:
+                try:
+                    os.link(temp_path, storage.path(name))
+                except OSError as exc:
+                    if exc.errno not in _NO_LINK_ERRNOS:
+                        raise
+                    # hard links are not supported by the file system, claim the
+                    # name by creating the file exclusively and copy the contents
+                    _copy_exclusive(temp_path, storage.path(name), mode)
+            except FileExistsError:
+                name = storage.get_available_name(name)
+                continue
+            break
+    finally:
+        if os.path.exists(temp_path):
+            os.unlink(temp_path)
+
+    return name
+
+
+# directory of the content addressed files
+CONTENT_ADDRESSED_DIR = "content"
+
+
+def get_content_name(digest: str) -> str:
+    return f"{CONTENT_ADDRESSED_DIR}/{digest[:2]}/{digest}.bin"
+
+
+def is_content_addressed(name: Optional[str]) -> bool:
+    return bool(name) and name.startswith(f"{CONTENT_ADDRESSED_DIR}/")
+
+
+def get_content_digest(name: str) -> str:
+    """
+    Return the SHA-256 hex digest of the contents of a content addressed file.
+    """
+    return PurePath(name).stem
+
+
+def content_lock(name: str):
+    """
+    Lock the content addressed file ``name`` until the transaction ends.
+
+    Storing, referencing and deleting the file are serialized with this lock, so the
+    file isn't deleted while it's stored or referenced again.
+    """
+    return pg_advisory_lock(f"documenten-content-{name}")
+
+
+def store_content(storage: FileSystemStorage, content: File) -> str:
+    """
+    Store ``content`` in ``storage`` under the SHA-256 digest of its contents and
+    return the name. Must be called in a transaction, which holds the
+    :func:`content_lock` of the name until it's referenced.
+
+    ⚡️ Content that is already stored is not written again. If the digest is not
+    known upfront (``content.sha256``, see ``AnyBase64File``), it's calculated while
+    the content is written.
+    """
+    digest = getattr(content, "sha256", None)
+    if digest:
+        with content_lock(get_content_name(digest)):
+            if storage.exists(get_content_name(digest)):
+                return get_content_name(digest)
+
+    target_dir = Path(storage.path(CONTENT_ADDRESSED_DIR))
+    target_dir.mkdir(parents=True, exist_ok=True)
+
+    fd, temp_path = tempfile.mkstemp(dir=target_dir, prefix=".", suffix=".upload")
+    try:
+        hasher = hashlib.sha256()
+        with os.fdopen(fd, "wb") as output:
+            for chunk in content.chunks():
+                hasher.update(chunk)
+                output.write(chunk)
+            output.flush()
+            os.fsync(output.fileno())
+        os.chmod(temp_path, storage.file_permissions_mode or 0o644)
+
+        name = get_content_name(hasher.hexdigest())
+        path = Path(storage.path(name))
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with content_lock(name):
+            try:
+                os.link(temp_path, path)
+            except FileExistsError:
+                # the same content was stored in the meantime
+                pass
+            except OSError:
+                # hard links are not supported by the file system
+                if not path.exists():
+                    os.replace(temp_path, path)
+    finally:
+        if os.path.exists(temp_path):
+            os.unlink(temp_path)
+
+    return name
 
 
 def create_filename(name):
@@ -31,6 +292,30 @@ def create_filename(name):
     return f"{main_part}{ext}"
 
 
+def merge_bestandsdelen(
+    eio,
+    bestandsdelen,
+    progress: Optional[Callable[[int], None]] = None,
+    save: bool = True,
+) -> None:
+    """
+    Merge the (ordered) BESTANDSDELen into the ``inhoud`` of ``eio`` and save it,
+    unless ``save`` is ``False``.
+    """
+    part_paths = [part.inhoud.path for part in bestandsdelen]
+    # create the name of target file using the storage backend to the serializer
+    name = create_filename(eio.bestandsnaam)
+    file_field = eio._meta.get_field("inhoud")
+    rel_path = file_field.generate_filename(eio, name)
+    # ⚡️ merge the files straight into the storage of the FileField, instead
+    # of merging them into a temporary file that is copied into the storage
+    eio.inhoud.name = merge_files(
+        part_paths, file_field.storage, rel_path, progress=progress
+    )
+    if save:
+        eio.save()
+
+
 def check_path(url, resource):
     # get_viewset_for_path can't be used since the external url can contain different subpathes
     path = urlparse(url).path
@@ -50,12 +335,30 @@ def check_path(url, resource):
     return True
 
 
+LOCK_ID_DOCUMENT_IDENTIFICATIE = "generate-document-identificatie"
+
+
+def _extract_number(identificatie: Optional[str]) -> int:
+    if identificatie is None:
+        return 0
+    return int(identificatie.split("-")[-1])
+
+
 def generate_document_identificatie(
-    bronorganisatie: str, date_value: date, aantal: int = 1
+    bronorganisatie: Optional[str], date_value: date, aantal: int = 1
 ):
+    """
+    Generate the next identificatie(s), after the issued and reserved identificaties.
+
+    The identificaties reserved for all bronorganisaties are skipped, as are the
+    identificaties reserved for ``bronorganisatie``, or any bronorganisatie if it's
+    ``None``. The generation is serialized with an advisory lock, which is held
+    until the transaction of the caller ends.
+    """
     from openzaak.components.documenten.models import (
         EnkelvoudigInformatieObject,
         ReservedDocument,
+        ReservedDocumentRange,
     )
 
     model_name = "DOCUMENT"
@@ -64,23 +367,31 @@ def generate_document_identificatie(
     prefix = f"{model_name}-{year}"
     pattern = prefix + r"-\d{10}"
 
-    issued_max = EnkelvoudigInformatieObject._default_manager.filter(
-        identificatie__startswith=prefix,
-        identificatie__regex=pattern,
-    ).aggregate(Max("identificatie"))["identificatie__max"]
+    with pg_advisory_lock(LOCK_ID_DOCUMENT_IDENTIFICATIE):
+        issued_max = EnkelvoudigInformatieObject._default_manager.filter(
+            identificatie__startswith=prefix,
+            identificatie__regex=pattern,
+        ).aggregate(Max("identificatie"))["identificatie__max"]
 
-    reserved_max = ReservedDocument.objects.filter(
-        bronorganisatie=bronorganisatie,
-        identificatie__startswith=prefix,
-        identificatie__regex=pattern,
-    ).aggregate(Max("identificatie"))["identificatie__max"]
+        reserved = ReservedDocument.objects.filter(
+            identificatie__startswith=prefix,
+            identificatie__regex=pattern,
+        )
+        if bronorganisatie is not None:
+            reserved = reserved.filter(bronorganisatie=bronorganisatie)
+        reserved_max = reserved.aggregate(Max("identificatie"))["identificatie__max"]
 
-    def extract_number(identificatie):
-        if identificatie is None:
-            return 0
-        return int(identificatie.split("-")[-1])
+        reserved_range_max = (
+            ReservedDocumentRange.objects.filter(prefix=prefix)
+            .values_list("identificatie", flat=True)
+            .first()
+        )
 
-    max_number = max(extract_number(issued_max), extract_number(reserved_max))
+    max_number = max(
+        _extract_number(issued_max),
+        _extract_number(reserved_max),
+        _extract_number(reserved_range_max),
+    )
     start_number = max_number + 1
 
     identificaties = [
@@ -89,3 +400,26 @@ def generate_document_identificatie(
     ]
 
     return identificaties[0] if aantal == 1 else identificaties
+
+
+def reserve_document_identificaties(date_value: date, aantal: int) -> str:
+    """
+    Reserve a range of ``aantal`` consecutive identificaties for all
+    bronorganisaties, and return the first one.
+
+    The end of the range is stored, so :func:`generate_document_identificatie`
+    doesn't generate the identificaties of the range again.
+    """
+    from openzaak.components.documenten.models import ReservedDocumentRange
+
+    with pg_advisory_lock(LOCK_ID_DOCUMENT_IDENTIFICATIE):
+        first_identificatie = generate_document_identificatie(None, date_value)
+        prefix, number = first_identificatie.rsplit("-", 1)
+        ReservedDocumentRange.objects.update_or_create(
+            prefix=prefix,
+            defaults={
+                "identificatie": f"{prefix}-{str(int(number) + aantal - 1).zfill(10)}"
+            },
+        )
+
+    return first_identificatie
@@ -1,6 +1,7 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2019 - 2022 Dimpact
 from datetime import date
+from functools import partial
 from pathlib import Path
 
 from django.conf import settings
@@ -9,7 +10,6 @@ from django.utils.translation import gettext_lazy as _
 
 import structlog
 from django_loose_fk.virtual_models import ProxyMixin
-from django_sendfile import sendfile
 from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import (
     OpenApiExample,
@@ -25,10 +25,6 @@ from rest_framework.parsers import FormParser, MultiPartParser
 from rest_framework.response import Response
 from rest_framework.serializers import ErrorDetail, ValidationError
 from rest_framework.settings import api_settings
-from vng_api_common.audittrails.viewsets import (
-    AuditTrailMixin,
-    AuditTrailViewsetMixin,
-)
 from vng_api_common.caching import conditional_retrieve
 from vng_api_common.constants import CommonResourceAction
 from vng_api_common.filters_backend import Backend
@@ -36,7 +32,7 @@ from vng_api_common.search import SearchMixin
 from vng_api_common.viewsets import CheckQueryParamsMixin
 
 from openzaak.components.documenten.import_utils import DocumentRow
-from openzaak.components.documenten.tasks import import_documents
+from openzaak.components.documenten.tasks import assemble_document, import_documents
 from openzaak.import_data.models import ImportStatusChoices, ImportTypeChoices
 from openzaak.import_data.views import (
     ImportCreateview,
@@ -48,13 +44,22 @@ from openzaak.import_data.views import (
 from openzaak.notifications.viewsets import (
     MultipleNotificationMixin,
 )
+from openzaak.utils.audittrails import (
+    AuditTrailMixin,
+    AuditTrailViewsetMixin,
+)
 from openzaak.utils.data_filtering import ListFilterByAuthorizationsMixin
+from openzaak.utils.downloads import send_file
+from openzaak.utils.exceptions import (
+    DocumentAssemblyFailedException,
+    DocumentBeingAssembledException,
+)
 from openzaak.utils.help_text import mark_experimental
 from openzaak.utils.mixins import (
     CacheQuerysetMixin,
     ExpandMixin,
 )
-from openzaak.utils.pagination import OptimizedPagination
+from openzaak.utils.pagination import OptimizedCursorPagination, OptimizedPagination
 from openzaak.utils.permissions import AuthRequired
 from openzaak.utils.schema import (
     COMMON_ERROR_RESPONSES,
@@ -72,6 +77,7 @@ from ...zaken.api.scopes import (
     SCOPE_ZAKEN_GEFORCEERD_BIJWERKEN,
 )
 from ...zaken.models import ZaakInformatieObject
+from ..caching import get_inhoud_etag
 from ..models import (
     BestandsDeel,
     EnkelvoudigInformatieObject,
@@ -79,6 +85,7 @@ from ..models import (
     ObjectInformatieObject,
     ReservedDocument,
     Verzending,
+    prefetch_latest_version,
 )
 from .audits import AUDIT_DRC
 from .filters import (
@@ -252,7 +259,6 @@ class EnkelvoudigInformatieObjectViewSet(
         )
         .prefetch_related("canonical__bestandsdelen")
         .order_by("canonical", "-versie")
-        .distinct("canonical")
     )
     lookup_field = "uuid"
     serializer_class = EnkelvoudigInformatieObjectSerializer
@@ -274,6 +280,25 @@ class EnkelvoudigInformatieObjectViewSet(
     notifications_kanaal = KANAAL_DOCUMENTEN
     audit = AUDIT_DRC
 
+    def get_queryset(self):
+        qs = super().get_queryset()
+
+        # an older version can only be requested for a single document
+        request = getattr(self, "request", None)
+        if (
+            request is not None
+            and self.detail
+            and (
+                "versie" in request.query_params
+                or "registratieOp" in request.query_params
+            )
+        ):
+            return qs.distinct("canonical")
+
+        # ⚡️ select the latest versions through the (partial) index, rather than
+        # sorting all versions of the documents with `DISTINCT ON`
+        return qs.filter(is_latest=True)
+
     def get_renderers(self):
         if self.action == "download":
             return [BinaryFileRenderer]
@@ -325,7 +350,7 @@ class EnkelvoudigInformatieObjectViewSet(
 
     @property
     def pagination_class(self):
-        return OptimizedPagination
+        return OptimizedCursorPagination
 
     @extend_schema(
         "enkelvoudiginformatieobject_download",
@@ -343,9 +368,15 @@ class EnkelvoudigInformatieObjectViewSet(
     @action(methods=["get"], detail=True, name="enkelvoudiginformatieobject_download")
     def download(self, request, *args, **kwargs):
         eio = self.get_object()
-        return sendfile(
+        if not eio.inhoud:
+            if eio.canonical.is_being_assembled:
+                raise DocumentBeingAssembledException()
+            if eio.canonical.assembly_failed:
+                raise DocumentAssemblyFailedException()
+        return send_file(
             request,
             eio.inhoud.path,
+            etag=get_inhoud_etag(eio),
             attachment=True,
             mimetype="application/octet-stream",
         )
@@ -419,6 +450,10 @@ class EnkelvoudigInformatieObjectViewSet(
         )
         unlock_serializer.is_valid(raise_exception=True)
         unlock_serializer.save()
+        if unlock_serializer.assembly is not None:
+            transaction.on_commit(
+                partial(assemble_document.delay, unlock_serializer.assembly.pk)
+            )
         return Response(status=status.HTTP_204_NO_CONTENT)
 
     @extend_schema(
@@ -684,7 +719,7 @@ class GebruiksrechtenViewSet(
 
     queryset = (
         Gebruiksrechten.objects.select_related("informatieobject")
-        .prefetch_related("informatieobject__enkelvoudiginformatieobject_set")
+        .prefetch_related(prefetch_latest_version("informatieobject"))
         .all()
     )
     serializer_class = GebruiksrechtenSerializer
@@ -826,7 +861,7 @@ class ObjectInformatieObjectViewSet(
         ObjectInformatieObject.objects.select_related(
             "_zaak", "_besluit", "informatieobject"
         )
-        .prefetch_related("informatieobject__enkelvoudiginformatieobject_set")
+        .prefetch_related(prefetch_latest_version("informatieobject"))
         .all()
     )
     serializer_class = ObjectInformatieObjectSerializer
@@ -1,5 +1,6 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2022 Dimpact
+import hashlib
 from typing import Optional
 
 from django.core.cache import cache
@@ -15,6 +16,19 @@ def get_etag_cache_key(obj: models.Model) -> str:
     return f"{resource}-{uuid}-{versie}"
 
 
+def get_inhoud_etag(eio) -> str:
+    """
+    Calculate the (strong) ETag of the content of a document version.
+
+    The content of a version doesn't change once it's stored, so the ETag is derived
+    from the version, the stored file and its integriteit instead of the content.
+    """
+    value = ":".join(
+        [str(eio.uuid), str(eio.versie), eio.inhoud.name, eio.integriteit_waarde]
+    )
+    return f'"{hashlib.sha256(value.encode()).hexdigest()}"'
+
+
 def set_etag(key: str, etag_value: str) -> None:
     cache.set(key, etag_value)
 
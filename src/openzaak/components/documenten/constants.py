@@ -72,3 +72,14 @@ class AfzenderTypes(models.TextChoices):
 class PostAdresTypes(models.TextChoices):
     antwoordnummer = "antwoordnummer", _("Antwoordnummer")
     postbusnummer = "postbusnummer", _("Postbusnummer")
+
+
+class AssemblyStatus(models.TextChoices):
+    pending = "pending", _("Openstaand")
+    active = "active", _("Actief")
+    finished = "finished", _("Voltooid")
+    error = "error", _("Onderbroken")
+
+    @classmethod
+    def in_progress_choices(cls) -> tuple:
+        return cls.pending, cls.active
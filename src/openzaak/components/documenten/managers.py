@@ -30,5 +30,8 @@ class ObjectInformatieObjectAdapterManager(models.Manager):
     def create_from(self, relation):
         return self.get_queryset().create_from(relation)
 
+    def bulk_create_from(self, relations):
+        return self.get_queryset().bulk_create_from(relations)
+
     def delete_for(self, relation):
         return self.get_queryset().delete_for(relation)
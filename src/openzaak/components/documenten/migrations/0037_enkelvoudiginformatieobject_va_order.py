@@ -0,0 +1,41 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+# Generated by Django 5.2.7 on 2026-10-18 12:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("documenten", "0036_reserveddocument"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="enkelvoudiginformatieobject",
+            name="va_order",
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=models.Case(
+                    models.When(vertrouwelijkheidaanduiding="openbaar", then=models.Value(0)),
+                    models.When(vertrouwelijkheidaanduiding="beperkt_openbaar", then=models.Value(1)),
+                    models.When(vertrouwelijkheidaanduiding="intern", then=models.Value(2)),
+                    models.When(vertrouwelijkheidaanduiding="zaakvertrouwelijk", then=models.Value(3)),
+                    models.When(vertrouwelijkheidaanduiding="vertrouwelijk", then=models.Value(4)),
+                    models.When(vertrouwelijkheidaanduiding="confidentieel", then=models.Value(5)),
+                    models.When(vertrouwelijkheidaanduiding="geheim", then=models.Value(6)),
+                    models.When(vertrouwelijkheidaanduiding="zeer_geheim", then=models.Value(7)),
+                    output_field=models.IntegerField(),
+                ),
+                output_field=models.IntegerField(null=True),
+                verbose_name="volgorde vertrouwelijkheidaanduiding",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="enkelvoudiginformatieobject",
+            index=models.Index(
+                fields=["_informatieobjecttype", "va_order"], name="documenten_eio_iotype_va_idx"
+            ),
+        ),
+    ]
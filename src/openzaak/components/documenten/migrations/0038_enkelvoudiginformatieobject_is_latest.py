@@ -0,0 +1,47 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+# Generated by Django 5.2.7 on 2026-10-18 14:20
+
+from django.db import migrations, models
+
+
+def flag_latest_versions(apps, schema_editor):
+    EnkelvoudigInformatieObject = apps.get_model(
+        "documenten", "EnkelvoudigInformatieObject"
+    )
+
+    newer_versions = EnkelvoudigInformatieObject.objects.filter(
+        canonical=models.OuterRef("canonical"), versie__gt=models.OuterRef("versie")
+    )
+    EnkelvoudigInformatieObject.objects.filter(
+        models.Exists(newer_versions)
+    ).update(is_latest=False)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("documenten", "0037_enkelvoudiginformatieobject_va_order"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="enkelvoudiginformatieobject",
+            name="is_latest",
+            field=models.BooleanField(
+                default=True,
+                editable=False,
+                help_text="Geeft aan of dit de laatste versie van het INFORMATIEOBJECT is.",
+                verbose_name="laatste versie",
+            ),
+        ),
+        migrations.RunPython(flag_latest_versions, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="enkelvoudiginformatieobject",
+            index=models.Index(
+                condition=models.Q(("is_latest", True)),
+                fields=["canonical"],
+                name="documenten_eio_latest_idx",
+            ),
+        ),
+    ]
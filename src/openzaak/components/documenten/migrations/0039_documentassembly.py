@@ -0,0 +1,87 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+# Generated by Django 5.2.7 on 2026-10-18 15:02
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("documenten", "0038_enkelvoudiginformatieobject_is_latest"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DocumentAssembly",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("pending", "Openstaand"),
+                            ("active", "Actief"),
+                            ("finished", "Voltooid"),
+                            ("error", "Onderbroken"),
+                        ],
+                        default="pending",
+                        max_length=30,
+                        verbose_name="status",
+                    ),
+                ),
+                (
+                    "total",
+                    models.PositiveIntegerField(
+                        verbose_name="totaal aantal bestandsdelen"
+                    ),
+                ),
+                (
+                    "processed",
+                    models.PositiveIntegerField(
+                        default=0, verbose_name="samengevoegde bestandsdelen"
+                    ),
+                ),
+                ("comment", models.TextField(blank=True, verbose_name="opmerking")),
+                (
+                    "created_on",
+                    models.DateTimeField(
+                        auto_now_add=True, verbose_name="aangemaakt op"
+                    ),
+                ),
+                (
+                    "started_on",
+                    models.DateTimeField(
+                        blank=True, null=True, verbose_name="gestart op"
+                    ),
+                ),
+                (
+                    "finished_on",
+                    models.DateTimeField(
+                        blank=True, null=True, verbose_name="voltooid op"
+                    ),
+                ),
+                (
+                    "informatieobject",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="assembly",
+                        to="documenten.enkelvoudiginformatieobjectcanonical",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "samenvoeging van bestandsdelen",
+                "verbose_name_plural": "samenvoegingen van bestandsdelen",
+            },
+        ),
+    ]
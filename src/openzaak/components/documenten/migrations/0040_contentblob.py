@@ -0,0 +1,44 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+# Generated by Django 5.2.7 on 2026-10-18 16:11
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("documenten", "0039_documentassembly"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ContentBlob",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "name",
+                    models.CharField(
+                        max_length=255, unique=True, verbose_name="bestandsnaam"
+                    ),
+                ),
+                (
+                    "reference_count",
+                    models.PositiveIntegerField(
+                        default=0, verbose_name="aantal verwijzingen"
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "opgeslagen bestand",
+                "verbose_name_plural": "opgeslagen bestanden",
+            },
+        ),
+    ]
@@ -0,0 +1,29 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+# Generated by Django 5.2.7 on 2026-10-18 18:02
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("documenten", "0040_contentblob"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="documentassembly",
+            name="updated_on",
+            field=models.DateTimeField(
+                auto_now=True,
+                default=django.utils.timezone.now,
+                help_text=(
+                    "Assemblies which are in progress but not updated for "
+                    "DOCUMENTEN_UPLOAD_ASSEMBLY_TIMEOUT seconds are started again."
+                ),
+                verbose_name="bijgewerkt op",
+            ),
+            preserve_default=False,
+        ),
+    ]
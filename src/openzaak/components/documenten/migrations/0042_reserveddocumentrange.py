@@ -0,0 +1,44 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+# Generated by Django 5.2.7 on 2026-10-18 18:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("documenten", "0041_documentassembly_updated_on"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ReservedDocumentRange",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "prefix",
+                    models.CharField(max_length=40, unique=True, verbose_name="prefix"),
+                ),
+                (
+                    "identificatie",
+                    models.CharField(
+                        help_text="De laatste gereserveerde identificatie met deze prefix.",
+                        max_length=40,
+                        verbose_name="laatste identificatie",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "gereserveerde reeks documenten",
+                "verbose_name_plural": "gereserveerde reeksen documenten",
+            },
+        ),
+    ]
@@ -1,19 +1,23 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2019 - 2020 Dimpact
 import uuid as _uuid
+from datetime import date
+from functools import partial
+from typing import Optional
 from urllib.parse import urlparse
 
+from django.conf import settings
 from django.contrib.postgres.fields import ArrayField
 from django.core.validators import MaxValueValidator, MinValueValidator
 from django.db import models, transaction
-from django.db.models import Q
+from django.db.models import F, Q
 from django.utils.translation import gettext_lazy as _
 
 from privates.fields import PrivateMediaFileField
 from rest_framework.reverse import reverse
+from vng_api_common.constants import VertrouwelijkheidsAanduiding
 from vng_api_common.descriptors import GegevensGroepType
 from vng_api_common.fields import RSINField, VertrouwelijkheidsAanduidingField
-from zgw_consumers.models import ServiceUrlField
 
 from openzaak.utils import build_absolute_url
 from openzaak.utils.fields import (
@@ -22,15 +26,23 @@ from openzaak.utils.fields import (
     NLPostcodeField,
     RelativeURLField,
     ServiceFkField,
+    ServiceUrlField,
 )
 from openzaak.utils.mixins import APIMixin, AuditTrailMixin
 
 from ..besluiten.models import BesluitInformatieObject
 from ..zaken.models import ZaakInformatieObject
-from .api.utils import generate_document_identificatie
+from .api.utils import (
+    content_lock,
+    generate_document_identificatie,
+    get_content_digest,
+    is_content_addressed,
+    store_content,
+)
 from .caching import DocumentETagMixin
 from .constants import (
     AfzenderTypes,
+    AssemblyStatus,
     ChecksumAlgoritmes,
     ObjectInformatieObjectTypes,
     OndertekeningSoorten,
@@ -276,8 +288,25 @@ class EnkelvoudigInformatieObjectCanonical(models.Model):
     def latest_version(self):
         # there is implicit sorting by versie desc in EnkelvoudigInformatieObject.Meta.ordering
         versies = self.enkelvoudiginformatieobject_set.all()
+        if "enkelvoudiginformatieobject_set" not in getattr(
+            self, "_prefetched_objects_cache", {}
+        ):
+            # ⚡️ use the (partial) index on the latest versions
+            versies = versies.filter(is_latest=True)
         return versies.first()
 
+    @property
+    def is_being_assembled(self) -> bool:
+        return DocumentAssembly.objects.filter(
+            informatieobject=self, status__in=AssemblyStatus.in_progress_choices()
+        ).exists()
+
+    @property
+    def assembly_failed(self) -> bool:
+        return DocumentAssembly.objects.filter(
+            informatieobject=self, status=AssemblyStatus.error
+        ).exists()
+
     def lock_document(self, doc_uuid: str) -> None:
         lock = _uuid.uuid4().hex
         self.lock = lock
@@ -396,6 +425,16 @@ class EnkelvoudigInformatieObject(
         blank=True,
         help_text=_("De essentiële opmaakaspecten van een INFORMATIEOBJECT."),
     )
+    # ⚡️ stored order of the vertrouwelijkheidaanduiding, so the authorization filters
+    # can use an index
+    va_order = models.GeneratedField(
+        expression=VertrouwelijkheidsAanduiding.get_order_expression(
+            "vertrouwelijkheidaanduiding"
+        ),
+        output_field=models.IntegerField(null=True),
+        db_persist=True,
+        verbose_name=_("volgorde vertrouwelijkheidaanduiding"),
+    )
 
     trefwoorden = ArrayField(
         models.CharField(_("trefwoord"), max_length=100),
@@ -404,6 +443,14 @@ class EnkelvoudigInformatieObject(
         help_text=_("Een lijst van trefwoorden gescheiden door comma's."),
         db_index=True,
     )
+    # ⚡️ flags the version with the highest `versie` of the canonical, so the latest
+    # versions can be selected without sorting all versions (see `save`)
+    is_latest = models.BooleanField(
+        _("laatste versie"),
+        default=True,
+        editable=False,
+        help_text=_("Geeft aan of dit de laatste versie van het INFORMATIEOBJECT is."),
+    )
 
     # When dealing with remote EIO, there is no pk or canonical instance to derive
     # the lock status from. The getters and setters then use this private attribute.
@@ -417,13 +464,83 @@ class EnkelvoudigInformatieObject(
         unique_together = [("uuid", "versie")]
         verbose_name = _("Document")
         verbose_name_plural = _("Documenten")
-        indexes = [models.Index(fields=["canonical", "-versie"])]
+        indexes = [
+            models.Index(fields=["canonical", "-versie"]),
+            models.Index(
+                fields=["_informatieobjecttype", "va_order"],
+                name="documenten_eio_iotype_va_idx",
+            ),
+            models.Index(
+                fields=["canonical"],
+                condition=models.Q(is_latest=True),
+                name="documenten_eio_latest_idx",
+            ),
+        ]
         ordering = ["canonical", "-versie"]
 
+    # the name of the stored file, to keep track of references to content addressed
+    # files. ``None`` if it's unknown because the field was deferred
+    _stored_inhoud_name: Optional[str] = ""
+
     def __init__(self, *args, **kwargs):
         kwargs.pop("_request", None)  # see hacky workaround in EIOSerializer.create
         super().__init__(*args, **kwargs)
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # the raw value, to avoid loading deferred fields
+        stored_inhoud = instance.__dict__.get("inhoud")
+        instance._stored_inhoud_name = getattr(stored_inhoud, "name", stored_inhoud)
+        return instance
+
+    @transaction.atomic
+    def save(self, *args, **kwargs):
+        if settings.DOCUMENTEN_CONTENT_ADDRESSED_STORAGE:
+            self._store_content_addressed()
+
+        is_new_version = self.pk is None and self.canonical_id is not None
+        if is_new_version:
+            versies = EnkelvoudigInformatieObject.objects.filter(
+                canonical=self.canonical_id
+            )
+            self.is_latest = not versies.filter(versie__gt=self.versie).exists()
+
+        super().save(*args, **kwargs)
+
+        if is_new_version and self.is_latest:
+            versies.filter(is_latest=True).exclude(pk=self.pk).update(is_latest=False)
+
+        self._update_content_references()
+
+    def _store_content_addressed(self) -> None:
+        if self.inhoud and not self.inhoud._committed:
+            # ⚡️ store the content once for all versions (and documents) with the
+            # same content
+            self.inhoud.name = store_content(self.inhoud.storage, self.inhoud.file)
+            self.inhoud._committed = True
+
+        if is_content_addressed(self.inhoud.name) and (
+            not self.integriteit_waarde
+            or self.integriteit_algoritme == ChecksumAlgoritmes.sha_256
+        ):
+            self.integriteit_algoritme = ChecksumAlgoritmes.sha_256
+            self.integriteit_waarde = get_content_digest(self.inhoud.name)
+            self.integriteit_datum = self.integriteit_datum or date.today()
+
+    def _update_content_references(self) -> None:
+        if "inhoud" not in self.__dict__ or self._stored_inhoud_name is None:
+            return
+
+        name = self.inhoud.name or ""
+        if name == self._stored_inhoud_name:
+            return
+        if is_content_addressed(name):
+            ContentBlob.acquire(name)
+        if is_content_addressed(self._stored_inhoud_name):
+            ContentBlob.release(self._stored_inhoud_name)
+        self._stored_inhoud_name = name
+
     # Since canonicals are not stored in the database for CMIS, the BestandsDelen must
     # be retrieved by using the UUID
     def get_bestandsdelen(self):
@@ -465,6 +582,18 @@ class EnkelvoudigInformatieObject(
         return self.canonical.gebruiksrechten_set.exists()
 
 
+def prefetch_latest_version(lookup: str) -> models.Prefetch:
+    """
+    ⚡️ Prefetch only the latest version of the documents referred to by ``lookup``
+    (a relation to :class:`EnkelvoudigInformatieObjectCanonical`), which is used by
+    :attr:`EnkelvoudigInformatieObjectCanonical.latest_version`.
+    """
+    return models.Prefetch(
+        f"{lookup}__enkelvoudiginformatieobject_set",
+        queryset=EnkelvoudigInformatieObject.objects.filter(is_latest=True),
+    )
+
+
 class BestandsDeel(models.Model):
     uuid = models.UUIDField(
         unique=True, default=_uuid.uuid4, help_text="Unieke resource identifier (UUID4)"
@@ -555,6 +684,98 @@ class BestandsDeel(models.Model):
         return self.inhoud.size == self.omvang
 
 
+def _delete_unreferenced_content(name: str) -> None:
+    # the content could have been stored again in the meantime, the lock waits for
+    # the transactions storing it to finish
+    with content_lock(name):
+        if not ContentBlob.objects.filter(name=name).exists():
+            EnkelvoudigInformatieObject._meta.get_field("inhoud").storage.delete(name)
+
+
+class ContentBlob(models.Model):
+    """
+    Counts the references of document versions to a content addressed file.
+    """
+
+    name = models.CharField(_("bestandsnaam"), max_length=255, unique=True)
+    reference_count = models.PositiveIntegerField(_("aantal verwijzingen"), default=0)
+
+    class Meta:
+        verbose_name = _("opgeslagen bestand")
+        verbose_name_plural = _("opgeslagen bestanden")
+
+    def __str__(self):
+        return self.name
+
+    @classmethod
+    def acquire(cls, name: str) -> None:
+        # the lock is held until the reference is committed, so the file isn't
+        # deleted in the meantime
+        with content_lock(name):
+            blob, _created = cls.objects.select_for_update().get_or_create(name=name)
+            cls.objects.filter(pk=blob.pk).update(
+                reference_count=F("reference_count") + 1
+            )
+
+    @classmethod
+    def release(cls, name: str) -> None:
+        """
+        Decrement the reference count, and delete the file once it's unreferenced.
+        """
+        blob = cls.objects.select_for_update().filter(name=name).first()
+        if blob is None:
+            return
+
+        if blob.reference_count > 1:
+            cls.objects.filter(pk=blob.pk).update(
+                reference_count=F("reference_count") - 1
+            )
+            return
+
+        blob.delete()
+        transaction.on_commit(partial(_delete_unreferenced_content, name))
+
+
+class DocumentAssembly(models.Model):
+    """
+    Tracks the merge of the BESTANDSDELen of a document in the background.
+    """
+
+    informatieobject = models.OneToOneField(
+        "EnkelvoudigInformatieObjectCanonical",
+        on_delete=models.CASCADE,
+        related_name="assembly",
+    )
+    status = models.CharField(
+        _("status"),
+        choices=AssemblyStatus.choices,
+        default=AssemblyStatus.pending,
+        max_length=30,
+    )
+    total = models.PositiveIntegerField(_("totaal aantal bestandsdelen"))
+    processed = models.PositiveIntegerField(_("samengevoegde bestandsdelen"), default=0)
+    comment = models.TextField(_("opmerking"), blank=True)
+
+    created_on = models.DateTimeField(_("aangemaakt op"), auto_now_add=True)
+    started_on = models.DateTimeField(_("gestart op"), blank=True, null=True)
+    finished_on = models.DateTimeField(_("voltooid op"), blank=True, null=True)
+    updated_on = models.DateTimeField(
+        _("bijgewerkt op"),
+        auto_now=True,
+        help_text=_(
+            "Assemblies which are in progress but not updated for "
+            "DOCUMENTEN_UPLOAD_ASSEMBLY_TIMEOUT seconds are started again."
+        ),
+    )
+
+    class Meta:
+        verbose_name = _("samenvoeging van bestandsdelen")
+        verbose_name_plural = _("samenvoegingen van bestandsdelen")
+
+    def __str__(self):
+        return f"{self.informatieobject} ({self.get_status_display()})"
+
+
 class Gebruiksrechten(DocumentETagMixin, APIMixin, models.Model):
     uuid = models.UUIDField(
         unique=True, default=_uuid.uuid4, help_text="Unieke resource identifier (UUID4)"
@@ -666,8 +887,9 @@ class ObjectInformatieObject(DocumentETagMixin, models.Model):
     )
     verzoek = AliasServiceUrlField(
         source_field=_object_url,
-        allow_write_when=lambda instance: instance.object_type
-        == ObjectInformatieObjectTypes.verzoek,
+        allow_write_when=lambda instance: (
+            instance.object_type == ObjectInformatieObjectTypes.verzoek
+        ),
         blank=True,
     )
 
@@ -1132,3 +1354,24 @@ class ReservedDocument(models.Model):
 
     def __str__(self):
         return f"{self.bronorganisatie} - {self.identificatie}"
+
+
+class ReservedDocumentRange(models.Model):
+    """
+    The end of the ranges of identificaties which are reserved at once, for all
+    bronorganisaties (for example by imports).
+    """
+
+    prefix = models.CharField(_("prefix"), max_length=40, unique=True)
+    identificatie = models.CharField(
+        _("laatste identificatie"),
+        max_length=40,
+        help_text=_("De laatste gereserveerde identificatie met deze prefix."),
+    )
+
+    class Meta:
+        verbose_name = _("gereserveerde reeks documenten")
+        verbose_name_plural = _("gereserveerde reeksen documenten")
+
+    def __str__(self):
+        return self.identificatie
@@ -1,12 +1,13 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2020 Dimpact
-from typing import Dict, Tuple
+from functools import partial
+from typing import Dict, List, Tuple
 
 from django.apps import apps
-from django.db import models
+from django.core.files.storage import Storage
+from django.db import models, transaction
 
 from django_loose_fk.virtual_models import ProxyMixin
-from vng_api_common.constants import VertrouwelijkheidsAanduiding
 
 from openzaak.components.besluiten.models import BesluitInformatieObject
 from openzaak.components.zaken.models import ZaakInformatieObject
@@ -50,20 +51,21 @@ class InformatieobjectAuthorizationsFilterMixin(LooseFkAuthorizationsFilterMixin
         return ""
 
     def build_queryset(self, local_filters, external_filters) -> models.QuerySet:
-        order_case = VertrouwelijkheidsAanduiding.get_order_expression(
-            "vertrouwelijkheidaanduiding"
-        )
-        annotations = {"_va_order": order_case}
+        # ⚡️ the order of the vertrouwelijkheidaanduiding is stored, which allows the
+        # (informatieobjecttype, va_order) index to be used
+        annotations = {"_va_order": models.F("va_order")}
 
         if self.authorizations_lookup:
             # If the current queryset is not an InformatieObjectQuerySet, first
             # retrieve the canonical IDs of EnkelvoudigInformatieObjects
             # for which the user is authorized and then return the objects
-            # related to those EnkelvoudigInformatieObjectCanonicals
+            # related to those EnkelvoudigInformatieObjectCanonicals.
+            # Like the object permissions, only the latest versions are considered.
             model = apps.get_model("documenten", "EnkelvoudigInformatieObject")
 
             filtered = (
-                model.objects.annotate(**annotations)
+                model.objects.filter(is_latest=True)
+                .annotate(**annotations)
                 .filter(local_filters | external_filters)
                 .values("canonical")
             )
@@ -111,6 +113,27 @@ class ObjectInformatieObjectQuerySet(BlockChangeMixin, InformatieobjectRelatedQu
             **relation_field,
         )
 
+    def bulk_create_from(self, relations: List[IORelation]) -> List[models.Model]:
+        """
+        Create the instances for relations created with ``trusted_bulk_create``.
+        """
+        objs = []
+        for relation in relations:
+            if isinstance(relation.informatieobject, ProxyMixin):
+                continue
+
+            object_type = self.RELATIONS[type(relation)]
+            relation_field = {f"_{object_type}": getattr(relation, object_type)}
+            objs.append(
+                self.model(
+                    informatieobject=relation.informatieobject,
+                    object_type=object_type,
+                    **relation_field,
+                )
+            )
+
+        return self.trusted_bulk_create(objs)
+
     def delete_for(self, relation: IORelation) -> Tuple[int, Dict[str, int]]:
         if isinstance(relation.informatieobject, ProxyMixin):
             return (0, {})
@@ -131,11 +154,22 @@ class DjangoQuerySet(InformatieobjectQuerySet):
     pass
 
 
+def _delete_files(storage: Storage, file_names: List[str]) -> None:
+    for file_name in file_names:
+        storage.delete(file_name)
+
+
 class BestandsDeelQuerySet(models.QuerySet):
     def wipe(self):
-        for part in self:
-            part.inhoud.delete()
-            part.delete()
+        """
+        ⚡️ delete the parts with a single query, and their files once the transaction
+        is committed, so the files are kept if it is rolled back
+        """
+        storage = self.model._meta.get_field("inhoud").storage
+        file_names = list(self.exclude(inhoud="").values_list("inhoud", flat=True))
+        self.delete()
+        if file_names:
+            transaction.on_commit(partial(_delete_files, storage, file_names))
 
     @property
     def complete_upload(self) -> bool:
@@ -7,7 +7,8 @@ from django.dispatch import receiver
 from openzaak.components.besluiten.models import BesluitInformatieObject
 from openzaak.components.zaken.models import ZaakInformatieObject
 
-from .models import ObjectInformatieObject
+from .api.utils import is_content_addressed
+from .models import ContentBlob, EnkelvoudigInformatieObject, ObjectInformatieObject
 from .typing import IORelation
 
 
@@ -46,3 +47,41 @@ def sync_oio(
 
     else:
         raise NotImplementedError(f"Signal {signal} is not supported")
+
+
+@receiver(
+    post_delete,
+    sender=EnkelvoudigInformatieObject,
+    dispatch_uid="documenten.release_content",
+)
+def release_content(
+    sender: ModelBase, instance: EnkelvoudigInformatieObject, **kwargs
+) -> None:
+    """
+    Release the reference to a content addressed file, which is shared by versions.
+    """
+    if is_content_addressed(instance.inhoud.name):
+        ContentBlob.release(instance.inhoud.name)
+
+
+@receiver(
+    post_delete,
+    sender=EnkelvoudigInformatieObject,
+    dispatch_uid="documenten.flag_latest_version",
+)
+def flag_latest_version(
+    sender: ModelBase, instance: EnkelvoudigInformatieObject, **kwargs
+) -> None:
+    """
+    Flag the most recent remaining version as the latest version, when the latest
+    version is deleted (also through a queryset).
+    """
+    if not instance.is_latest:
+        return
+
+    versies = EnkelvoudigInformatieObject.objects.filter(
+        canonical=instance.canonical_id
+    )
+    versies.filter(pk__in=versies.order_by("-versie").values("pk")[:1]).update(
+        is_latest=True
+    )
@@ -1,26 +1,38 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2019 - 2024 Dimpact
+import os
 import shutil
+from datetime import timedelta
+from functools import partial
 from pathlib import Path
+from typing import Container, Optional
 from uuid import UUID, uuid4
 
 from django.conf import settings
 from django.core.exceptions import DisallowedHost, ValidationError
 from django.db import Error as DatabaseError, IntegrityError, transaction
+from django.db.models import QuerySet, Value
+from django.db.models.functions import Concat
 from django.http import HttpRequest
 from django.utils import timezone
 
 import structlog
+from celery import chord
 from structlog.contextvars import bind_contextvars
 from vng_api_common.constants import RelatieAarden
-from vng_api_common.utils import generate_unique_identification
 
 from openzaak import celery_app
 from openzaak.components.documenten.api.serializers import (
     EnkelvoudigInformatieObjectSerializer,
 )
+from openzaak.components.documenten.api.utils import (
+    merge_bestandsdelen,
+    reserve_document_identificaties,
+)
+from openzaak.components.documenten.constants import AssemblyStatus
 from openzaak.components.documenten.import_utils import DocumentRow
 from openzaak.components.documenten.models import (
+    DocumentAssembly,
     EnkelvoudigInformatieObject,
     EnkelvoudigInformatieObjectCanonical,
 )
@@ -29,8 +41,13 @@ from openzaak.import_data.models import Import, ImportStatusChoices
 from openzaak.import_data.utils import (
     finish_batch,
     finish_import,
+    finish_shard_batch,
     get_csv_generator,
+    get_csv_offsets_generator,
     get_total_count,
+    keep_task_lock,
+    merge_shard_reports,
+    release_task_lock,
     task_locker,
 )
 from openzaak.utils.fields import get_default_path
@@ -42,7 +59,7 @@ def _import_document_row(
     row: list[str],
     row_index: int,
     identifier: str,
-    existing_uuids: list[str],
+    existing_uuids: set[str],
     zaak_uuids: dict[str, int],
     request: HttpRequest,
 ) -> DocumentRow:
@@ -280,18 +297,18 @@ def _batch_create_eios(batch: list[DocumentRow], zaak_uuids: dict[str, int]) ->
         raise e
 
     # reuse created instances
+    eios_by_uuid = {}
+    for eio in eios:
+        eios_by_uuid.setdefault(str(eio.uuid), eio)
+
+    coupled_rows: list[DocumentRow] = []
+    zaak_eios: list[ZaakInformatieObject] = []
+
     for row in batch:
         if row.failed:
             continue
 
-        instance = next(
-            (
-                eio
-                for eio in eios
-                if row.instance and str(eio.uuid) == str(row.instance.uuid)
-            ),
-            None,
-        )
+        instance = eios_by_uuid.get(str(row.instance.uuid)) if row.instance else None
 
         row.instance = instance
 
@@ -300,55 +317,196 @@ def _batch_create_eios(batch: list[DocumentRow], zaak_uuids: dict[str, int]) ->
             row.succeeded = bool(instance and instance.pk is not None)
             continue
 
-        # Note that ZaakInformatieObject's will not be created using
-        # `bulk_create` (see queryset MRO).
-        zaak_eio = ZaakInformatieObject(
-            zaak_id=zaak_uuids.get(row.zaak_uuid),
-            informatieobject=instance.canonical,
-            aard_relatie=RelatieAarden.from_object_type("zaak"),
+        coupled_rows.append(row)
+        zaak_eios.append(
+            ZaakInformatieObject(
+                zaak_id=zaak_uuids.get(row.zaak_uuid),
+                informatieobject=instance.canonical,
+                aard_relatie=RelatieAarden.from_object_type("zaak"),
+            )
         )
 
-        try:
-            zaak_eio.save()
-        except DatabaseError as e:
-            row.processed = True
-            row.comment = (
-                f"Unable to couple row {row.row_index} to ZAAK {row.zaak_uuid}:"
-                f"\n {str(e)}"
-            )
+    # ⚡️ create the ZaakInformatieObjecten (and their ObjectInformatieObjecten) in
+    # bulk, the import does not send notifications or write audit trails
+    try:
+        ZaakInformatieObject.objects.trusted_bulk_create(zaak_eios)
+    except DatabaseError as e:
+        coupled_indexes = {row.row_index for row in coupled_rows}
 
-            for _row in batch:
-                if _row.row_index == row.row_index:
-                    continue
+        for row in batch:
+            row.processed = True
+            row.succeeded = False
 
-                _row.processed = True
-                _row.comment = (
-                    f"Unable to load row due to database error on row {row.row_index}"
+            if row.row_index in coupled_indexes:
+                row.comment = (
+                    f"Unable to couple row {row.row_index} to ZAAK {row.zaak_uuid}:"
+                    f"\n {str(e)}"
+                )
+            else:
+                row.comment = (
+                    "Unable to load row due to database error while coupling rows "
+                    "to ZAAKen"
                 )
 
-            raise e
+        raise e
 
+    for row in coupled_rows:
         row.processed = True
         row.succeeded = True
 
 
+def _parse_uuid(value: str) -> Optional[UUID]:
+    try:
+        return UUID(value)
+    except ValueError:
+        return None
+
+
+def _get_batch_lookups(
+    rows: list[tuple[int, list[str]]],
+) -> tuple[set[str], dict[str, int]]:
+    """
+    Returns the EIO UUIDs which already exist and the ids of the ZAAKen referenced
+    by the rows, keyed by their value in the import file.
+
+    ⚡️ Only the UUIDs of the batch are looked up (using the indexes), instead of
+    loading the UUIDs of all EIOs and ZAAKen.
+    """
+    uuid_column = DocumentRow.import_headers.index("uuid")
+    zaak_column = DocumentRow.import_headers.index("zaakUuid")
+
+    uuids, zaak_uuids = {}, {}
+    for _row_index, row in rows:
+        if len(row) > uuid_column and (uuid := _parse_uuid(row[uuid_column])):
+            uuids[row[uuid_column]] = uuid
+        if len(row) > zaak_column and (uuid := _parse_uuid(row[zaak_column])):
+            zaak_uuids[row[zaak_column]] = uuid
+
+    existing = set(
+        EnkelvoudigInformatieObject.objects.filter(
+            uuid__in=set(uuids.values())
+        ).values_list("uuid", flat=True)
+    )
+    zaak_ids = dict(
+        Zaak.objects.filter(uuid__in=set(zaak_uuids.values())).values_list("uuid", "id")
+    )
+
+    existing_uuids = {value for value, uuid in uuids.items() if uuid in existing}
+    zaken = {
+        value: zaak_ids[uuid] for value, uuid in zaak_uuids.items() if uuid in zaak_ids
+    }
+    return existing_uuids, zaken
+
+
+def _import_document_rows(
+    rows: list[tuple[int, list[str]]],
+    identifiers: list[str],
+    request: HttpRequest,
+    duplicate_rows: Container[int] = (),
+) -> tuple[list[DocumentRow], dict[str, int]]:
+    existing_uuids, zaak_uuids = _get_batch_lookups(rows)
+    uuid_column = DocumentRow.import_headers.index("uuid")
+
+    batch = []
+    for (row_index, row), identifier in zip(rows, identifiers):
+        # rows repeating the UUID of an earlier row (in another shard) are treated
+        # as existing
+        uuids = {row[uuid_column]} if row_index in duplicate_rows else existing_uuids
+
+        document_row = _import_document_row(
+            row, row_index, identifier, uuids, zaak_uuids, request
+        )
+
+        if document_row.instance and document_row.instance.uuid:
+            existing_uuids.add(str(document_row.instance.uuid))
+
+        batch.append(document_row)
+
+    return batch, zaak_uuids
+
+
 def _get_identifiers(size: int) -> list[str]:
-    now = timezone.now()
-    dummy_instance = EnkelvoudigInformatieObject(creatiedatum=now.date())
-    first_identifier = generate_unique_identification(dummy_instance, "creatiedatum")
+    if not size:
+        return []
+
+    first_identifier = reserve_document_identificaties(timezone.now().date(), size)
+    return [_offset_identifier(first_identifier, offset) for offset in range(size)]
 
-    _range = size - 1 if size else 0  # don't count the first identifier
 
+def _offset_identifier(first_identifier: str, offset: int) -> str:
     model_name, year, number = first_identifier.split("-")
-    number = int(number)
-    identifiers = []
+    return f"{model_name}-{year}-{str(int(number) + offset).zfill(10)}"
 
-    for i in range(_range):
-        number += 1
 
-        identifiers.append(f"{model_name}-{year}-{str(number).zfill(10)}")
+def _plan_shards(file_path: str, shard_count: int) -> tuple[int, list[dict]]:
+    """
+    Splits the import file in (at most) ``shard_count`` byte ranges of roughly equal
+    size, in a single pass over the file.
 
-    return [first_identifier, *identifiers]
+    Rows which repeat the UUID of an earlier row are collected per shard, as shards
+    can't detect duplicates in other shards themselves.
+    """
+    file_size = os.path.getsize(file_path)
+    uuid_column = DocumentRow.import_headers.index("uuid")
+
+    total = 0
+    seen_uuids = set()
+    shards = [{"start": 0, "end": None, "first_index": 1, "duplicate_rows": []}]
+
+    for row_index, row, offset in get_csv_offsets_generator(file_path):
+        if row_index > 1:  # skip the header row
+            total += 1
+
+            uuid = row[uuid_column] if len(row) > uuid_column else ""
+            if uuid in seen_uuids:
+                shards[-1]["duplicate_rows"].append(row_index)
+            elif uuid:
+                seen_uuids.add(uuid)
+
+        shard_end = file_size * len(shards) / shard_count
+        if offset >= shard_end and len(shards) < shard_count and offset < file_size:
+            shards[-1]["end"] = offset
+            shards.append(
+                {
+                    "start": offset,
+                    "end": None,
+                    "first_index": row_index + 1,
+                    "duplicate_rows": [],
+                }
+            )
+
+    return total, shards
+
+
+def _dispatch_import_shards(import_instance: Import, request_headers: dict) -> None:
+    file_path = import_instance.import_file.path
+    shard_count = settings.IMPORT_DOCUMENTEN_SHARDS
+
+    total, shards = _plan_shards(file_path, shard_count)
+
+    # reserve a range of identifiers for all rows upfront, each row uses the
+    # identifier at the offset of its row index
+    first_identifier = reserve_document_identificaties(
+        timezone.now().date(), max(total, 1)
+    )
+
+    import_instance.total = total
+    import_instance.started_on = timezone.now()
+    import_instance.status = ImportStatusChoices.active
+    import_instance.save(update_fields=["total", "started_on", "status"])
+
+    logger.info("dispatching_import_shards", shard_count=len(shards), total=total)
+
+    header = [
+        import_documents_shard.si(
+            import_instance.pk, request_headers, index, first_identifier, **shard
+        )
+        for index, shard in enumerate(shards)
+    ]
+    callback = finish_import_documents_shards.s(import_instance.pk)
+    # a shard that fails (or whose worker is lost) fails the callback
+    callback.link_error(fail_import_documents_shards.s(import_instance.pk, len(shards)))
+    chord(header)(callback)
 
 
 def _reconstruct_request(headers: dict) -> HttpRequest:
@@ -376,48 +534,44 @@ def import_documents(self, import_pk: int, request_headers: dict) -> None:
 
     bind_contextvars(import_id=import_pk, file_path=file_path)
 
+    # ⚡️ fan out over multiple workers, see `import_documents_shard`
+    if settings.IMPORT_DOCUMENTEN_SHARDS > 1:
+        _dispatch_import_shards(import_instance, request_headers)
+        # the import is only finished once all shards are processed, the lock is
+        # released by `finish_import_documents_shards`
+        keep_task_lock(self)
+        return
+
     import_instance.total = get_total_count(file_path)
     import_instance.started_on = timezone.now()
     import_instance.status = ImportStatusChoices.active
     import_instance.save(update_fields=["total", "started_on", "status"])
 
-    batch: list[DocumentRow] = []
+    rows: list[tuple[int, list[str]]] = []
     batch_size = settings.IMPORT_DOCUMENTEN_BATCH_SIZE
 
-    zaak_uuids = {str(uuid): id for uuid, id in Zaak.objects.values_list("uuid", "id")}
-    eio_uuids = [
-        str(uuid) for uuid in EnkelvoudigInformatieObject.objects.values_list("uuid")
-    ]
-
-    identifiers = []
-
     for row_index, row in get_csv_generator(file_path):
         if row_index == 1:  # skip the header row
             continue
 
-        if len(batch) % batch_size == 0:
-            logger.info(
-                "starting_batch",
-                batch_number=import_instance.get_batch_number(batch_size),
-            )
+        rows.append((row_index, row))
 
-            identifiers = _get_identifiers(batch_size)
-
-        document_row = _import_document_row(
-            row, row_index, identifiers.pop(), eio_uuids, zaak_uuids, request
-        )
-
-        if document_row.instance and document_row.instance.uuid:
-            eio_uuids.append(str(document_row.instance.uuid))
-
-        batch.append(document_row)
-
-        processed = import_instance.processed + len(batch)
+        processed = import_instance.processed + len(rows)
         is_finished = bool(import_instance.total == processed)
 
-        if len(batch) % batch_size != 0 and not is_finished:
+        if len(rows) % batch_size != 0 and not is_finished:
             continue
 
+        logger.info(
+            "starting_batch",
+            batch_number=import_instance.get_batch_number(batch_size),
+        )
+
+        batch, zaak_uuids = _import_document_rows(
+            rows, _get_identifiers(len(rows)), request
+        )
+        rows.clear()
+
         try:
             logger.debug(
                 "creating_eios_and_zios_for_batch",
@@ -464,6 +618,254 @@ def import_documents(self, import_pk: int, request_headers: dict) -> None:
             "batches_remaining",
             remaining_batches=remaining_batches,
         )
-        batch.clear()
-
     finish_import(import_instance, ImportStatusChoices.finished)
+
+
+@celery_app.task
+def import_documents_shard(
+    import_pk: int,
+    request_headers: dict,
+    shard: int,
+    first_identifier: str,
+    start: int,
+    end: Optional[int],
+    first_index: int,
+    duplicate_rows: list[int],
+) -> bool:
+    """
+    Import the rows of the import file between the byte offsets ``start`` and
+    ``end``. Returns whether the shard was processed completely.
+    """
+    import_instance = Import.objects.get(pk=import_pk)
+
+    request = _reconstruct_request(request_headers)
+
+    file_path = import_instance.import_file.path
+
+    bind_contextvars(import_id=import_pk, file_path=file_path, shard=shard)
+
+    rows: list[tuple[int, list[str]]] = []
+    batch_size = settings.IMPORT_DOCUMENTEN_BATCH_SIZE
+    duplicate_rows = set(duplicate_rows)
+
+    for row_index, row, _offset in get_csv_offsets_generator(
+        file_path, start, end, first_index
+    ):
+        if row_index == 1:  # skip the header row
+            continue
+
+        rows.append((row_index, row))
+
+        if len(rows) < batch_size:
+            continue
+
+        if not _import_shard_batch(
+            import_instance, shard, rows, first_identifier, duplicate_rows, request
+        ):
+            return False
+
+        rows.clear()
+
+    if rows:
+        return _import_shard_batch(
+            import_instance, shard, rows, first_identifier, duplicate_rows, request
+        )
+
+    return True
+
+
+def _import_shard_batch(
+    import_instance: Import,
+    shard: int,
+    rows: list[tuple[int, list[str]]],
+    first_identifier: str,
+    duplicate_rows: set[int],
+    request: HttpRequest,
+) -> bool:
+    # the header row has no identifier
+    identifiers = [
+        _offset_identifier(first_identifier, row_index - 2) for row_index, _ in rows
+    ]
+    batch, zaak_uuids = _import_document_rows(
+        rows, identifiers, request, duplicate_rows
+    )
+
+    try:
+        logger.debug("creating_eios_and_zios_for_shard_batch")
+        _batch_create_eios(batch, zaak_uuids)
+    except IntegrityError as e:
+        error_message = f"An Integrity error occured during shard {shard}: \n {e}"
+
+        Import.objects.filter(pk=import_instance.pk).update(
+            comment=Concat("comment", Value(f"\n\n {error_message}"))
+        )
+
+        logger.warning("integrity_error_during_shard_batch", error=str(e))
+    except DatabaseError as e:
+        logger.critical(
+            "critical_error_during_shard_batch_stopping_shard", error=str(e)
+        )
+
+        Import.objects.filter(pk=import_instance.pk).update(
+            comment=Concat("comment", Value(f"\n\n {e}"))
+        )
+
+        finish_shard_batch(import_instance, shard, batch)
+        return False
+
+    finish_shard_batch(import_instance, shard, batch)
+    return True
+
+
+@celery_app.task
+def finish_import_documents_shards(results: list[bool], import_pk: int) -> None:
+    """
+    Merges the reports of the shards after all shards are processed.
+    """
+    import_instance = Import.objects.get(pk=import_pk)
+
+    bind_contextvars(import_id=import_pk)
+
+    try:
+        merge_shard_reports(import_instance, len(results), DocumentRow.export_headers)
+
+        status = (
+            ImportStatusChoices.finished if all(results) else ImportStatusChoices.error
+        )
+        finish_import(import_instance, status)
+    finally:
+        release_task_lock(import_documents.name)
+
+
+@celery_app.task
+def fail_import_documents_shards(
+    request, exc: Exception, traceback, import_pk: int, shard_count: int
+) -> None:
+    """
+    Finishes the import if a shard failed unexpectedly.
+    """
+    import_instance = Import.objects.get(pk=import_pk)
+
+    bind_contextvars(import_id=import_pk)
+    logger.error("import_shard_failed", error=str(exc))
+
+    try:
+        merge_shard_reports(import_instance, shard_count, DocumentRow.export_headers)
+        finish_import(
+            import_instance,
+            ImportStatusChoices.error,
+            comment=f"{import_instance.comment}\n\n {exc}",
+        )
+    finally:
+        release_task_lock(import_documents.name)
+
+
+@celery_app.task(
+    # the message is delivered again if the worker is lost while merging
+    acks_late=True,
+    reject_on_worker_lost=True,
+)
+def assemble_document(assembly_pk: int) -> None:
+    """
+    Merge the BESTANDSDELen of a document after it was unlocked.
+    """
+    bind_contextvars(assembly_id=assembly_pk)
+
+    # claim the assembly, so it is only processed once
+    started_on = timezone.now()
+    claimed = DocumentAssembly.objects.filter(
+        pk=assembly_pk, status=AssemblyStatus.pending
+    ).update(
+        status=AssemblyStatus.active,
+        processed=0,
+        comment="",
+        started_on=started_on,
+        finished_on=None,
+        updated_on=started_on,
+    )
+    if not claimed:
+        logger.info("document_assembly_already_claimed")
+        return
+
+    # a stale assembly is claimed again by another task, from then on only that
+    # task may update it
+    claim = DocumentAssembly.objects.filter(
+        pk=assembly_pk, status=AssemblyStatus.active, started_on=started_on
+    )
+
+    assembly = DocumentAssembly.objects.select_related("informatieobject").get(
+        pk=assembly_pk
+    )
+    canonical = assembly.informatieobject
+    eio = canonical.latest_version
+    bestandsdelen = canonical.bestandsdelen.order_by("volgnummer")
+
+    def report_progress(processed: int) -> None:
+        claim.update(processed=processed, updated_on=timezone.now())
+
+    try:
+        merge_bestandsdelen(eio, bestandsdelen, progress=report_progress, save=False)
+
+        with transaction.atomic():
+            if not claim.select_for_update().exists():
+                logger.warning("document_assembly_claimed_again")
+                eio.inhoud.delete(save=False)
+                return
+
+            eio.save()
+            bestandsdelen.wipe()
+            claim.update(
+                status=AssemblyStatus.finished,
+                finished_on=timezone.now(),
+                updated_on=timezone.now(),
+            )
+    except Exception as exc:
+        logger.exception("document_assembly_failed")
+        claim.update(
+            status=AssemblyStatus.error,
+            comment=str(exc),
+            finished_on=timezone.now(),
+            updated_on=timezone.now(),
+        )
+        return
+
+    logger.info("document_assembly_finished", total=assembly.total)
+
+
+def retry_assemblies(assemblies: QuerySet[DocumentAssembly]) -> list[int]:
+    """
+    Start the given assemblies again, once the transaction is committed.
+
+    The part files are only removed once an assembly is finished, so assemblies
+    which failed or got stuck can be started again.
+    """
+    assembly_pks = list(
+        assemblies.exclude(status=AssemblyStatus.finished).values_list("pk", flat=True)
+    )
+    DocumentAssembly.objects.filter(pk__in=assembly_pks).update(
+        status=AssemblyStatus.pending, updated_on=timezone.now()
+    )
+    for assembly_pk in assembly_pks:
+        transaction.on_commit(partial(assemble_document.delay, assembly_pk))
+    return assembly_pks
+
+
+@celery_app.task
+def requeue_stale_assemblies() -> None:
+    """
+    Start the assemblies again which are in progress, but not updated for
+    ``DOCUMENTEN_UPLOAD_ASSEMBLY_TIMEOUT`` seconds.
+
+    This happens if the message of the task is lost, or the task got stuck.
+    """
+    stale_before = timezone.now() - timedelta(
+        seconds=settings.DOCUMENTEN_UPLOAD_ASSEMBLY_TIMEOUT
+    )
+    stale = DocumentAssembly.objects.filter(
+        status__in=AssemblyStatus.in_progress_choices(), updated_on__lt=stale_before
+    )
+    with transaction.atomic():
+        assembly_pks = retry_assemblies(stale.select_for_update(skip_locked=True))
+
+    if assembly_pks:
+        logger.warning("stale_document_assemblies_requeued", assembly_ids=assembly_pks)
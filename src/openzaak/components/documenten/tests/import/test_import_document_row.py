@@ -10,6 +10,7 @@ from django.test import RequestFactory, TestCase, override_settings
 from django.utils import timezone
 
 import requests_mock
+from privates.test import temp_private_root
 from vng_api_common.fields import VertrouwelijkheidsAanduiding
 from vng_api_common.utils import generate_unique_identification
 from zgw_consumers.constants import APITypes
@@ -21,7 +22,10 @@ from openzaak.components.documenten.constants import (
     Statussen,
 )
 from openzaak.components.documenten.models import EnkelvoudigInformatieObject
-from openzaak.components.documenten.tasks import _import_document_row
+from openzaak.components.documenten.tasks import (
+    _get_batch_lookups,
+    _import_document_row,
+)
 from openzaak.components.documenten.tests.factories import (
     DocumentRowFactory,
     EnkelvoudigInformatieObjectFactory,
@@ -623,3 +627,26 @@ class ImportDocumentRowTests(ImportTestMixin, MockSchemasMixin, TestCase):
         self.assertIn("Unable to import line", document_row.comment)
 
         self.assertFalse(imported_path.exists())
+
+
+@temp_private_root()
+class BatchLookupTests(TestCase):
+    def test_get_batch_lookups(self):
+        eio = EnkelvoudigInformatieObjectFactory.create()
+        zaak = ZaakFactory.create()
+        EnkelvoudigInformatieObjectFactory.create()
+        ZaakFactory.create()
+
+        rows = [
+            (2, DocumentRowFactory.build(uuid=str(eio.uuid), zaak_uuid=str(zaak.uuid))),
+            (3, DocumentRowFactory.build(uuid=str(uuid4()), zaak_uuid=str(uuid4()))),
+            (4, DocumentRowFactory.build(uuid="invalid", zaak_uuid="invalid")),
+            (5, ["too", "short"]),
+        ]
+
+        # only the UUIDs of the batch are looked up
+        with self.assertNumQueries(2):
+            existing_uuids, zaak_uuids = _get_batch_lookups(rows)
+
+        self.assertEqual(existing_uuids, {str(eio.uuid)})
+        self.assertEqual(zaak_uuids, {str(zaak.uuid): zaak.pk})
@@ -1,9 +1,11 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2019 - 2024 Dimpact
 import csv
+from datetime import date
 from pathlib import Path
 from unittest.mock import patch
 
+from django.core.cache import cache
 from django.db import IntegrityError, OperationalError
 from django.test import TestCase, override_settings
 
@@ -12,9 +14,14 @@ from privates.test import temp_private_root
 from zgw_consumers.constants import APITypes
 from zgw_consumers.test.factories import ServiceFactory
 
+from openzaak import celery_app
+from openzaak.components.documenten.api.utils import generate_document_identificatie
 from openzaak.components.documenten.import_utils import DocumentRow
 from openzaak.components.documenten.models import EnkelvoudigInformatieObject
-from openzaak.components.documenten.tasks import import_documents
+from openzaak.components.documenten.tasks import (
+    fail_import_documents_shards,
+    import_documents,
+)
 from openzaak.components.documenten.tests.factories import (
     EnkelvoudigInformatieObjectFactory,
 )
@@ -29,6 +36,7 @@ from openzaak.import_data.models import (
     ImportTypeChoices,
 )
 from openzaak.import_data.tests.utils import ImportTestMixin
+from openzaak.import_data.utils import get_task_lock_id, release_task_lock
 from openzaak.tests.utils.mocks import MockSchemasMixin
 from openzaak.utils.fields import get_default_path
 
@@ -594,15 +602,15 @@ class ImportDocumentTestCase(ImportTestMixin, MockSchemasMixin, TestCase):
             )
 
         with patch(
-            "openzaak.components.documenten.tasks.ZaakInformatieObject.save"
-        ) as mocked_save:
-            mocked_save.side_effect = IntegrityError
+            "openzaak.components.documenten.tasks.ZaakInformatieObject.objects.trusted_bulk_create"
+        ) as mocked_bulk_create:
+            mocked_bulk_create.side_effect = IntegrityError
 
             import_documents(import_instance.pk, self.request_headers)
 
         import_instance.refresh_from_db()
 
-        mocked_save.assert_called()
+        mocked_bulk_create.assert_called()
 
         eios = EnkelvoudigInformatieObject.objects.all()
 
@@ -669,9 +677,9 @@ class ImportDocumentTestCase(ImportTestMixin, MockSchemasMixin, TestCase):
             )
 
         with patch(
-            "openzaak.components.documenten.tasks.ZaakInformatieObject.save"
-        ) as mocked_save:
-            mocked_save.side_effect = OperationalError
+            "openzaak.components.documenten.tasks.ZaakInformatieObject.objects.trusted_bulk_create"
+        ) as mocked_bulk_create:
+            mocked_bulk_create.side_effect = OperationalError
 
             import_documents(import_instance.pk, self.request_headers)
 
@@ -710,3 +718,162 @@ class ImportDocumentTestCase(ImportTestMixin, MockSchemasMixin, TestCase):
                     )
                 else:
                     self.assertIn("Unable to load row due to database error", row[-2])
+
+    @override_settings(IMPORT_DOCUMENTEN_SHARDS=3)
+    @patch.object(celery_app.conf, "task_always_eager", True)
+    def test_sharded_import(self):
+        ZaakFactory(uuid="43f1d8f4-c689-46eb-ae6e-c64d892d5341")
+        ZaakFactory(uuid="b02ee3eb-8e94-4cd9-93e7-f8d1b16a1952")
+
+        import_file_path = self.test_data_path / "import.csv"
+
+        with open(import_file_path) as import_file:
+            import_instance = self.create_import(
+                import_type=ImportTypeChoices.documents,
+                status=ImportStatusChoices.pending,
+                import_file__data=import_file.read(),
+                total=0,
+                report_file=None,
+            )
+
+        import_documents(import_instance.pk, self.request_headers)
+
+        import_instance.refresh_from_db()
+
+        eios = EnkelvoudigInformatieObject.objects.order_by("titel")
+
+        self.assertEqual(eios.count(), 4)
+        # each row is given the identifier at the offset of its row
+        numbers = [int(eio.identificatie.split("-")[-1]) for eio in eios]
+        self.assertEqual(numbers, list(range(numbers[0], numbers[0] + 4)))
+
+        self.assertEqual(import_instance.total, 4)
+        self.assertEqual(import_instance.processed, 4)
+        self.assertEqual(import_instance.processed_invalid, 0)
+        self.assertEqual(import_instance.processed_successfully, 4)
+        self.assertEqual(import_instance.status, ImportStatusChoices.finished)
+
+        report_path = Path(import_instance.report_file.path)
+
+        with open(str(report_path)) as report_file:
+            csv_reader = csv.reader(report_file, delimiter=",", quotechar='"')
+            rows = [row for row in csv_reader]
+
+        self.addCleanup(report_path.unlink)
+
+        self.assertEqual(len(rows), 5)
+        self.assertEqual(DocumentRow.export_headers, rows[0])
+        # the reports of the shards are merged in order
+        self.assertEqual(
+            [row[4] for row in rows[1:]], [f"Document {i}" for i in range(1, 5)]
+        )
+        self.assertEqual(list(report_path.parent.glob("report-*-*.csv")), [])
+        # the lock is released once all shards are processed
+        self.assertIsNone(cache.get(get_task_lock_id(import_documents.name)))
+
+    @override_settings(IMPORT_DOCUMENTEN_SHARDS=2)
+    @patch("openzaak.components.documenten.tasks.chord")
+    def test_sharded_import_keeps_lock(self, mock_chord):
+        self.addCleanup(release_task_lock, import_documents.name)
+        import_file_path = self.test_data_path / "import.csv"
+
+        with open(import_file_path) as import_file:
+            data = import_file.read()
+
+        import_instance = self.create_import(
+            import_type=ImportTypeChoices.documents,
+            status=ImportStatusChoices.pending,
+            import_file__data=data,
+            total=0,
+            report_file=None,
+        )
+        other_import = self.create_import(
+            import_type=ImportTypeChoices.documents,
+            status=ImportStatusChoices.pending,
+            import_file__data=data,
+            total=0,
+            report_file=None,
+        )
+
+        import_documents(import_instance.pk, self.request_headers)
+
+        mock_chord.assert_called_once()
+        self.assertIsNotNone(cache.get(get_task_lock_id(import_documents.name)))
+
+        # the shards are still being processed
+        import_documents(other_import.pk, self.request_headers)
+
+        other_import.refresh_from_db()
+        self.assertEqual(other_import.status, ImportStatusChoices.pending)
+
+        # the identifiers reserved for the rows are not generated again
+        first_identifier = mock_chord.call_args.args[0][0].args[3]
+        identificatie = generate_document_identificatie("123456782", date.today())
+        self.assertEqual(
+            int(identificatie.split("-")[-1]),
+            int(first_identifier.split("-")[-1]) + 4,
+        )
+
+        with self.subTest("shard failed"):
+            callback = mock_chord.return_value.call_args.args[0]
+            self.assertEqual(len(callback.options["link_error"]), 1)
+
+            fail_import_documents_shards(
+                None, Exception("worker lost"), None, import_instance.pk, 2
+            )
+
+            import_instance.refresh_from_db()
+            self.assertEqual(import_instance.status, ImportStatusChoices.error)
+            self.assertIn("worker lost", import_instance.comment)
+            self.assertIsNone(cache.get(get_task_lock_id(import_documents.name)))
+
+    @override_settings(IMPORT_DOCUMENTEN_SHARDS=2)
+    @patch.object(celery_app.conf, "task_always_eager", True)
+    def test_sharded_import_duplicate_uuids(self):
+        import_file_path = self.test_data_path / "import.csv"
+        uuid = "1f7ac2a8-5a1f-4b4d-92e1-6ea11d2a5d0e"
+
+        with open(import_file_path) as import_file:
+            lines = import_file.read().splitlines()
+
+        # the first and last document share the UUID, and end up in different shards
+        lines = [
+            lines[0],
+            *(
+                uuid + line if i in (1, 4) else line
+                for i, line in enumerate(lines[1:], start=1)
+            ),
+        ]
+        lines = [
+            line.replace("43f1d8f4-c689-46eb-ae6e-c64d892d5341", "").replace(
+                "b02ee3eb-8e94-4cd9-93e7-f8d1b16a1952", ""
+            )
+            for line in lines
+        ]
+
+        import_instance = self.create_import(
+            import_type=ImportTypeChoices.documents,
+            status=ImportStatusChoices.pending,
+            import_file__data="\n".join(lines) + "\n",
+            total=0,
+            report_file=None,
+        )
+
+        import_documents(import_instance.pk, self.request_headers)
+
+        import_instance.refresh_from_db()
+
+        self.assertEqual(
+            EnkelvoudigInformatieObject.objects.filter(uuid=uuid).count(), 1
+        )
+        self.assertEqual(import_instance.processed, 4)
+        self.assertEqual(import_instance.processed_invalid, 1)
+        self.assertEqual(import_instance.processed_successfully, 3)
+
+        report_path = Path(import_instance.report_file.path)
+        self.addCleanup(report_path.unlink)
+
+        with open(str(report_path)) as report_file:
+            rows = list(csv.reader(report_file, delimiter=",", quotechar='"'))
+
+        self.assertIn("UUID given on row 5 was already found!", rows[4][-2])
@@ -4,6 +4,10 @@ from django.test import TestCase
 
 from privates.test import temp_private_root
 
+from ...models import (
+    EnkelvoudigInformatieObject,
+    EnkelvoudigInformatieObjectCanonical,
+)
 from ..factories import (
     EnkelvoudigInformatieObjectCanonicalFactory,
     EnkelvoudigInformatieObjectFactory,
@@ -19,3 +23,56 @@ class LastVersionTests(TestCase):
         eio3 = EnkelvoudigInformatieObjectFactory.create(canonical=canonical, versie=3)
 
         self.assertEqual(canonical.latest_version, eio3)
+
+    def test_latest_version_is_flagged(self):
+        canonical = EnkelvoudigInformatieObjectCanonicalFactory(latest_version=None)
+        eio1 = EnkelvoudigInformatieObjectFactory.create(canonical=canonical, versie=1)
+        eio2 = EnkelvoudigInformatieObjectFactory.create(canonical=canonical, versie=2)
+
+        eio1.refresh_from_db()
+        self.assertFalse(eio1.is_latest)
+        self.assertTrue(eio2.is_latest)
+
+        with self.subTest("older version created later"):
+            eio0 = EnkelvoudigInformatieObjectFactory.create(
+                canonical=canonical, versie=0
+            )
+
+            self.assertFalse(eio0.is_latest)
+            self.assertEqual(canonical.latest_version, eio2)
+
+    def test_previous_version_flagged_after_delete(self):
+        canonical = EnkelvoudigInformatieObjectCanonicalFactory(latest_version=None)
+        eio1 = EnkelvoudigInformatieObjectFactory.create(canonical=canonical, versie=1)
+        eio2 = EnkelvoudigInformatieObjectFactory.create(canonical=canonical, versie=2)
+
+        eio2.delete()
+
+        eio1.refresh_from_db()
+        self.assertTrue(eio1.is_latest)
+        self.assertEqual(canonical.latest_version, eio1)
+
+    def test_previous_version_flagged_after_queryset_delete(self):
+        canonical = EnkelvoudigInformatieObjectCanonicalFactory(latest_version=None)
+        eio1 = EnkelvoudigInformatieObjectFactory.create(canonical=canonical, versie=1)
+        EnkelvoudigInformatieObjectFactory.create(canonical=canonical, versie=2)
+        EnkelvoudigInformatieObjectFactory.create(canonical=canonical, versie=3)
+
+        EnkelvoudigInformatieObject.objects.filter(
+            canonical=canonical, versie__gt=1
+        ).delete()
+
+        eio1.refresh_from_db()
+        self.assertTrue(eio1.is_latest)
+        self.assertEqual(canonical.latest_version, eio1)
+
+    def test_latest_version_with_prefetched_versions(self):
+        canonical = EnkelvoudigInformatieObjectCanonicalFactory(latest_version=None)
+        EnkelvoudigInformatieObjectFactory.create(canonical=canonical, versie=1)
+        eio2 = EnkelvoudigInformatieObjectFactory.create(canonical=canonical, versie=2)
+        canonical = EnkelvoudigInformatieObjectCanonical.objects.prefetch_related(
+            "enkelvoudiginformatieobject_set"
+        ).get(pk=canonical.pk)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(canonical.latest_version, eio2)
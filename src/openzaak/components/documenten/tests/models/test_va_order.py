@@ -0,0 +1,22 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+from django.test import TestCase
+
+from vng_api_common.constants import VertrouwelijkheidsAanduiding
+
+from ..factories import EnkelvoudigInformatieObjectFactory
+
+
+class VertrouwelijkheidaanduidingOrderTests(TestCase):
+    def test_order_is_stored(self):
+        for value in VertrouwelijkheidsAanduiding.values:
+            with self.subTest(vertrouwelijkheidaanduiding=value):
+                eio = EnkelvoudigInformatieObjectFactory.create(
+                    vertrouwelijkheidaanduiding=value
+                )
+
+                eio.refresh_from_db()
+
+                self.assertEqual(
+                    eio.va_order, VertrouwelijkheidsAanduiding.get_choice_order(value)
+                )
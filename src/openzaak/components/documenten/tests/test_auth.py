@@ -1245,3 +1245,15 @@ class ReserveDocumentAuthTests(JWTAuthMixin, APITestCase):
                 bronorganisatie=self.bronorganisatie,
             ).exists()
         )
+
+
+@override_settings(AUTORISATIES_FILTERS_VALUES_JOIN=True)
+class InformatieObjectReadCorrectScopeValuesJoinTests(
+    InformatieObjectReadCorrectScopeTests
+):
+    pass
+
+
+@override_settings(AUTORISATIES_FILTERS_VALUES_JOIN=True)
+class GebruiksrechtenReadValuesJoinTests(GebruiksrechtenReadTests):
+    pass
@@ -0,0 +1,148 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+import hashlib
+import os
+import threading
+import time
+from base64 import b64encode
+
+from django.db import connection, transaction
+from django.test import TestCase, TransactionTestCase, override_settings
+
+from privates.test import temp_private_root
+from rest_framework import status
+from rest_framework.test import APITestCase
+from vng_api_common.tests import reverse
+
+from openzaak.tests.utils import JWTAuthMixin
+
+from ..constants import ChecksumAlgoritmes
+from ..models import (
+    ContentBlob,
+    EnkelvoudigInformatieObject,
+    _delete_unreferenced_content,
+)
+from .factories import EnkelvoudigInformatieObjectFactory
+
+DIGEST = hashlib.sha256(b"some content").hexdigest()
+NAME = f"content/{DIGEST[:2]}/{DIGEST}.bin"
+
+
+@temp_private_root()
+@override_settings(DOCUMENTEN_CONTENT_ADDRESSED_STORAGE=True)
+class ContentAddressedStorageTests(TestCase):
+    def test_same_content_stored_once(self):
+        eio1 = EnkelvoudigInformatieObjectFactory.create(inhoud__data=b"some content")
+        eio2 = EnkelvoudigInformatieObjectFactory.create(inhoud__data=b"some content")
+
+        self.assertEqual(eio1.inhoud.name, NAME)
+        self.assertEqual(eio2.inhoud.name, NAME)
+        self.assertEqual(eio1.inhoud.read(), b"some content")
+        self.assertEqual(
+            os.listdir(os.path.dirname(eio1.inhoud.path)), [f"{DIGEST}.bin"]
+        )
+        self.assertEqual(ContentBlob.objects.get(name=NAME).reference_count, 2)
+
+    def test_integriteit_filled(self):
+        eio = EnkelvoudigInformatieObjectFactory.create(inhoud__data=b"some content")
+
+        self.assertEqual(eio.integriteit_algoritme, ChecksumAlgoritmes.sha_256)
+        self.assertEqual(eio.integriteit_waarde, DIGEST)
+        self.assertIsNotNone(eio.integriteit_datum)
+
+    def test_provided_integriteit_kept(self):
+        eio = EnkelvoudigInformatieObjectFactory.create(
+            inhoud__data=b"some content",
+            integriteit_algoritme=ChecksumAlgoritmes.md5,
+            integriteit_waarde="d7a4b9d3e1f0",
+        )
+
+        self.assertEqual(eio.integriteit_algoritme, ChecksumAlgoritmes.md5)
+        self.assertEqual(eio.integriteit_waarde, "d7a4b9d3e1f0")
+
+    def test_delete_releases_content(self):
+        eio1 = EnkelvoudigInformatieObjectFactory.create(inhoud__data=b"some content")
+        eio2 = EnkelvoudigInformatieObjectFactory.create(inhoud__data=b"some content")
+        path = eio1.inhoud.path
+
+        with self.captureOnCommitCallbacks(execute=True):
+            eio1.canonical.delete()
+
+        self.assertEqual(ContentBlob.objects.get(name=NAME).reference_count, 1)
+        self.assertTrue(os.path.exists(path))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            eio2.canonical.delete()
+
+        self.assertFalse(ContentBlob.objects.exists())
+        self.assertFalse(os.path.exists(path))
+
+    @override_settings(DOCUMENTEN_CONTENT_ADDRESSED_STORAGE=False)
+    def test_disabled(self):
+        eio = EnkelvoudigInformatieObjectFactory.create(inhoud__data=b"some content")
+
+        self.assertNotEqual(eio.inhoud.name, NAME)
+        self.assertEqual(eio.integriteit_waarde, "")
+        self.assertFalse(ContentBlob.objects.exists())
+
+
+@temp_private_root()
+@override_settings(DOCUMENTEN_CONTENT_ADDRESSED_STORAGE=True)
+class ContentAddressedStorageConcurrencyTests(TransactionTestCase):
+    def test_content_stored_again_while_deleted(self):
+        eio = EnkelvoudigInformatieObjectFactory.create(inhoud__data=b"some content")
+        path = eio.inhoud.path
+        # the last reference is released, but the file isn't deleted yet
+        ContentBlob.objects.all().delete()
+
+        stored = threading.Event()
+
+        def store_again():
+            try:
+                with transaction.atomic():
+                    EnkelvoudigInformatieObjectFactory.create(
+                        inhoud__data=b"some content"
+                    )
+                    stored.set()
+                    time.sleep(0.2)
+            finally:
+                connection.close()
+
+        thread = threading.Thread(target=store_again)
+        thread.start()
+        stored.wait()
+
+        # waits until the content stored again is committed
+        _delete_unreferenced_content(NAME)
+        thread.join()
+
+        self.assertEqual(ContentBlob.objects.get(name=NAME).reference_count, 1)
+        self.assertTrue(os.path.exists(path))
+
+
+@temp_private_root()
+@override_settings(DOCUMENTEN_CONTENT_ADDRESSED_STORAGE=True)
+class ContentAddressedStorageAPITests(JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+
+    def test_new_versions_share_content(self):
+        eio = EnkelvoudigInformatieObjectFactory.create(inhoud__data=b"some content")
+        eio_url = reverse(eio)
+        lock = self.client.post(f"{eio_url}/lock").data["lock"]
+
+        response = self.client.patch(eio_url, {"titel": "new titel", "lock": lock})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+
+        response = self.client.patch(
+            eio_url,
+            {"inhoud": b64encode(b"some content").decode(), "lock": lock},
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+        self.assertEqual(
+            set(EnkelvoudigInformatieObject.objects.values_list("inhoud", flat=True)),
+            {NAME},
+        )
+        self.assertEqual(ContentBlob.objects.get(name=NAME).reference_count, 3)
+        self.assertEqual(response.data["integriteit"]["waarde"], DIGEST)
@@ -0,0 +1,72 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+import binascii
+import hashlib
+import io
+from base64 import b64encode
+
+from django.core.exceptions import ValidationError
+from django.test import SimpleTestCase, override_settings
+
+from ..api.serializers import AnyBase64File
+from ..api.utils import decode_base64
+
+CONTENT = b"some file content that spans multiple chunks"
+
+
+@override_settings(DOCUMENTEN_UPLOAD_READ_CHUNK=5)
+class DecodeBase64Tests(SimpleTestCase):
+    def test_decode(self):
+        output = io.BytesIO()
+
+        size, sha256 = decode_base64(b64encode(CONTENT).decode(), output)
+
+        self.assertEqual(output.getvalue(), CONTENT)
+        self.assertEqual(size, len(CONTENT))
+        self.assertEqual(sha256, hashlib.sha256(CONTENT).hexdigest())
+
+    def test_decode_ignores_non_base64_characters(self):
+        encoded = b64encode(CONTENT).decode()
+        output = io.BytesIO()
+
+        decode_base64("\n".join(encoded[i : i + 3] for i in range(0, 60, 3)), output)
+
+        self.assertEqual(output.getvalue(), CONTENT)
+
+    def test_decode_max_size(self):
+        output = io.BytesIO()
+
+        size, sha256 = decode_base64(b64encode(CONTENT).decode(), output, max_size=10)
+
+        self.assertGreater(size, 10)
+        self.assertIsNone(sha256)
+
+    def test_decode_incorrect_padding(self):
+        with self.assertRaisesMessage(binascii.Error, "Incorrect padding"):
+            decode_base64("c29tZQ", io.BytesIO())
+
+    def test_decode_non_ascii(self):
+        with self.assertRaises(binascii.Error):
+            decode_base64("c29tZQ==é", io.BytesIO())
+
+
+class AnyBase64FileTests(SimpleTestCase):
+    def test_to_internal_value(self):
+        field = AnyBase64File()
+
+        file = field.to_internal_value(
+            f"data:text/plain;base64,{b64encode(CONTENT).decode()}"
+        )
+
+        self.assertEqual(file.read(), CONTENT)
+        self.assertEqual(file.size, len(CONTENT))
+        self.assertTrue(file.name.endswith(".bin"))
+        self.assertEqual(file.sha256, hashlib.sha256(CONTENT).hexdigest())
+
+    def test_to_internal_value_incorrect_padding(self):
+        field = AnyBase64File()
+
+        with self.assertRaises(ValidationError) as cm:
+            field.to_internal_value("c29tZQ")
+
+        self.assertEqual(cm.exception.code, "incorrect-base64-padding")
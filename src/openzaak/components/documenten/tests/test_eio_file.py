@@ -10,6 +10,7 @@ from urllib.parse import urlparse
 
 from django.test import override_settings
 
+from django_sendfile.utils import _get_sendfile
 from privates.test import temp_private_root
 from rest_framework import status
 from rest_framework.test import APITestCase
@@ -95,3 +96,103 @@ class US39TestCase(JWTAuthMixin, APITestCase):
             download_url.path,
             get_operation_url("enkelvoudiginformatieobject_download", uuid=eio.uuid),
         )
+
+
+@override_settings(SENDFILE_BACKEND="django_sendfile.backends.simple")
+@temp_private_root()
+class DownloadTests(JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        cls.eio = EnkelvoudigInformatieObjectFactory.create(inhoud__data=b"0123456789")
+        cls.file_url = get_operation_url(
+            "enkelvoudiginformatieobject_download", uuid=cls.eio.uuid
+        )
+
+    def setUp(self):
+        super().setUp()
+
+        # the backend is cached on first use, regardless of the settings
+        _get_sendfile.cache_clear()
+        self.addCleanup(_get_sendfile.cache_clear)
+
+    def test_download(self):
+        response = self.client.get(self.file_url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.getvalue(), b"0123456789")
+        self.assertEqual(response["Accept-Ranges"], "bytes")
+        self.assertTrue(response["ETag"].startswith('"'))
+        self.assertIn("Last-Modified", response)
+
+    def test_download_range(self):
+        response = self.client.get(self.file_url, headers={"Range": "bytes=2-5"})
+
+        self.assertEqual(response.status_code, status.HTTP_206_PARTIAL_CONTENT)
+        self.assertEqual(response.getvalue(), b"2345")
+        self.assertEqual(response["Content-Range"], "bytes 2-5/10")
+        self.assertEqual(response["Content-Length"], "4")
+        self.assertEqual(response["Content-Type"], "application/octet-stream")
+
+    def test_download_suffix_range(self):
+        response = self.client.get(self.file_url, headers={"Range": "bytes=-3"})
+
+        self.assertEqual(response.status_code, status.HTTP_206_PARTIAL_CONTENT)
+        self.assertEqual(response.getvalue(), b"789")
+        self.assertEqual(response["Content-Range"], "bytes 7-9/10")
+
+    def test_download_range_not_satisfiable(self):
+        response = self.client.get(self.file_url, headers={"Range": "bytes=10-"})
+
+        self.assertEqual(
+            response.status_code, status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE
+        )
+        self.assertEqual(response["Content-Range"], "bytes */10")
+
+    def test_download_not_modified(self):
+        etag = self.client.get(self.file_url)["ETag"]
+
+        response = self.client.get(self.file_url, headers={"If-None-Match": etag})
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response["ETag"], etag)
+
+    def test_download_range_changed(self):
+        response = self.client.get(
+            self.file_url, headers={"Range": "bytes=2-5", "If-Range": '"other"'}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.getvalue(), b"0123456789")
+
+    def test_download_new_version_etag(self):
+        etag = self.client.get(self.file_url)["ETag"]
+        EnkelvoudigInformatieObjectFactory.create(
+            canonical=self.eio.canonical,
+            uuid=self.eio.uuid,
+            versie=2,
+            inhoud__data=b"other",
+        )
+
+        response = self.client.get(self.file_url, headers={"If-None-Match": etag})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.getvalue(), b"other")
+        self.assertNotEqual(response["ETag"], etag)
+
+    @override_settings(SENDFILE_BACKEND="django_sendfile.backends.nginx")
+    def test_download_nginx(self):
+        response = self.client.get(self.file_url, headers={"Range": "bytes=2-5"})
+
+        # the web server handles the range
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn("X-Accel-Redirect", response)
+        etag = response["ETag"]
+
+        response = self.client.get(self.file_url, headers={"If-None-Match": etag})
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertNotIn("X-Accel-Redirect", response)
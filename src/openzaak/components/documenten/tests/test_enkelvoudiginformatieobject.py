@@ -1040,6 +1040,28 @@ class EnkelvoudigInformatieObjectPaginationAPITests(JWTAuthMixin, APITestCase):
             data["next"], f"http://testserver{self.list_url}?page=2&pageSize=5"
         )
 
+    def test_pagination_cursor_param(self):
+        eios = EnkelvoudigInformatieObjectFactory.create_batch(5)
+        # only the latest version of each document is listed
+        for eio in eios:
+            EnkelvoudigInformatieObjectFactory.create(canonical=eio.canonical, versie=2)
+
+        urls = []
+        next_url = f"http://testserver{self.list_url}?cursor=&pageSize=2"
+        while next_url:
+            response = self.client.get(next_url)
+
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+            data = response.json()
+            self.assertEqual(data["count"], 5)
+            self.assertTrue(all(result["versie"] == 2 for result in data["results"]))
+            urls += [result["url"] for result in data["results"]]
+            next_url = data["next"]
+
+        self.assertEqual(len(urls), 5)
+        self.assertEqual(len(set(urls)), 5)
+
 
 @tag("external-urls")
 @temp_private_root()
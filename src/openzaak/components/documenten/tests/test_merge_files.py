@@ -0,0 +1,123 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+import errno
+import os
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import FileSystemStorage
+from django.test import SimpleTestCase, TestCase
+
+from privates.test import temp_private_root
+
+from ..api.utils import merge_files
+from ..models import BestandsDeel
+from .factories import BestandsDeelFactory, EnkelvoudigInformatieObjectFactory
+
+
+class MergeFilesTests(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+
+        tempdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tempdir.cleanup)
+        self.root = Path(tempdir.name)
+        self.storage = FileSystemStorage(location=self.root / "storage")
+
+        self.part_paths = []
+        for i, content in enumerate([b"1234", b"5678", b"9"]):
+            part_path = self.root / f"part{i}"
+            part_path.write_bytes(content)
+            self.part_paths.append(str(part_path))
+
+    def assertMerged(self, name: str):
+        self.assertEqual(Path(self.storage.path(name)).read_bytes(), b"123456789")
+        # the temporary file is moved into place
+        self.assertEqual(
+            os.listdir(Path(self.storage.path(name)).parent), [Path(name).name]
+        )
+
+    def test_merge_files(self):
+        name = merge_files(self.part_paths, self.storage, "uploads/2026/10/file.bin")
+
+        self.assertEqual(name, "uploads/2026/10/file.bin")
+        self.assertMerged(name)
+
+    def test_merge_files_existing_name(self):
+        self.storage.save("uploads/file.bin", ContentFile(b"1234"))
+
+        name = merge_files(self.part_paths, self.storage, "uploads/file.bin")
+
+        self.assertNotEqual(name, "uploads/file.bin")
+        self.assertEqual(Path(self.storage.path(name)).read_bytes(), b"123456789")
+        self.assertEqual(
+            Path(self.storage.path("uploads/file.bin")).read_bytes(), b"1234"
+        )
+
+    def test_merge_files_without_kernel_copy(self):
+        error = OSError(errno.EXDEV, "Invalid cross-device link")
+
+        with (
+            patch("os.copy_file_range", side_effect=error, create=True),
+            patch("os.sendfile", side_effect=error, create=True),
+        ):
+            name = merge_files(self.part_paths, self.storage, "file.bin")
+
+        self.assertMerged(name)
+
+    def test_merge_files_without_hard_links(self):
+        self.storage.save("uploads/file.bin", ContentFile(b"1234"))
+
+        with patch("os.link", side_effect=OSError(errno.EPERM, "Not permitted")):
+            name = merge_files(self.part_paths, self.storage, "uploads/file.bin")
+
+        self.assertNotEqual(name, "uploads/file.bin")
+        self.assertEqual(Path(self.storage.path(name)).read_bytes(), b"123456789")
+        # the existing file is not overwritten
+        self.assertEqual(
+            Path(self.storage.path("uploads/file.bin")).read_bytes(), b"1234"
+        )
+        self.assertEqual(
+            sorted(os.listdir(self.root / "storage" / "uploads")),
+            sorted(["file.bin", Path(name).name]),
+        )
+
+    def test_merge_files_link_error(self):
+        with (
+            patch("os.link", side_effect=OSError(errno.ENOSPC, "No space left")),
+            self.assertRaises(OSError),
+        ):
+            merge_files(self.part_paths, self.storage, "uploads/file.bin")
+
+        self.assertEqual(os.listdir(self.root / "storage" / "uploads"), [])
+
+
+@temp_private_root()
+class WipeBestandsDelenTests(TestCase):
+    def test_wipe(self):
+        eio = EnkelvoudigInformatieObjectFactory.create()
+        parts = BestandsDeelFactory.create_batch(3, informatieobject=eio.canonical)
+        BestandsDeelFactory.create(
+            informatieobject=eio.canonical, inhoud=None, omvang=9
+        )
+        paths = [part.inhoud.path for part in parts]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            BestandsDeel.objects.filter(informatieobject=eio.canonical).wipe()
+
+        self.assertFalse(BestandsDeel.objects.exists())
+        for path in paths:
+            self.assertFalse(os.path.exists(path))
+
+    def test_wipe_files_kept_until_commit(self):
+        eio = EnkelvoudigInformatieObjectFactory.create()
+        part = BestandsDeelFactory.create(informatieobject=eio.canonical)
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            BestandsDeel.objects.filter(informatieobject=eio.canonical).wipe()
+
+        self.assertFalse(BestandsDeel.objects.exists())
+        self.assertTrue(os.path.exists(part.inhoud.path))
+        self.assertEqual(len(callbacks), 1)
@@ -10,7 +10,10 @@ from rest_framework.test import APITestCase
 from vng_api_common.tests import reverse, reverse_lazy
 
 from openzaak.components.catalogi.tests.factories import InformatieObjectTypeFactory
-from openzaak.components.documenten.api.utils import generate_document_identificatie
+from openzaak.components.documenten.api.utils import (
+    generate_document_identificatie,
+    reserve_document_identificaties,
+)
 from openzaak.components.documenten.models import (
     EnkelvoudigInformatieObject,
     ReservedDocument,
@@ -275,3 +278,21 @@ class EnkelvoudigInformatieObjectTests(JWTAuthMixin, APITestCase):
                 bronorganisatie=self.bronorganisatie,
             ).exists()
         )
+
+    @freeze_time("2025-01-01")
+    def test_generate_identificatie_excludes_reserved_range(self):
+        ReservedDocument.objects.create(
+            identificatie="DOCUMENT-2025-0000000001",
+            bronorganisatie="123456782",
+        )
+
+        # the range skips the reservations of all bronorganisaties
+        first_identificatie = reserve_document_identificaties(date.today(), 3)
+
+        self.assertEqual(first_identificatie, "DOCUMENT-2025-0000000002")
+        self.assertEqual(
+            generate_document_identificatie(
+                bronorganisatie=self.bronorganisatie, date_value=date.today()
+            ),
+            "DOCUMENT-2025-0000000005",
+        )
@@ -2,10 +2,13 @@
 # Copyright (C) 2022 Dimpact
 import uuid
 from base64 import b64encode
+from datetime import timedelta
+from unittest.mock import patch
 
 from django.conf import settings
 from django.core.files.uploadedfile import SimpleUploadedFile
 from django.test import override_settings
+from django.utils import timezone
 
 from privates.test import temp_private_root
 from rest_framework import status
@@ -24,7 +27,10 @@ from ..api.scopes import (
     SCOPE_DOCUMENTEN_GEFORCEERD_UNLOCK,
     SCOPE_DOCUMENTEN_LOCK,
 )
-from ..models import EnkelvoudigInformatieObject
+from ..api.utils import merge_bestandsdelen
+from ..constants import AssemblyStatus
+from ..models import DocumentAssembly, EnkelvoudigInformatieObject
+from ..tasks import assemble_document, requeue_stale_assemblies, retry_assemblies
 from .factories import EnkelvoudigInformatieObjectFactory
 from .utils import get_operation_url, split_file
 
@@ -674,6 +680,217 @@ class LargeFileAPITests(JWTAuthMixin, APITestCase):
         self._unlock()
         self._download_file()
 
+    @override_settings(DOCUMENTEN_UPLOAD_ASYNC_ASSEMBLY=True)
+    @patch("openzaak.components.documenten.api.viewsets.assemble_document")
+    def test_create_eio_full_process_async_assembly(self, mock_assemble_document):
+        """
+        Test the create process of the documents with part files, merged by a
+        background task
+
+        Expected result:
+        * unlocking the document only schedules the merge of the part files
+        * the file can't be downloaded or locked until the merge is finished
+        """
+        self._create_metadata()
+        self._upload_part_files()
+
+        unlock_url = get_operation_url(
+            "enkelvoudiginformatieobject_unlock", uuid=self.eio.uuid
+        )
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(unlock_url, {"lock": self.canonical.lock})
+
+        self.assertEqual(
+            response.status_code, status.HTTP_204_NO_CONTENT, response.data
+        )
+
+        assembly = DocumentAssembly.objects.get(informatieobject=self.canonical)
+        mock_assemble_document.delay.assert_called_once_with(assembly.pk)
+        self.assertEqual(assembly.status, AssemblyStatus.pending)
+        self.assertEqual(assembly.total, 2)
+        self.assertEqual(self.canonical.bestandsdelen.count(), 2)
+
+        with self.subTest("read while assembling"):
+            eio_url = get_operation_url(
+                "enkelvoudiginformatieobject_read", uuid=self.eio.uuid
+            )
+
+            response = self.client.get(eio_url)
+
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertIsNone(response.json()["inhoud"])
+            self.assertFalse(response.json()["locked"])
+
+        with self.subTest("download while assembling"):
+            file_url = get_operation_url(
+                "enkelvoudiginformatieobject_download", uuid=self.eio.uuid
+            )
+
+            response = self.client.get(file_url)
+
+            self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+            self.assertEqual(response.json()["code"], "being-assembled")
+
+        with self.subTest("lock while assembling"):
+            lock_url = get_operation_url(
+                "enkelvoudiginformatieobject_lock", uuid=self.eio.uuid
+            )
+
+            response = self.client.post(lock_url)
+
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+            error = get_validation_errors(response, "nonFieldErrors")
+            self.assertEqual(error["code"], "being-assembled")
+
+        assemble_document(assembly.pk)
+
+        assembly.refresh_from_db()
+        self.eio.refresh_from_db()
+
+        self.assertEqual(assembly.status, AssemblyStatus.finished)
+        self.assertEqual(assembly.processed, 2)
+        self.assertIsNotNone(assembly.finished_on)
+        self.assertEqual(self.canonical.bestandsdelen.count(), 0)
+        self.assertEqual(self.eio.inhoud.size, self.file_content.size)
+        self._download_file()
+
+    @override_settings(DOCUMENTEN_UPLOAD_ASYNC_ASSEMBLY=True)
+    @patch("openzaak.components.documenten.api.viewsets.assemble_document")
+    def test_async_assembly_error(self, mock_assemble_document):
+        self._create_metadata()
+        self._upload_part_files()
+
+        unlock_url = get_operation_url(
+            "enkelvoudiginformatieobject_unlock", uuid=self.eio.uuid
+        )
+        response = self.client.post(unlock_url, {"lock": self.canonical.lock})
+
+        self.assertEqual(
+            response.status_code, status.HTTP_204_NO_CONTENT, response.data
+        )
+
+        assembly = DocumentAssembly.objects.get(informatieobject=self.canonical)
+        # a part file that went missing makes the merge fail
+        part = self.bestandsdelen[1]
+        part.refresh_from_db()
+        part.inhoud.storage.delete(part.inhoud.name)
+
+        assemble_document(assembly.pk)
+
+        assembly.refresh_from_db()
+        self.eio.refresh_from_db()
+
+        self.assertEqual(assembly.status, AssemblyStatus.error)
+        self.assertNotEqual(assembly.comment, "")
+        self.assertEqual(self.eio.inhoud, "")
+        # the part files are kept, so the assembly can be started again
+        self.assertEqual(self.canonical.bestandsdelen.count(), 2)
+
+        # the assembly is only processed once
+        assemble_document(assembly.pk)
+
+        assembly.refresh_from_db()
+        self.assertEqual(assembly.status, AssemblyStatus.error)
+
+        with self.subTest("download after the error"):
+            file_url = get_operation_url(
+                "enkelvoudiginformatieobject_download", uuid=self.eio.uuid
+            )
+
+            response = self.client.get(file_url)
+
+            self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+            self.assertEqual(response.json()["code"], "assembly-failed")
+
+        with self.subTest("retry"):
+            with (
+                patch.object(assemble_document, "delay") as mock_delay,
+                self.captureOnCommitCallbacks(execute=True),
+            ):
+                retry_assemblies(DocumentAssembly.objects.filter(pk=assembly.pk))
+
+            assembly.refresh_from_db()
+            self.assertEqual(assembly.status, AssemblyStatus.pending)
+            mock_delay.assert_called_once_with(assembly.pk)
+
+    @override_settings(DOCUMENTEN_UPLOAD_ASYNC_ASSEMBLY=True)
+    @patch("openzaak.components.documenten.api.viewsets.assemble_document")
+    def test_async_assembly_claimed_again(self, mock_assemble_document):
+        self._create_metadata()
+        self._upload_part_files()
+
+        unlock_url = get_operation_url(
+            "enkelvoudiginformatieobject_unlock", uuid=self.eio.uuid
+        )
+        response = self.client.post(unlock_url, {"lock": self.canonical.lock})
+
+        self.assertEqual(
+            response.status_code, status.HTTP_204_NO_CONTENT, response.data
+        )
+
+        assembly = DocumentAssembly.objects.get(informatieobject=self.canonical)
+
+        def merge_and_requeue(*args, **kwargs):
+            merge_bestandsdelen(*args, **kwargs)
+            # the assembly got stale and is started again by another task
+            with patch.object(assemble_document, "delay"):
+                retry_assemblies(DocumentAssembly.objects.filter(pk=assembly.pk))
+
+        with patch(
+            "openzaak.components.documenten.tasks.merge_bestandsdelen",
+            side_effect=merge_and_requeue,
+        ):
+            assemble_document(assembly.pk)
+
+        assembly.refresh_from_db()
+        self.eio.refresh_from_db()
+
+        # the task which claimed the assembly again finishes it
+        self.assertEqual(assembly.status, AssemblyStatus.pending)
+        self.assertEqual(self.eio.inhoud, "")
+        self.assertEqual(self.canonical.bestandsdelen.count(), 2)
+
+        assemble_document(assembly.pk)
+
+        assembly.refresh_from_db()
+        self.eio.refresh_from_db()
+
+        self.assertEqual(assembly.status, AssemblyStatus.finished)
+        self.assertEqual(self.eio.inhoud.size, self.file_content.size)
+
+    def test_requeue_stale_assemblies(self):
+        eio = EnkelvoudigInformatieObjectFactory.create()
+        stale = DocumentAssembly.objects.create(
+            informatieobject=eio.canonical, status=AssemblyStatus.active, total=2
+        )
+        active = DocumentAssembly.objects.create(
+            informatieobject=EnkelvoudigInformatieObjectFactory.create().canonical,
+            status=AssemblyStatus.active,
+            total=2,
+        )
+        failed = DocumentAssembly.objects.create(
+            informatieobject=EnkelvoudigInformatieObjectFactory.create().canonical,
+            status=AssemblyStatus.error,
+            total=2,
+        )
+        DocumentAssembly.objects.filter(pk__in=[stale.pk, failed.pk]).update(
+            updated_on=timezone.now() - timedelta(hours=2)
+        )
+
+        with (
+            patch.object(assemble_document, "delay") as mock_delay,
+            self.captureOnCommitCallbacks(execute=True),
+        ):
+            requeue_stale_assemblies()
+
+        mock_delay.assert_called_once_with(stale.pk)
+        stale.refresh_from_db()
+        active.refresh_from_db()
+        failed.refresh_from_db()
+        self.assertEqual(stale.status, AssemblyStatus.pending)
+        self.assertEqual(active.status, AssemblyStatus.active)
+        self.assertEqual(failed.status, AssemblyStatus.error)
+
     def test_upload_part_wrong_size(self):
         """
         Test the upload of the incorrect part file
@@ -1033,7 +1250,14 @@ class LargeFileAPITests(JWTAuthMixin, APITestCase):
         new_version = self.canonical.latest_version
 
         self.assertEqual(new_version.bestandsomvang, 45)
-        self.assertEqual(self.canonical.bestandsdelen.count(), 5)
+        self.assertEqual(
+            list(
+                self.canonical.bestandsdelen.order_by("volgnummer").values_list(
+                    "volgnummer", "omvang"
+                )
+            ),
+            [(1, 10), (2, 10), (3, 10), (4, 10), (5, 5)],
+        )
         self.assertEqual(data["inhoud"], None)
 
     def test_update_metadata_set_size_zero(self):
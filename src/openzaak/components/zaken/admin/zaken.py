@@ -693,7 +693,11 @@ class ZaakAdmin(
         "get_resultaat",
         "archiefstatus",
     )
-    list_select_related = ("_zaaktype", "_zaaktype_base_url")
+    list_select_related = (
+        "_zaaktype",
+        "_zaaktype_base_url",
+        "current_status___statustype",
+    )
     search_fields = (
         "identificatie",
         "uuid",
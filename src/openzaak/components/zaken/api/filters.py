@@ -5,7 +5,6 @@ from urllib.parse import urlparse
 from django.core.exceptions import ObjectDoesNotExist
 from django.core.validators import URLValidator
 from django.db import models
-from django.db.models import OuterRef, Subquery
 from django.urls.exceptions import Resolver404
 from django.utils.translation import gettext_lazy as _
 
@@ -172,6 +171,7 @@ class ZaakFilter(FilterSetWithGroups):
 
     maximale_vertrouwelijkheidaanduiding = MaximaleVertrouwelijkheidaanduidingFilter(
         field_name="vertrouwelijkheidaanduiding",
+        order_field_name="va_order",
         help_text=(
             "Zaken met een vertrouwelijkheidaanduiding die beperkter is dan de "
             "aangegeven aanduiding worden uit de resultaten gefiltered."
@@ -335,17 +335,7 @@ class ZaakFilter(FilterSetWithGroups):
         except (ObjectDoesNotExist, Resolver404):
             return queryset.none()
 
-        statustype_id = resource.id
-
-        latest_status_subquery = (
-            Status.objects.filter(zaak=OuterRef("pk"))
-            .order_by("-datum_status_gezet", "-pk")
-            .values("_statustype_id")[:1]
-        )
-
-        return queryset.annotate(
-            latest_statustype_id=Subquery(latest_status_subquery)
-        ).filter(latest_statustype_id=statustype_id)
+        return queryset.filter(current_status___statustype_id=resource.id)
 
     def filter_resultaattype_url(self, queryset, name, value):
         parsed = urlparse(value)
@@ -474,14 +464,10 @@ class StatusFilter(FilterSet):
 
     def filter_is_last_status(self, queryset, name, value):
         if value is True:
-            return queryset.filter(
-                datum_status_gezet=models.F("max_datum_status_gezet")
-            )
+            return queryset.filter(zaak__current_status=models.F("pk"))
 
         if value is False:
-            return queryset.exclude(
-                datum_status_gezet=models.F("max_datum_status_gezet")
-            )
+            return queryset.exclude(zaak__current_status=models.F("pk"))
 
         return queryset.none()
 
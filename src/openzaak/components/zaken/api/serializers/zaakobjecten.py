@@ -92,6 +92,36 @@ class ObjectTypeOverigeDefinitieSerializer(serializers.Serializer):
     )
 
 
+class ZaakObjectListSerializer(serializers.ListSerializer):
+    @transaction.atomic
+    def create(self, validated_data):
+        """
+        ⚡️ Create the zaakobjecten with a bulk insert.
+
+        The object identificaties are nested objects, which are still created per
+        zaakobject.
+        """
+        zaakobjecten = []
+        identificaties = []
+        for attrs in validated_data:
+            attrs = attrs.copy()
+            group_data = attrs.pop("object_identificatie", None)
+
+            zaakobject = ZaakObject(**attrs)
+            zaakobjecten.append(zaakobject)
+            if group_data:
+                identificaties.append((zaakobject, group_data))
+
+        ZaakObject.objects.bulk_create(zaakobjecten)
+
+        for zaakobject, group_data in identificaties:
+            group_serializer = self.child.discriminator.mapping[zaakobject.object_type]
+            serializer = group_serializer.get_fields()["object_identificatie"]
+            serializer.create(group_data | {"zaakobject": zaakobject})
+
+        return zaakobjecten
+
+
 class ZaakObjectSerializer(PolymorphicSerializer):
     discriminator = Discriminator(
         discriminator_field="object_type",
@@ -202,6 +232,7 @@ class ZaakObjectSerializer(PolymorphicSerializer):
             ZaakArchiefStatusValidator(),
             CorrectZaaktypeValidator("zaakobjecttype"),
         ]
+        list_serializer_class = ZaakObjectListSerializer
 
     def get_fields(self):
         fields = super().get_fields()
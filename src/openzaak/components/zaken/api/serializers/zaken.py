@@ -1,7 +1,8 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2019 - 2022 Dimpact
+from collections import Counter
 from datetime import date
-from typing import Optional
+from typing import Callable, Optional
 from uuid import UUID
 
 from django.conf import settings
@@ -28,6 +29,7 @@ from django_loose_fk.virtual_models import ProxyMixin
 from drf_writable_nested import NestedCreateMixin, NestedUpdateMixin
 from rest_framework import serializers
 from rest_framework.exceptions import ErrorDetail
+from rest_framework.settings import api_settings
 from rest_framework_gis.fields import GeometryField
 from rest_framework_nested.serializers import NestedHyperlinkedModelSerializer
 from vng_api_common.caching.etags import track_object_serializer
@@ -45,7 +47,6 @@ from vng_api_common.polymorphism import Discriminator, PolymorphicSerializer
 from vng_api_common.serializers import (
     CachedHyperlinkedIdentityField,
     CachedHyperlinkedRelatedField,
-    CachedNestedHyperlinkedRelatedField,
     GegevensGroepSerializer,
     NestedGegevensGroepMixin,
     add_choice_values_help_text,
@@ -64,7 +65,11 @@ from openzaak.utils.api import (
 from openzaak.utils.auth import get_auth
 from openzaak.utils.exceptions import DetermineProcessEndDateException
 from openzaak.utils.help_text import mark_experimental
-from openzaak.utils.serializer_fields import FKOrServiceUrlField
+from openzaak.utils.serializer_fields import (
+    FKOrServiceUrlField,
+    PrefetchedHyperlinkedRelatedField,
+    PrefetchedNestedHyperlinkedRelatedField,
+)
 from openzaak.utils.serializers import (
     ConvenienceSerializer,
     ReadOnlyMixin,
@@ -277,7 +282,7 @@ class ZaakSerializer(
     serializers.HyperlinkedModelSerializer,
 ):
     url = CachedHyperlinkedIdentityField(view_name="zaak-detail", lookup_field="uuid")
-    eigenschappen = CachedNestedHyperlinkedRelatedField(
+    eigenschappen = PrefetchedNestedHyperlinkedRelatedField(
         many=True,
         read_only=True,
         lookup_field="uuid",
@@ -286,7 +291,7 @@ class ZaakSerializer(
         source="zaakeigenschap_set",
         help_text=_("URL-referenties naar ZAAK-EIGENSCHAPPen."),
     )
-    rollen = CachedHyperlinkedRelatedField(
+    rollen = PrefetchedHyperlinkedRelatedField(
         many=True,
         read_only=True,
         lookup_field="uuid",
@@ -302,7 +307,7 @@ class ZaakSerializer(
         lookup_field="uuid",
         help_text=_("Indien geen status bekend is, dan is de waarde 'null'"),
     )
-    zaakinformatieobjecten = CachedHyperlinkedRelatedField(
+    zaakinformatieobjecten = PrefetchedHyperlinkedRelatedField(
         many=True,
         read_only=True,
         lookup_field="uuid",
@@ -310,7 +315,7 @@ class ZaakSerializer(
         source="zaakinformatieobject_set",
         help_text=_("URL-referenties naar ZAAKINFORMATIEOBJECTen."),
     )
-    zaakobjecten = CachedHyperlinkedRelatedField(
+    zaakobjecten = PrefetchedHyperlinkedRelatedField(
         many=True,
         read_only=True,
         lookup_field="uuid",
@@ -349,7 +354,7 @@ class ZaakSerializer(
         ),
     )
 
-    deelzaken = CachedHyperlinkedRelatedField(
+    deelzaken = PrefetchedHyperlinkedRelatedField(
         read_only=True,
         many=True,
         view_name="zaak-detail",
@@ -650,8 +655,6 @@ class ZaakSerializer(
         # ⚡️ - a just created zaak cannot have a result, so we can avoid this DB query
         # by assigning the descriptor already
         obj.resultaat = None
-        # ⚡️ - avoid status query for just created zaak
-        obj.current_status_uuid = None
 
         # ⚡️ - on create, we _know_ that there are no existing relations yet (i.e.
         # objects that are related TO the zaak being created), so we can avoid doing
@@ -1058,16 +1061,38 @@ class SubStatusSerializer(serializers.HyperlinkedModelSerializer):
         status = validated_data.get("status")
 
         if not status:
-            # FIXME for some reason, `zaak.status_set` is not ordered by
-            # `-datum_status_gezet` here
-            validated_data["status"] = zaak.status_set.order_by(
-                "-datum_status_gezet"
-            ).first()
+            validated_data["status"] = zaak.current_status
 
         obj = super().create(validated_data)
         return obj
 
 
+class ZaakInformatieObjectListSerializer(serializers.ListSerializer):
+    def create(self, validated_data):
+        """
+        ⚡️ Create the ZIOs of local documents (and their OIOs) with bulk inserts.
+
+        The ZIOs of remote documents are created one by one, since the remote
+        relation can only be created after the ZIO has been saved.
+        """
+        zios = [ZaakInformatieObject(**attrs) for attrs in validated_data]
+        ZaakInformatieObject.objects.trusted_bulk_create(
+            [zio for zio in zios if zio.informatieobject.pk]
+        )
+
+        for zio, data in zip(zios, self.initial_data):
+            if zio.pk:
+                continue
+
+            with transaction.atomic():
+                zio.save()
+            self.child.create_remote_relation(
+                zio, data["informatieobject"], data["zaak"]
+            )
+
+        return zios
+
+
 class ZaakInformatieObjectSerializer(serializers.HyperlinkedModelSerializer):
     aard_relatie_weergave = serializers.ChoiceField(
         source="get_aard_relatie_display",
@@ -1108,6 +1133,7 @@ class ZaakInformatieObjectSerializer(serializers.HyperlinkedModelSerializer):
             ObjecttypeInformatieobjecttypeRelationValidator(),
             ZaakArchiefStatusValidator(),
         ]
+        list_serializer_class = ZaakInformatieObjectListSerializer
         extra_kwargs = {
             "url": {"lookup_field": "uuid"},
             "uuid": {"read_only": True},
@@ -1136,9 +1162,16 @@ class ZaakInformatieObjectSerializer(serializers.HyperlinkedModelSerializer):
             return zio
 
         # we know that we got valid URLs in the initial data
-        io_url = self.initial_data["informatieobject"]
-        zaak_url = self.initial_data["zaak"]
+        return self.create_remote_relation(
+            zio, self.initial_data["informatieobject"], self.initial_data["zaak"]
+        )
 
+    def create_remote_relation(
+        self, zio: ZaakInformatieObject, io_url: str, zaak_url: str
+    ) -> ZaakInformatieObject:
+        """
+        Create the ObjectInformatieObject for a ZIO in the remote documents API.
+        """
         # manual transaction management - documents API checks that the ZIO
         # exists, so that transaction must be committed.
         # If it fails in any other way, we need to handle that by rolling back
@@ -1255,6 +1288,44 @@ class ContactPersoonRolSerializer(GegevensGroepSerializer):
         gegevensgroep = "contactpersoon_rol"
 
 
+class RolListSerializer(serializers.ListSerializer):
+    @transaction.atomic
+    def create(self, validated_data):
+        """
+        ⚡️ Create the rollen with a bulk insert.
+
+        The betrokkene identificaties are nested objects, which are still created per
+        rol.
+        """
+        rollen = []
+        identificaties = []
+        for attrs in validated_data:
+            attrs = attrs.copy()
+            group_data = attrs.pop("betrokkene_identificatie", None)
+            contactpersoon_rol = attrs.pop("contactpersoon_rol", None)
+
+            rol = Rol(**attrs)
+            # normally done by `Rol.save`
+            rol._derive_roltype_attributes()
+            if contactpersoon_rol:
+                rol.contactpersoon_rol = contactpersoon_rol
+
+            rollen.append(rol)
+            if group_data:
+                identificaties.append((rol, group_data))
+
+        Rol.objects.bulk_create(rollen)
+
+        for rol, group_data in identificaties:
+            discriminated_serializer = self.child.discriminator.mapping[
+                rol.betrokkene_type
+            ]
+            serializer = discriminated_serializer.fields["betrokkene_identificatie"]
+            serializer.create(group_data | {"rol": rol})
+
+        return rollen
+
+
 class RolSerializer(PolymorphicSerializer):
     discriminator = Discriminator(
         discriminator_field="betrokkene_type",
@@ -1305,6 +1376,7 @@ class RolSerializer(PolymorphicSerializer):
             ZaakArchiefStatusValidator(),
             RolIndicatieMachtigingValidator(),
         ]
+        list_serializer_class = RolListSerializer
         extra_kwargs = {
             "url": {"lookup_field": "uuid"},
             "uuid": {"read_only": True},
@@ -1662,6 +1734,82 @@ class ZaakRegistrerenSerializer(ConvenienceSerializer):
 
         return context
 
+    def _create_batch(
+        self,
+        field: str,
+        serializer_class: type[serializers.Serializer],
+        zaak_data: dict,
+        get_batch_errors: Optional[Callable[[list, list], dict[int, dict]]] = None,
+    ) -> list:
+        """
+        ⚡️ Validate and create all items of a nested list in one pass.
+
+        The items share the serializer context, so the resources they refer to are
+        resolved once. As before, the errors of the first invalid item are returned.
+
+        :param get_batch_errors: returns the errors per index of the validations that
+          depend on the other items, which are not in the database yet.
+        """
+        items = self.initial_data.get(field) or []
+        if not items:
+            return []
+
+        serializer = serializer_class(
+            data=[item | zaak_data for item in items], many=True, context=self.context
+        )
+        serializer.is_valid()
+        if isinstance(serializer.errors, dict):
+            self._handle_errors(**{field: serializer.errors})
+
+        errors = dict(enumerate(serializer.errors))
+        if not any(errors.values()) and get_batch_errors:
+            errors = get_batch_errors(items, serializer.validated_data)
+
+        for index, item_errors in sorted(errors.items()):
+            self._handle_errors(index=index, **{field: item_errors})
+
+        return serializer.save()
+
+    @staticmethod
+    def _get_rol_occurence_errors(items: list, rollen: list) -> dict[int, dict]:
+        occurences = Counter()
+        errors = {}
+        for index, attrs in enumerate(rollen):
+            omschrijving_generiek = attrs["omschrijving_generiek"]
+            for validator in RolSerializer.Meta.validators:
+                if (
+                    not isinstance(validator, RolOccurenceValidator)
+                    or validator.omschrijving_generiek != omschrijving_generiek
+                ):
+                    continue
+
+                if occurences[omschrijving_generiek] >= validator.max_amount:
+                    message = validator.message.format(
+                        num=occurences[omschrijving_generiek],
+                        value=omschrijving_generiek,
+                    )
+                    errors[index] = serializers.ValidationError(
+                        {"roltype": message}, code="max-occurences"
+                    ).detail
+
+            occurences[omschrijving_generiek] += 1
+        return errors
+
+    @staticmethod
+    def _get_duplicate_zio_errors(items: list, zios: list) -> dict[int, dict]:
+        seen = set()
+        errors = {}
+        for index, item in enumerate(items):
+            if item["informatieobject"] in seen:
+                message = UniqueTogetherValidator.message.format(
+                    field_names="zaak, informatieobject"
+                )
+                errors[index] = serializers.ValidationError(
+                    {api_settings.NON_FIELD_ERRORS_KEY: message}, code="unique"
+                ).detail
+            seen.add(item["informatieobject"])
+        return errors
+
     @transaction.atomic
     def create(self, validated_data):
         zaak_serializer = ZaakSerializer(
@@ -1681,30 +1829,18 @@ class ZaakRegistrerenSerializer(ConvenienceSerializer):
         self._handle_errors(status=status_serializer.errors)
         status = status_serializer.save()
 
-        rollen = []
-        for i, rol in enumerate(self.initial_data.get("rollen") or []):
-            rol_serializer = RolSerializer(data=rol | zaak_data, context=self.context)
-            rol_serializer.is_valid()
-            self._handle_errors(index=i, rollen=rol_serializer.errors)
-            rollen.append(rol_serializer.save())
-
-        zios = []
-        for i, zio in enumerate(self.initial_data.get("zaakinformatieobjecten") or []):
-            zio_serializer = ZaakInformatieObjectSerializer(
-                data=zio | zaak_data, context=self.context
-            )
-            zio_serializer.is_valid()
-            self._handle_errors(index=i, zaakinformatieobjecten=zio_serializer.errors)
-            zios.append(zio_serializer.save())
-
-        zaakobjecten = []
-        for i, zaakobject in enumerate(self.initial_data.get("zaakobjecten") or []):
-            zaakobject_serializer = ZaakObjectSerializer(
-                data=zaakobject | zaak_data, context=self.context
-            )
-            zaakobject_serializer.is_valid()
-            self._handle_errors(index=i, zaakobjecten=zaakobject_serializer.errors)
-            zaakobjecten.append(zaakobject_serializer.save())
+        rollen = self._create_batch(
+            "rollen", RolSerializer, zaak_data, self._get_rol_occurence_errors
+        )
+        zios = self._create_batch(
+            "zaakinformatieobjecten",
+            ZaakInformatieObjectSerializer,
+            zaak_data,
+            self._get_duplicate_zio_errors,
+        )
+        zaakobjecten = self._create_batch(
+            "zaakobjecten", ZaakObjectSerializer, zaak_data
+        )
 
         # statusSerializer changes zaak fields when closing or reopening
         zaak.refresh_from_db()
@@ -33,7 +33,7 @@ from openzaak.utils.serializers import get_from_serializer_data_or_instance
 
 from ...catalogi.models import StatusType
 from ..constants import AardZaakRelatie, IndicatieMachtiging
-from ..models import Status, Zaak
+from ..models import Zaak
 
 logger = structlog.stdlib.get_logger(__name__)
 
@@ -359,19 +359,12 @@ class EndStatusDeelZakenValidator:
             .values("statustypevolgnummer")[:1]
         )
 
-        current_status_volgnummer = (
-            Status.objects.filter(zaak=OuterRef("pk"))
-            .order_by("-datum_status_gezet")
-            .select_related("statustype")
-            .values("_statustype__statustypevolgnummer")[:1]
-        )
-
         qs = qs.annotate(
             eind_statustype_max=Subquery(
                 eind_statustypevolgnummer, output_field=IntegerField()
             ),
-            current_status_volgnummer=Subquery(
-                current_status_volgnummer, output_field=IntegerField()
+            current_status_volgnummer=F(
+                "current_status___statustype__statustypevolgnummer"
             ),
         ).exclude(current_status_volgnummer=F("eind_statustype_max"))
 
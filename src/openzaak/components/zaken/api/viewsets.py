@@ -30,12 +30,6 @@ from rest_framework.pagination import PageNumberPagination
 from rest_framework.response import Response
 from rest_framework.reverse import reverse
 from rest_framework.settings import api_settings
-from vng_api_common.audittrails.viewsets import (
-    AuditTrailCreateMixin,
-    AuditTrailDestroyMixin,
-    AuditTrailMixin,
-    AuditTrailViewsetMixin,
-)
 from vng_api_common.caching import conditional_retrieve
 from vng_api_common.client import to_internal_data
 from vng_api_common.constants import CommonResourceAction
@@ -47,6 +41,7 @@ from vng_api_common.utils import lookup_kwargs_to_filters
 from vng_api_common.viewsets import CheckQueryParamsMixin, NestedViewSetMixin
 
 from openzaak.client import get_client
+from openzaak.components.documenten.models import prefetch_latest_version
 from openzaak.notifications.viewsets import MultipleNotificationMixin
 from openzaak.utils import get_loose_fk_object_url
 from openzaak.utils.api import (
@@ -54,14 +49,21 @@ from openzaak.utils.api import (
     delete_remote_objectverzoek,
     delete_remote_oio,
 )
+from openzaak.utils.audittrails import (
+    AuditTrailCreateMixin,
+    AuditTrailDestroyMixin,
+    AuditTrailMixin,
+    AuditTrailViewsetMixin,
+)
 from openzaak.utils.data_filtering import ListFilterByAuthorizationsMixin
 from openzaak.utils.help_text import mark_experimental
 from openzaak.utils.mixins import (
     CacheQuerysetMixin,
     ExpandMixin,
 )
-from openzaak.utils.pagination import OptimizedPagination
+from openzaak.utils.pagination import OptimizedCursorPagination, OptimizedPagination
 from openzaak.utils.permissions import AuthRequired
+from openzaak.utils.query import prefetch_related_values
 from openzaak.utils.schema import (
     COMMON_ERROR_RESPONSES,
     PRECONDITION_ERROR_RESPONSES,
@@ -289,34 +291,34 @@ class ZaakViewSet(
             # Prefetch _zaaktype instead of using `.select_related`, because using the latter
             # causes the main Zaak query to contain a lot of duplicate data, increasing overhead
             "_zaaktype",
-            "deelzaken",
             models.Prefetch(
                 "relevante_andere_zaken",
                 queryset=RelevanteZaakRelatie.objects.select_related("_relevant_zaak"),
             ),
             "zaakkenmerk_set",
             "resultaat",
-            "zaakeigenschap_set",
-            models.Prefetch(
-                "status_set",
-                queryset=Status.objects.order_by("-datum_status_gezet"),
-                # explicitly store result on this attribute, that way we can retrieve
-                # the first status by simple list indexing, which is faster than calling
-                # `.first()`, because the latter instantiates a new queryset
-                to_attr="prefetched_statuses",
-            ),
-            "rol_set",
-            "zaakinformatieobject_set",
-            "zaakobject_set",
+            # ⚡️ only the current status is needed, which is tracked on the zaak
+            # itself - there's no need to fetch the complete status history
+            "current_status",
         )
         .order_by("-pk")
         .distinct()
     )
+    # Relations that are only rendered as a list of URLs, mapped from serializer field
+    # to the reverse relation. ⚡️ In list mode, only their UUIDs are fetched (see
+    # `paginate_queryset`), unless they are expanded and the full objects are needed.
+    hyperlinked_relations = {
+        "deelzaken": "deelzaken",
+        "eigenschappen": "zaakeigenschap_set",
+        "rollen": "rol_set",
+        "zaakinformatieobjecten": "zaakinformatieobject_set",
+        "zaakobjecten": "zaakobject_set",
+    }
     serializer_class = ZaakSerializer
     search_input_serializer_class = ZaakZoekSerializer
     filter_backends = (Backend,)
     lookup_field = "uuid"
-    pagination_class = OptimizedPagination
+    pagination_class = OptimizedCursorPagination
 
     permission_classes = (ZaakAuthRequired,)
     required_scopes = {
@@ -343,6 +345,15 @@ class ZaakViewSet(
             # is needed, the queries will be done during serialization and the amount
             # of queries will be the same.
             qs = qs.prefetch_related(None)
+        else:
+            expanded = self._get_expanded_relations()
+            qs = qs.prefetch_related(
+                *[
+                    relation
+                    for field, relation in self.hyperlinked_relations.items()
+                    if field in expanded
+                ]
+            )
 
         if action not in ["list", "detail", "_zoek"]:
             # Catalogus is only relevant for notifications (to include the `zaaktype.catalogus`)
@@ -352,6 +363,26 @@ class ZaakViewSet(
 
         return qs
 
+    def _get_expanded_relations(self) -> set:
+        inclusions = self.get_requested_inclusions(self.request) or ""
+        return {path.split(".")[0] for path in inclusions.split(",") if path}
+
+    def paginate_queryset(self, queryset):
+        page = super().paginate_queryset(queryset)
+        if page is None:
+            return page
+
+        expanded = self._get_expanded_relations()
+        prefetch_related_values(
+            page,
+            {
+                relation: ("uuid",)
+                for field, relation in self.hyperlinked_relations.items()
+                if field not in expanded
+            },
+        )
+        return page
+
     @property
     def filterset_class(self):
         """
@@ -578,13 +609,12 @@ class StatusViewSet(
     queryset = (
         Status.objects.select_related("_statustype", "zaak", "gezetdoor")
         .prefetch_related("zaakinformatieobjecten")
-        .annotate_with_max_datum_status_gezet()
         .order_by("-datum_status_gezet", "-pk")
     )
     serializer_class = StatusSerializer
     filterset_class = StatusFilter
     lookup_field = "uuid"
-    pagination_class = OptimizedPagination
+    pagination_class = OptimizedCursorPagination
 
     permission_classes = (ZaakAuthRequired,)
     permission_main_object = "zaak"
@@ -924,7 +954,7 @@ class ZaakInformatieObjectViewSet(
 
     queryset = (
         ZaakInformatieObject.objects.select_related("zaak", "_informatieobject")
-        .prefetch_related("_informatieobject__enkelvoudiginformatieobject_set")
+        .prefetch_related(prefetch_latest_version("_informatieobject"))
         .order_by("-pk")
     )
     filterset_class = ZaakInformatieObjectFilter
@@ -1282,7 +1312,7 @@ class RolViewSet(
     serializer_class = RolSerializer
     filterset_class = RolFilter
     lookup_field = "uuid"
-    pagination_class = OptimizedPagination
+    pagination_class = OptimizedCursorPagination
 
     permission_classes = (ZaakAuthRequired,)
     permission_main_object = "zaak"
@@ -2063,6 +2093,7 @@ class ZaakRegistrerenViewset(
         return response
 
     def _create_audit_logs(self, response, serializer):
+        trails = []
         for field, sub_serializer in serializer.fields.items():
             is_many = getattr(sub_serializer, "many", False)
 
@@ -2078,17 +2109,21 @@ class ZaakRegistrerenViewset(
             basename = model._meta.model_name
 
             for i, data in enumerate(field_data):
-                self.create_audittrail(
-                    response.status_code,
-                    CommonResourceAction.create,
-                    version_before_edit=None,
-                    version_after_edit=data,
-                    unique_representation=instances[i].unique_representation(),
-                    audit=AUDIT_ZRC,
-                    basename=basename,
-                    main_object=serializer.data["zaak"]["url"],
+                trails.append(
+                    self.build_audittrail(
+                        response.status_code,
+                        CommonResourceAction.create,
+                        version_before_edit=None,
+                        version_after_edit=data,
+                        unique_representation=instances[i].unique_representation(),
+                        audit=AUDIT_ZRC,
+                        basename=basename,
+                        main_object=serializer.data["zaak"]["url"],
+                    )
                 )
 
+        self.create_audittrails(trails)
+
     def perform_create(self, serializer):
         serializer.save()
         logger.info(
@@ -2204,26 +2239,33 @@ class ZaakUpdateActionViewSet(
         return response
 
     def _create_audit_logs(self, response, serializer, zaak_version_before_edit):
-        self.create_audittrail(
-            response.status_code,
-            CommonResourceAction.partial_update,
-            version_before_edit=zaak_version_before_edit,
-            version_after_edit=serializer.data["zaak"],
-            unique_representation=serializer.instance["zaak"].unique_representation(),
-            audit=AUDIT_ZRC,
-            basename="zaak",
-            main_object=serializer.data["zaak"]["url"],
-        )
-
-        self.create_audittrail(
-            response.status_code,
-            CommonResourceAction.create,
-            version_before_edit=None,
-            version_after_edit=serializer.data["status"],
-            unique_representation=serializer.instance["status"].unique_representation(),
-            audit=AUDIT_ZRC,
-            basename="status",
-            main_object=serializer.data["zaak"]["url"],
+        self.create_audittrails(
+            [
+                self.build_audittrail(
+                    response.status_code,
+                    CommonResourceAction.partial_update,
+                    version_before_edit=zaak_version_before_edit,
+                    version_after_edit=serializer.data["zaak"],
+                    unique_representation=serializer.instance[
+                        "zaak"
+                    ].unique_representation(),
+                    audit=AUDIT_ZRC,
+                    basename="zaak",
+                    main_object=serializer.data["zaak"]["url"],
+                ),
+                self.build_audittrail(
+                    response.status_code,
+                    CommonResourceAction.create,
+                    version_before_edit=None,
+                    version_after_edit=serializer.data["status"],
+                    unique_representation=serializer.instance[
+                        "status"
+                    ].unique_representation(),
+                    audit=AUDIT_ZRC,
+                    basename="status",
+                    main_object=serializer.data["zaak"]["url"],
+                ),
+            ]
         )
 
     def perform_post(self, serializer):
@@ -2316,17 +2358,21 @@ class ZaakBijwerkenViewset(
         rollen_version_before_edit,
         rollen_instances_before_edit,
     ):
+        trails = []
+
         def create_audittrail(before, after, action, uuid):
             instance = rol_by_uuid(uuid)
-            self.create_audittrail(
-                response.status_code,
-                action,
-                version_before_edit=before,
-                version_after_edit=after,
-                unique_representation=instance.unique_representation(),
-                audit=AUDIT_ZRC,
-                basename="rol",
-                main_object=serializer.data["zaak"]["url"],
+            trails.append(
+                self.build_audittrail(
+                    response.status_code,
+                    action,
+                    version_before_edit=before,
+                    version_after_edit=after,
+                    unique_representation=instance.unique_representation(),
+                    audit=AUDIT_ZRC,
+                    basename="rol",
+                    main_object=serializer.data["zaak"]["url"],
+                )
             )
 
         def rol_by_uuid(uuid):
@@ -2361,6 +2407,8 @@ class ZaakBijwerkenViewset(
         for uuid in new_uuids - old_uuids:
             create_audittrail(None, new_rollen[uuid], CommonResourceAction.create, uuid)
 
+        self.create_audittrails(trails)
+
     def perform_post(self, serializer):
         super().perform_post(serializer)
 
@@ -0,0 +1,58 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+from django.core.management import BaseCommand
+from django.db import transaction
+from django.db.models import OuterRef, Subquery
+
+from openzaak.components.zaken.models import Status, Zaak
+
+
+def backfill_current_status(batch_size: int = 1000) -> int:
+    """
+    Set ``Zaak.current_status`` to the most recent status for all zaken.
+
+    The update is done set-based in batches of ``batch_size`` zaken, each in its own
+    transaction, so the command can be run on a live database.
+    """
+    latest_status = (
+        Status.objects.filter(zaak=OuterRef("pk"))
+        .order_by("-datum_status_gezet", "-pk")
+        .values("pk")[:1]
+    )
+
+    updated = 0
+    last_pk = 0
+    while True:
+        pks = list(
+            Zaak.objects.filter(pk__gt=last_pk)
+            .order_by("pk")
+            .values_list("pk", flat=True)[:batch_size]
+        )
+        if not pks:
+            break
+
+        with transaction.atomic():
+            updated += Zaak.objects.filter(pk__in=pks).update(
+                current_status=Subquery(latest_status)
+            )
+        last_pk = pks[-1]
+
+    return updated
+
+
+class Command(BaseCommand):
+    help = "Fill the current status reference of all existing zaken"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of zaken to update per transaction (default: 1000).",
+        )
+
+    def handle(self, *args, **options):
+        updated = backfill_current_status(batch_size=options["batch_size"])
+        self.stdout.write(
+            self.style.SUCCESS(f"Updated the current status of {updated} zaken")
+        )
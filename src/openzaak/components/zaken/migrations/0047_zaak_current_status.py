@@ -0,0 +1,21 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+# Generated by Django 5.2.7 on 2026-10-18 10:12
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('zaken', '0046_alter_zaak_betalingsindicatie'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='zaak',
+            name='current_status',
+            field=models.ForeignKey(blank=True, editable=False, help_text='De meest recent gezette STATUS van de ZAAK (op basis van `datumStatusGezet`).', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='zaken.status', verbose_name='huidige status'),
+        ),
+    ]
@@ -0,0 +1,47 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+from django.db import migrations, transaction
+from django.db.models import OuterRef, Subquery
+
+BATCH_SIZE = 1000
+
+
+def backfill_current_status(apps, schema_editor):
+    Zaak = apps.get_model("zaken", "Zaak")
+    Status = apps.get_model("zaken", "Status")
+
+    latest_status = (
+        Status.objects.filter(zaak=OuterRef("pk"))
+        .order_by("-datum_status_gezet", "-pk")
+        .values("pk")[:1]
+    )
+
+    # each batch is committed separately, so the zaken table is not locked for the
+    # whole migration
+    last_pk = 0
+    while True:
+        pks = list(
+            Zaak.objects.filter(pk__gt=last_pk)
+            .order_by("pk")
+            .values_list("pk", flat=True)[:BATCH_SIZE]
+        )
+        if not pks:
+            break
+
+        with transaction.atomic():
+            Zaak.objects.filter(pk__in=pks).update(
+                current_status=Subquery(latest_status)
+            )
+        last_pk = pks[-1]
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("zaken", "0048_zaak_va_order"),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_current_status, migrations.RunPython.noop),
+    ]
@@ -10,7 +10,7 @@ from django.contrib.postgres.fields import ArrayField
 from django.core.exceptions import ValidationError
 from django.core.serializers.json import DjangoJSONEncoder
 from django.core.validators import RegexValidator
-from django.db import models
+from django.db import models, transaction
 from django.utils import timezone
 from django.utils.crypto import get_random_string
 from django.utils.functional import cached_property
@@ -25,12 +25,12 @@ from vng_api_common.constants import (
     RelatieAarden,
     RolOmschrijving,
     RolTypes,
+    VertrouwelijkheidsAanduiding,
     ZaakobjectTypes,
 )
 from vng_api_common.descriptors import GegevensGroepType
 from vng_api_common.fields import RSINField, VertrouwelijkheidsAanduidingField
 from vng_api_common.notes.models import NotitieBaseClass
-from zgw_consumers.models import ServiceUrlField
 
 from openzaak.client import fetch_object
 from openzaak.components.documenten.loaders import EIOLoader
@@ -41,6 +41,7 @@ from openzaak.utils.fields import (
     FkOrServiceUrlField,
     RelativeURLField,
     ServiceFkField,
+    ServiceUrlField,
 )
 from openzaak.utils.help_text import mark_experimental
 from openzaak.utils.mixins import APIMixin, AuditTrailMixin
@@ -256,6 +257,16 @@ class Zaak(ETagMixin, AuditTrailMixin, APIMixin, ZaakIdentificatie):
             "Aanduiding van de mate waarin het zaakdossier van de ZAAK voor de openbaarheid bestemd is."
         ),
     )
+    # ⚡️ stored order of the vertrouwelijkheidaanduiding, so the authorization and
+    # ``maximaleVertrouwelijkheidaanduiding`` filters can use an index
+    va_order = models.GeneratedField(
+        expression=VertrouwelijkheidsAanduiding.get_order_expression(
+            "vertrouwelijkheidaanduiding"
+        ),
+        output_field=models.IntegerField(null=True),
+        db_persist=True,
+        verbose_name=_("volgorde vertrouwelijkheidaanduiding"),
+    )
 
     betalingsindicatie = models.CharField(
         _("betalingsindicatie"),
@@ -487,13 +498,32 @@ class Zaak(ETagMixin, AuditTrailMixin, APIMixin, ZaakIdentificatie):
         blank=True,
     )
 
-    objects = ZaakQuerySet.as_manager()
+    # ⚡️ denormalized pointer to the most recent status, maintained by
+    # :meth:`update_current_status` whenever a status is created or deleted
+    current_status = models.ForeignKey(
+        "zaken.Status",
+        on_delete=models.SET_NULL,
+        related_name="+",
+        null=True,
+        blank=True,
+        editable=False,
+        verbose_name=_("huidige status"),
+        help_text=_(
+            "De meest recent gezette STATUS van de ZAAK (op basis van "
+            "`datumStatusGezet`)."
+        ),
+    )
 
-    _current_status_uuid: Optional[UUID]
+    objects = ZaakQuerySet.as_manager()
 
     class Meta:
         verbose_name = "zaak"
         verbose_name_plural = "zaken"
+        indexes = [
+            models.Index(
+                fields=["_zaaktype", "va_order"], name="zaken_zaak_zaaktype_va_idx"
+            ),
+        ]
 
     def __str__(self):
         return self.identificatie
@@ -523,39 +553,54 @@ class Zaak(ETagMixin, AuditTrailMixin, APIMixin, ZaakIdentificatie):
         if self.opschorting_indicatie:
             self.opschorting_eerdere_opschorting = True
 
+        # the current status is maintained by `update_current_status` only, make sure
+        # that saving a zaak instance loaded before a status was added does not
+        # overwrite it with a stale value
+        if (
+            not self._state.adding
+            and not args
+            and kwargs.get("update_fields") is None
+            and not kwargs.get("force_insert")
+        ):
+            deferred_fields = self.get_deferred_fields()
+            kwargs["update_fields"] = [
+                field.attname
+                for field in self._meta.concrete_fields
+                if not field.primary_key
+                and not field.generated
+                and field.attname not in deferred_fields
+                and field.name != "current_status"
+            ]
+
         super().save(*args, **kwargs)
 
     @property
-    def current_status_uuid(self):
-        # .first() is used instead of .last because:
-        #
-        # * the viewset prefetches the statuses for each zaak and orders them
-        #   descending on datum_status_gezet
-        # * using .last() calls .reverse, which invalidates the prefetch cache.
-        #
-        # The Status.Meta is also set to order by descending datum_status_gezet so that
-        # this code works correctly even when not doing prefetches.
-        if hasattr(self, "_current_status_uuid"):
-            return self._current_status_uuid
-        status = self.status_set.first()
-        return status.uuid if status else None
-
-    @current_status_uuid.setter
-    def current_status_uuid(self, value: Optional[UUID]):
-        self._current_status_uuid = value
+    def current_status_uuid(self) -> Optional[UUID]:
+        # ⚡️ no status query needed if the zaak has no status (yet)
+        if self.current_status_id is None:
+            return None
+        return self.current_status.uuid
 
-    @property
-    def current_status(self):
-        # The viewset prefetches the statuses and stores them on the instances,
-        # for performance reasons we simply grab the first status from there if possible
-        # instead of using `.first()`, because the latter constructs a queryset
-        # (which causes more overhead)
-        if hasattr(self, "prefetched_statuses"):
-            # Statuses were prefetched, but Zaak has no statuses yet
-            if not self.prefetched_statuses:
-                return None
-            return self.prefetched_statuses[0]
-        return self.status_set.first()
+    def update_current_status(self) -> None:
+        """
+        Recalculate and store the pointer to the most recent status.
+
+        The zaak row is locked first, so that concurrent transactions adding statuses
+        to the same zaak are serialized and the last one to commit sees all statuses.
+        """
+        with transaction.atomic():
+            list(
+                Zaak.objects.select_for_update()
+                .filter(pk=self.pk)
+                .values_list("pk", flat=True)
+            )
+            current_status = (
+                Status.objects.filter(zaak_id=self.pk)
+                .order_by("-datum_status_gezet", "-pk")
+                .first()
+            )
+            Zaak.objects.filter(pk=self.pk).update(current_status=current_status)
+        self.current_status = current_status
 
     @property
     def is_closed(self) -> bool:
@@ -735,11 +780,8 @@ class Status(ETagMixin, APIMixin, models.Model):
 
     @property
     def indicatie_laatst_gezette_status(self) -> bool:
-        """⚡️ use annotated field when possible"""
-        if hasattr(self, "max_datum_status_gezet"):
-            return self.max_datum_status_gezet == self.datum_status_gezet
-
-        return self.zaak.current_status_uuid == self.uuid
+        """⚡️ compare against the pointer on the zaak instead of the status history"""
+        return self.zaak.current_status_id == self.pk
 
 
 class SubStatus(models.Model):
@@ -2,9 +2,11 @@
 # Copyright (C) 2019 - 2020 Dimpact
 from typing import Dict, Tuple
 
-from django.db import models
+from django.apps import apps
+from django.db import models, transaction
 
 from django_loose_fk.virtual_models import ProxyMixin
+from vng_api_common.constants import RelatieAarden
 
 from openzaak.components.besluiten.models import Besluit
 from openzaak.utils.query import BlockChangeMixin, LooseFkAuthorizationsFilterMixin
@@ -53,22 +55,25 @@ class ZaakNotitieQuerySet(ZaakRelatedQuerySet):
 
 
 class StatusQuerySet(ZaakRelatedQuerySet):
-    def annotate_with_max_datum_status_gezet(self):
+    pass
+
+
+class ZaakInformatieObjectQuerySet(BlockChangeMixin, ZaakRelatedQuerySet):
+    @transaction.atomic
+    def trusted_bulk_create(self, objs, **kwargs):
         """
-        add `max_datum_status_gezet` of all statuses grouped by zaak
+        Also create the ObjectInformatieObjecten, which are normally synchronized
+        by the ``sync_oio`` signal.
         """
-        grouped_statussen = (
-            self.filter(zaak=models.OuterRef("zaak"))
-            .order_by()
-            .values("zaak")
-            .annotate(max_datum_status_gezet=models.Max("datum_status_gezet"))
-            .values("max_datum_status_gezet")
-        )
-        return self.annotate(max_datum_status_gezet=models.Subquery(grouped_statussen))
+        objs = list(objs)
+        for obj in objs:
+            obj.aard_relatie = RelatieAarden.from_object_type("zaak")
 
+        objs = super().trusted_bulk_create(objs, **kwargs)
 
-class ZaakInformatieObjectQuerySet(BlockChangeMixin, ZaakRelatedQuerySet):
-    pass
+        ObjectInformatieObject = apps.get_model("documenten", "ObjectInformatieObject")
+        ObjectInformatieObject.objects.bulk_create_from(objs)
+        return objs
 
 
 class ZaakBesluitQuerySet(BlockChangeMixin, ZaakRelatedQuerySet):
@@ -1,5 +1,6 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2019 - 2022 Dimpact
+from django.db import models
 from django.db.models.base import ModelBase
 from django.db.models.signals import ModelSignal, post_delete, post_save
 from django.dispatch import receiver
@@ -8,7 +9,7 @@ import structlog
 
 from openzaak.components.besluiten.models import Besluit
 
-from .models import ZaakBesluit
+from .models import Status, Zaak, ZaakBesluit
 
 logger = structlog.stdlib.get_logger(__name__)
 
@@ -52,3 +53,47 @@ def sync_zaakbesluit(
 
     else:
         raise NotImplementedError(f"Signal {signal} is not supported")
+
+
+def _is_zaak_deletion(origin) -> bool:
+    if isinstance(origin, Zaak):
+        return True
+    return isinstance(origin, models.QuerySet) and origin.model is Zaak
+
+
+@receiver(
+    [post_save, post_delete], sender=Status, dispatch_uid="zaken.sync_current_status"
+)
+def sync_current_status(
+    sender: ModelBase, signal: ModelSignal, instance: Status, **kwargs
+) -> None:
+    """
+    Keep the denormalized ``Zaak.current_status`` pointer up to date.
+
+    Business logic:
+    * creating or updating a Status recalculates the current status of its zaak
+    * deleting the current Status nulls the pointer (``on_delete=SET_NULL``), after
+      which the previous status becomes the current one
+    * deleting the zaak itself (cascading to its statuses) requires no updates
+    """
+    if signal is post_save:
+        # loading fixtures -> skip
+        if kwargs["raw"]:
+            return
+
+        instance.zaak.update_current_status()
+
+    elif signal is post_delete:
+        if _is_zaak_deletion(kwargs.get("origin")):
+            return
+
+        # if a status other than the current one was deleted, the pointer is
+        # still correct
+        zaak = Zaak.objects.filter(
+            pk=instance.zaak_id, current_status__isnull=True
+        ).first()
+        if zaak is not None:
+            zaak.update_current_status()
+
+    else:
+        raise NotImplementedError(f"Signal {signal} is not supported")
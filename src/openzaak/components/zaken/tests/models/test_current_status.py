@@ -0,0 +1,138 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+from datetime import datetime
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+
+from ...models import Zaak
+from ..factories import RolFactory, StatusFactory, ZaakFactory
+
+
+class CurrentStatusTests(TestCase):
+    def test_no_status(self):
+        zaak = ZaakFactory.create()
+
+        zaak.refresh_from_db()
+        self.assertIsNone(zaak.current_status)
+        self.assertIsNone(zaak.current_status_uuid)
+
+    def test_creating_status_updates_current_status(self):
+        zaak = ZaakFactory.create()
+        status1 = StatusFactory.create(
+            zaak=zaak,
+            datum_status_gezet=timezone.make_aware(datetime(2022, 7, 18, 8, 0, 0)),
+        )
+        status2 = StatusFactory.create(
+            zaak=zaak,
+            datum_status_gezet=timezone.make_aware(datetime(2022, 7, 18, 10, 0, 0)),
+        )
+
+        zaak.refresh_from_db()
+        self.assertEqual(zaak.current_status, status2)
+        self.assertEqual(zaak.current_status_uuid, status2.uuid)
+
+        status1.refresh_from_db()
+        self.assertFalse(status1.indicatie_laatst_gezette_status)
+        self.assertTrue(status2.indicatie_laatst_gezette_status)
+
+    def test_older_status_does_not_replace_current_status(self):
+        zaak = ZaakFactory.create()
+        status1 = StatusFactory.create(
+            zaak=zaak,
+            datum_status_gezet=timezone.make_aware(datetime(2022, 7, 18, 10, 0, 0)),
+        )
+        StatusFactory.create(
+            zaak=zaak,
+            datum_status_gezet=timezone.make_aware(datetime(2022, 7, 18, 8, 0, 0)),
+        )
+
+        zaak.refresh_from_db()
+        self.assertEqual(zaak.current_status, status1)
+
+    def test_deleting_current_status_falls_back_to_previous(self):
+        zaak = ZaakFactory.create()
+        status1 = StatusFactory.create(
+            zaak=zaak,
+            datum_status_gezet=timezone.make_aware(datetime(2022, 7, 18, 8, 0, 0)),
+        )
+        status2 = StatusFactory.create(
+            zaak=zaak,
+            datum_status_gezet=timezone.make_aware(datetime(2022, 7, 18, 10, 0, 0)),
+        )
+
+        status2.delete()
+
+        zaak.refresh_from_db()
+        self.assertEqual(zaak.current_status, status1)
+
+        status1.delete()
+
+        zaak.refresh_from_db()
+        self.assertIsNone(zaak.current_status)
+
+    def test_deleting_rol_cascades_to_current_status(self):
+        zaak = ZaakFactory.create()
+        rol = RolFactory.create(zaak=zaak)
+        status1 = StatusFactory.create(
+            zaak=zaak,
+            datum_status_gezet=timezone.make_aware(datetime(2022, 7, 18, 8, 0, 0)),
+        )
+        StatusFactory.create(
+            zaak=zaak,
+            gezetdoor=rol,
+            datum_status_gezet=timezone.make_aware(datetime(2022, 7, 18, 10, 0, 0)),
+        )
+
+        rol.delete()
+
+        zaak.refresh_from_db()
+        self.assertEqual(zaak.current_status, status1)
+
+    def test_saving_stale_zaak_does_not_overwrite_current_status(self):
+        zaak = ZaakFactory.create()
+        stale_zaak = Zaak.objects.get(pk=zaak.pk)
+        status = StatusFactory.create(zaak=zaak)
+
+        stale_zaak.omschrijving = "updated"
+        stale_zaak.save()
+
+        zaak.refresh_from_db()
+        self.assertEqual(zaak.omschrijving, "updated")
+        self.assertEqual(zaak.current_status, status)
+
+    def test_delete_zaak_with_statuses(self):
+        zaak = ZaakFactory.create()
+        StatusFactory.create_batch(3, zaak=zaak)
+
+        zaak.delete()
+
+        self.assertFalse(Zaak.objects.exists())
+
+
+class BackfillCurrentStatusTests(TestCase):
+    def test_backfill(self):
+        zaak1, zaak2, zaak3 = ZaakFactory.create_batch(3)
+        StatusFactory.create(
+            zaak=zaak1,
+            datum_status_gezet=timezone.make_aware(datetime(2022, 7, 18, 8, 0, 0)),
+        )
+        status1 = StatusFactory.create(
+            zaak=zaak1,
+            datum_status_gezet=timezone.make_aware(datetime(2022, 7, 18, 10, 0, 0)),
+        )
+        status2 = StatusFactory.create(zaak=zaak2)
+        # simulate data from before the current status was tracked
+        Zaak.objects.update(current_status=None)
+
+        stdout = StringIO()
+        call_command("backfill_current_status", batch_size=2, stdout=stdout)
+
+        for zaak, expected in [(zaak1, status1), (zaak2, status2), (zaak3, None)]:
+            with self.subTest(zaak=zaak):
+                zaak.refresh_from_db()
+                self.assertEqual(zaak.current_status, expected)
+
+        self.assertIn("Updated the current status of 3 zaken", stdout.getvalue())
@@ -0,0 +1,45 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+from django.test import TestCase
+
+from vng_api_common.constants import VertrouwelijkheidsAanduiding
+
+from ...models import Zaak
+from ..factories import ZaakFactory
+
+
+class VertrouwelijkheidaanduidingOrderTests(TestCase):
+    def test_order_is_stored(self):
+        for value in VertrouwelijkheidsAanduiding.values:
+            with self.subTest(vertrouwelijkheidaanduiding=value):
+                zaak = ZaakFactory.create(vertrouwelijkheidaanduiding=value)
+
+                zaak.refresh_from_db()
+
+                self.assertEqual(
+                    zaak.va_order, VertrouwelijkheidsAanduiding.get_choice_order(value)
+                )
+
+    def test_order_is_updated(self):
+        zaak = ZaakFactory.create(
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.openbaar
+        )
+
+        zaak.vertrouwelijkheidaanduiding = VertrouwelijkheidsAanduiding.geheim
+        zaak.save()
+
+        self.assertEqual(
+            Zaak.objects.filter(
+                va_order__lte=VertrouwelijkheidsAanduiding.get_choice_order(
+                    VertrouwelijkheidsAanduiding.intern
+                )
+            ).count(),
+            0,
+        )
+
+    def test_order_without_vertrouwelijkheidaanduiding(self):
+        zaak = ZaakFactory.create(vertrouwelijkheidaanduiding="")
+
+        zaak.refresh_from_db()
+
+        self.assertIsNone(zaak.va_order)
@@ -2,10 +2,14 @@
 # Copyright (C) 2019 - 2020 Dimpact
 from django.test import TestCase
 
+from openzaak.components.documenten.models import ObjectInformatieObject
+from openzaak.components.documenten.tests.factories import (
+    EnkelvoudigInformatieObjectCanonicalFactory,
+)
 from openzaak.utils.query import QueryBlocked
 
 from ...models import ZaakInformatieObject
-from ..factories import ZaakInformatieObjectFactory
+from ..factories import ZaakFactory, ZaakInformatieObjectFactory
 
 
 class BlockChangeTestCase(TestCase):
@@ -35,3 +39,24 @@ class BlockChangeTestCase(TestCase):
     def test_bulk_create(self):
         zio = ZaakInformatieObjectFactory.build(with_etag=False)
         self.assertRaises(QueryBlocked, ZaakInformatieObject.objects.bulk_create, [zio])
+
+    def test_trusted_bulk_create(self):
+        zaak = ZaakFactory.create()
+        canonicals = EnkelvoudigInformatieObjectCanonicalFactory.create_batch(2)
+        zios = [
+            ZaakInformatieObject(zaak=zaak, informatieobject=canonical)
+            for canonical in canonicals
+        ]
+
+        with self.assertNumQueries(4):
+            ZaakInformatieObject.objects.trusted_bulk_create(zios)
+
+        self.assertEqual(ZaakInformatieObject.objects.filter(zaak=zaak).count(), 2)
+        # the ObjectInformatieObjecten are created, like the signals do
+        oios = ObjectInformatieObject.objects.filter(_zaak=zaak)
+        self.assertEqual(
+            {oio.informatieobject for oio in oios},
+            set(canonicals),
+        )
+        self.assertEqual({oio.object_type for oio in oios}, {"zaak"})
+        self.assertEqual({zio.aard_relatie for zio in zios}, {"hoort_bij"})
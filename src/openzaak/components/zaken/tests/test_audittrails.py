@@ -1,13 +1,18 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2019 - 2022 Dimpact
 from copy import deepcopy
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
 
+from django.db import transaction
 from django.test import override_settings, tag
 
 from freezegun import freeze_time
+from kombu.exceptions import OperationalError
 from rest_framework import status
 from rest_framework.test import APITestCase
 from vng_api_common.audittrails.models import AuditTrail
+from vng_api_common.audittrails.viewsets import AuditTrailMixin as _AuditTrailMixin
 from vng_api_common.authorizations.utils import generate_jwt
 from vng_api_common.constants import (
     BrondatumArchiefprocedureAfleidingswijze,
@@ -20,6 +25,7 @@ from vng_api_common.constants import (
 from vng_api_common.tests import reverse
 from vng_api_common.utils import get_uuid_from_path
 
+from openzaak import celery_app
 from openzaak.components.catalogi.tests.factories import (
     InformatieObjectTypeFactory,
     ResultaatTypeFactory,
@@ -31,7 +37,10 @@ from openzaak.components.catalogi.tests.factories import (
 from openzaak.components.documenten.tests.factories import (
     EnkelvoudigInformatieObjectFactory,
 )
+from openzaak.config.models import AuditTrailOutbox
 from openzaak.tests.utils import JWTAuthMixin
+from openzaak.utils.audittrails import AuditTrailMixin, serialize_audittrail
+from openzaak.utils.tasks import write_audittrails, write_stale_audittrails
 
 from ..models import Resultaat, Rol, Zaak, ZaakInformatieObject, ZaakObject
 from .factories import RolFactory, ZaakFactory, ZaakObjectFactory
@@ -873,3 +882,168 @@ class ZaakAuditTrailJWTExpiryTests(JWTAuthMixin, APITestCase):
 
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
         self.assertEqual(response.data["code"], "jwt-expired")
+
+
+class BuildAuditTrailTests(JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+
+    _create_zaak = AuditTrailTests._create_zaak
+
+    def test_same_as_library(self):
+        """
+        ``build_audittrail`` copies ``create_audittrail`` of vng-api-common, which
+        must build the same audit trail.
+        """
+        with patch.object(
+            AuditTrailMixin,
+            "build_audittrail",
+            autospec=True,
+            side_effect=AuditTrailMixin.build_audittrail,
+        ) as mock_build_audittrail:
+            self._create_zaak(HTTP_X_AUDIT_TOELICHTING="Een toelichting")
+
+        viewset, *args = mock_build_audittrail.call_args.args
+        kwargs = mock_build_audittrail.call_args.kwargs
+        built = AuditTrailMixin.build_audittrail(viewset, *args, **kwargs)
+
+        with patch.object(AuditTrail, "save", autospec=True) as mock_save:
+            _AuditTrailMixin.create_audittrail(viewset, *args, **kwargs)
+
+        (created,) = mock_save.call_args.args
+        fields = [
+            field.attname
+            for field in AuditTrail._meta.concrete_fields
+            if field.attname not in ("id", "uuid", "aanmaakdatum")
+        ]
+        self.assertEqual(
+            {field: getattr(built, field) for field in fields},
+            {field: getattr(created, field) for field in fields},
+        )
+        self.assertEqual(built.toelichting, "Een toelichting")
+
+
+@override_settings(AUDIT_TRAIL_SINK="buffered")
+class BufferedAuditTrailTests(JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+
+    _create_zaak = AuditTrailTests._create_zaak
+
+    def test_written_on_commit(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            zaak_response = self._create_zaak()
+
+            self.assertFalse(AuditTrail.objects.exists())
+
+        audittrail = AuditTrail.objects.get()
+        self.assertEqual(audittrail.hoofd_object, zaak_response["url"])
+        self.assertEqual(audittrail.actie, "create")
+        self.assertEqual(audittrail.nieuw, zaak_response)
+
+    def test_rolled_back_discarded(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            zaak_response = self._create_zaak()
+
+            with transaction.atomic():
+                self._create_zaak()
+                transaction.set_rollback(True)
+
+            zaak_response2 = self._create_zaak()
+
+        self.assertEqual(Zaak.objects.count(), 2)
+        self.assertEqual(
+            set(AuditTrail.objects.values_list("hoofd_object", flat=True)),
+            {zaak_response["url"], zaak_response2["url"]},
+        )
+
+    def test_written_after_rolled_back_buffer(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            with transaction.atomic():
+                self._create_zaak()
+                transaction.set_rollback(True)
+
+            zaak_response = self._create_zaak()
+
+            self.assertFalse(AuditTrail.objects.exists())
+
+        audittrail = AuditTrail.objects.get()
+        self.assertEqual(audittrail.hoofd_object, zaak_response["url"])
+
+
+@override_settings(AUDIT_TRAIL_SINK="celery")
+class CeleryAuditTrailTests(JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+
+    _create_zaak = AuditTrailTests._create_zaak
+
+    @patch.object(celery_app.conf, "task_always_eager", True)
+    def test_written_by_celery(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            zaak_response = self._create_zaak()
+
+            self.assertFalse(AuditTrail.objects.exists())
+            self.assertEqual(AuditTrailOutbox.objects.count(), 1)
+
+        audittrail = AuditTrail.objects.get()
+        self.assertEqual(audittrail.hoofd_object, zaak_response["url"])
+        self.assertEqual(audittrail.nieuw, zaak_response)
+        self.assertFalse(AuditTrailOutbox.objects.exists())
+
+    @patch.object(celery_app.conf, "task_always_eager", True)
+    def test_rolled_back_discarded(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            with transaction.atomic():
+                self._create_zaak()
+                transaction.set_rollback(True)
+
+            zaak_response = self._create_zaak()
+
+        audittrail = AuditTrail.objects.get()
+        self.assertEqual(audittrail.hoofd_object, zaak_response["url"])
+        self.assertFalse(AuditTrailOutbox.objects.exists())
+
+    def test_broker_unavailable(self):
+        with patch(
+            "openzaak.utils.tasks.write_audittrails.delay",
+            side_effect=OperationalError,
+        ):
+            with self.captureOnCommitCallbacks(execute=True):
+                zaak_response = self._create_zaak()
+
+        self.assertFalse(AuditTrail.objects.exists())
+        self.assertEqual(AuditTrailOutbox.objects.count(), 1)
+
+        with freeze_time(datetime.now(timezone.utc) + timedelta(minutes=10)):
+            write_stale_audittrails()
+
+        audittrail = AuditTrail.objects.get()
+        self.assertEqual(audittrail.hoofd_object, zaak_response["url"])
+        self.assertFalse(AuditTrailOutbox.objects.exists())
+
+
+class WriteAuditTrailsTaskTests(APITestCase):
+    def test_redelivered(self):
+        zaak_url = "http://testserver/zaken/api/v1/zaken/1"
+        trail = AuditTrail(
+            bron="ZRC",
+            actie="create",
+            resultaat=201,
+            hoofd_object=zaak_url,
+            resource="zaak",
+            resource_url=zaak_url,
+            resource_weergave="zaak",
+            aanmaakdatum=datetime(2025, 1, 1, 12, tzinfo=timezone.utc),
+            nieuw={"url": zaak_url},
+        )
+        entry = AuditTrailOutbox.objects.create(trails=[serialize_audittrail(trail)])
+
+        write_audittrails([entry.pk])
+        write_audittrails([entry.pk])
+
+        audittrail = AuditTrail.objects.get()
+        self.assertEqual(audittrail.uuid, trail.uuid)
+        # the time of the action is kept
+        self.assertEqual(
+            audittrail.aanmaakdatum, datetime(2025, 1, 1, 12, tzinfo=timezone.utc)
+        )
+        self.assertEqual(audittrail.nieuw, {"url": zaak_url})
+        self.assertFalse(AuditTrailOutbox.objects.exists())
@@ -2582,3 +2582,13 @@ class KlantContactTests(JWTAuthMixin, APITestCase):
             error = get_validation_errors(response, "zaak")
             self.assertEqual(error["code"], "incorrect_match")
             self.assertEqual(error["reason"], "Incorrect resource. Expected: Zaak")
+
+
+@override_settings(AUTORISATIES_FILTERS_VALUES_JOIN=True)
+class ZaakReadCorrectScopeValuesJoinTests(ZaakReadCorrectScopeTests):
+    pass
+
+
+@override_settings(AUTORISATIES_FILTERS_VALUES_JOIN=True)
+class StatusValuesJoinTests(StatusTests):
+    pass
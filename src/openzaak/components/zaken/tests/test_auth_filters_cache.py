@@ -0,0 +1,97 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+from vng_api_common.constants import ComponentTypes, VertrouwelijkheidsAanduiding
+from vng_api_common.tests import reverse
+
+from openzaak.components.autorisaties.tests.factories import (
+    CatalogusAutorisatieFactory,
+)
+from openzaak.components.catalogi.tests.factories import ZaakTypeFactory
+from openzaak.tests.utils import JWTAuthMixin
+
+from ..api.scopes import SCOPE_ZAKEN_ALLES_LEZEN
+from .factories import ZaakFactory
+from .utils import ZAAK_READ_KWARGS
+
+
+class AuthorizationFiltersCacheTests(JWTAuthMixin, APITestCase):
+    scopes = [SCOPE_ZAKEN_ALLES_LEZEN]
+    max_vertrouwelijkheidaanduiding = VertrouwelijkheidsAanduiding.openbaar
+    component = ComponentTypes.zrc
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.zaaktype = ZaakTypeFactory.create()
+        super().setUpTestData()
+
+    def _list_zaken(self):
+        response = self.client.get(reverse("zaak-list"), **ZAAK_READ_KWARGS)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.json()["results"]
+
+    def test_filters_are_cached(self):
+        zaak = ZaakFactory.create(
+            zaaktype=self.zaaktype,
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.openbaar,
+        )
+        ZaakFactory.create(
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.openbaar
+        )
+
+        with CaptureQueriesContext(connection) as first:
+            results = self._list_zaken()
+        with CaptureQueriesContext(connection) as second:
+            cached_results = self._list_zaken()
+
+        self.assertEqual(len(results), 1)
+        self.assertEqual(results[0]["url"], f"http://testserver{reverse(zaak)}")
+        self.assertEqual(cached_results, results)
+        # the authorizations are no longer resolved to zaaktypen
+        self.assertLess(len(second), len(first))
+
+    def test_cache_invalidated_on_autorisatie_change(self):
+        ZaakFactory.create(
+            zaaktype=self.zaaktype,
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.geheim,
+        )
+        self.assertEqual(self._list_zaken(), [])
+
+        self.autorisatie.max_vertrouwelijkheidaanduiding = (
+            VertrouwelijkheidsAanduiding.zeer_geheim
+        )
+        self.autorisatie.save()
+
+        self.assertEqual(len(self._list_zaken()), 1)
+
+    def test_cache_invalidated_on_new_zaaktype_in_catalogus(self):
+        CatalogusAutorisatieFactory.create(
+            catalogus=self.zaaktype.catalogus,
+            applicatie=self.applicatie,
+            component=self.component,
+            scopes=self.scopes,
+            max_vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.openbaar,
+        )
+        self.assertEqual(self._list_zaken(), [])
+
+        zaaktype = ZaakTypeFactory.create(catalogus=self.zaaktype.catalogus)
+        ZaakFactory.create(
+            zaaktype=zaaktype,
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.openbaar,
+        )
+
+        self.assertEqual(len(self._list_zaken()), 1)
+
+    @override_settings(AUTORISATIES_FILTERS_CACHE_TIMEOUT=0)
+    def test_cache_disabled(self):
+        with CaptureQueriesContext(connection) as first:
+            self._list_zaken()
+        with CaptureQueriesContext(connection) as second:
+            self._list_zaken()
+
+        self.assertEqual(len(second), len(first))
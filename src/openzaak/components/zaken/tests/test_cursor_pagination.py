@@ -0,0 +1,130 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from datetime import date
+from urllib.parse import parse_qs, urlparse
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+from vng_api_common.tests import reverse, reverse_lazy
+
+from openzaak.tests.utils import JWTAuthMixin
+
+from .factories import RolFactory, StatusFactory, ZaakFactory
+from .utils import ZAAK_READ_KWARGS
+
+
+class CursorPaginationTests(JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+    list_url = reverse_lazy("zaak-list")
+
+    def _walk(self, url: str, link: str = "next") -> list[dict]:
+        pages = []
+        while url:
+            response = self.client.get(url, **ZAAK_READ_KWARGS)
+
+            self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+
+            data = response.json()
+            pages.append(data)
+            url = data[link]
+        return pages
+
+    def test_walk_zaken(self):
+        zaken = ZaakFactory.create_batch(5)
+
+        pages = self._walk(f"http://testserver{self.list_url}?cursor=&pageSize=2")
+
+        self.assertEqual([len(page["results"]) for page in pages], [2, 2, 1])
+        self.assertTrue(all(page["count"] == 5 for page in pages))
+        self.assertIsNone(pages[0]["previous"])
+        self.assertEqual(
+            [result["url"] for page in pages for result in page["results"]],
+            [f"http://testserver{reverse(zaak)}" for zaak in reversed(zaken)],
+        )
+
+    def test_walk_back(self):
+        zaken = ZaakFactory.create_batch(5)
+        pages = self._walk(f"http://testserver{self.list_url}?cursor=&pageSize=2")
+
+        previous_pages = self._walk(pages[-1]["previous"], link="previous")
+
+        self.assertEqual(
+            [result["url"] for result in previous_pages[0]["results"]],
+            [f"http://testserver{reverse(zaak)}" for zaak in reversed(zaken[1:3])],
+        )
+        self.assertEqual(previous_pages[-1]["results"], pages[0]["results"])
+
+    def test_walk_with_ordering(self):
+        # ties and nulls in the ordering field are broken by the primary key
+        for einddatum in (date(2024, 1, 1), None, date(2023, 1, 1), None):
+            ZaakFactory.create(einddatum=einddatum)
+            ZaakFactory.create(einddatum=einddatum)
+
+        for ordering in ("einddatum", "-einddatum"):
+            with self.subTest(ordering=ordering):
+                expected = self.client.get(
+                    self.list_url, {"ordering": ordering}, **ZAAK_READ_KWARGS
+                ).json()["results"]
+
+                pages = self._walk(
+                    f"http://testserver{self.list_url}"
+                    f"?ordering={ordering}&cursor=&pageSize=3"
+                )
+
+                self.assertEqual(
+                    [result["url"] for page in pages for result in page["results"]],
+                    [result["url"] for result in expected],
+                )
+
+    def test_invalid_cursor(self):
+        ZaakFactory.create()
+
+        for cursor in ("invalid", "eyJvIjogWyItcGsiXX0="):
+            with self.subTest(cursor=cursor):
+                response = self.client.get(
+                    self.list_url, {"cursor": cursor}, **ZAAK_READ_KWARGS
+                )
+
+                self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_cursor_with_invalid_values(self):
+        ZaakFactory.create_batch(2)
+        pages = self._walk(f"http://testserver{self.list_url}?cursor=&pageSize=1")
+        cursor = parse_qs(urlparse(pages[0]["next"]).query)["cursor"][0]
+        data = json.loads(urlsafe_b64decode(cursor))
+
+        for value in ("x", "2025-13-01", ["x"]):
+            with self.subTest(value=value):
+                tampered = urlsafe_b64encode(
+                    json.dumps(data | {"v": [value] * len(data["v"])}).encode()
+                ).decode()
+
+                response = self.client.get(
+                    self.list_url, {"cursor": tampered}, **ZAAK_READ_KWARGS
+                )
+
+                self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_cursor_from_other_ordering(self):
+        ZaakFactory.create_batch(2)
+        pages = self._walk(f"http://testserver{self.list_url}?cursor=&pageSize=1")
+
+        response = self.client.get(
+            f"{pages[0]['next']}&ordering=startdatum", **ZAAK_READ_KWARGS
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_walk_statussen_and_rollen(self):
+        StatusFactory.create_batch(3)
+        RolFactory.create_batch(3)
+
+        for list_url in (reverse("status-list"), reverse("rol-list")):
+            with self.subTest(list_url=list_url):
+                pages = self._walk(f"http://testserver{list_url}?cursor=&pageSize=2")
+
+                urls = [result["url"] for page in pages for result in page["results"]]
+                self.assertEqual(len(urls), 3)
+                self.assertEqual(len(set(urls)), 3)
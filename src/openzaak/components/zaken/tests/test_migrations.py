@@ -1,5 +1,6 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2020 Dimpact
+from datetime import timedelta
 from uuid import uuid4
 
 from django.utils import timezone
@@ -316,3 +317,55 @@ class MigrateCompositeUrlsForwardTest(TestMigrations):
             self.zaak_besluit_unknown._besluit_relative_url,
             "besluiten/9b235f85-4f39-49df-ab6e-9c2d32123cf5",
         )
+
+
+class BackfillCurrentStatusMigrationTest(TestMigrations):
+    migrate_from = "0048_zaak_va_order"
+    migrate_to = "0049_backfill_current_status"
+    app = "zaken"
+
+    def setUpBeforeMigration(self, apps):
+        Service = apps.get_model("zgw_consumers", "Service")
+        Zaak = apps.get_model("zaken", "Zaak")
+        Status = apps.get_model("zaken", "Status")
+
+        ztc = Service.objects.create(
+            label="external Catalogi",
+            slug="external-catalogi",
+            api_type=APITypes.ztc,
+            api_root="https://externe.catalogus.nl/api/v1/",
+        )
+
+        def create_zaak(identificatie):
+            return Zaak.objects.create(
+                _zaaktype_base_url=ztc,
+                _zaaktype_relative_url="zaaktypen/7ebd86f8-ce22-4ecf-972b-b2ac20b219c0",
+                identificatie=identificatie,
+                bronorganisatie="517439943",
+                verantwoordelijke_organisatie="517439943",
+                startdatum="2020-01-01",
+                vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.openbaar,
+            )
+
+        def create_status(zaak, datum_status_gezet):
+            return Status.objects.create(
+                zaak=zaak,
+                _statustype_base_url=ztc,
+                _statustype_relative_url="statustypen/7ebd86f8-ce22-4ecf-972b-b2ac20b219c0",
+                datum_status_gezet=datum_status_gezet,
+            )
+
+        self.zaak = create_zaak("with-statussen")
+        self.latest_status = create_status(self.zaak, timezone.now())
+        create_status(self.zaak, timezone.now() - timedelta(days=1))
+
+        self.zaak_without_status = create_zaak("without-status")
+
+    def test_current_status_filled(self):
+        Zaak = self.apps.get_model("zaken", "Zaak")
+
+        zaak = Zaak.objects.get(pk=self.zaak.pk)
+        zaak_without_status = Zaak.objects.get(pk=self.zaak_without_status.pk)
+
+        self.assertEqual(zaak.current_status_id, self.latest_status.pk)
+        self.assertIsNone(zaak_without_status.current_status_id)
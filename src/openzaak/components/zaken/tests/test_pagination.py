@@ -2,14 +2,20 @@
 # Copyright (C) 2024 Dimpact
 from unittest.mock import patch
 
-from django.test import override_settings
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
 
 from rest_framework import status
 from rest_framework.test import APITestCase
 from vng_api_common.tests import reverse, reverse_lazy
 
 from openzaak.tests.utils import JWTAuthMixin
-from openzaak.utils.pagination import FuzzyPagination
+from openzaak.utils.pagination import (
+    ExactPaginator,
+    FuzzyPagination,
+    get_estimated_count,
+)
 
 from ..models import Zaak
 from .factories import ZaakFactory
@@ -139,3 +145,111 @@ class ZaakFuzzyPaginationTests(JWTAuthMixin, APITestCase):
             data["next"], f"http://testserver{self.list_url}?page=2&pageSize=5"
         )
         self.assertTrue(data["countExact"])
+
+
+@override_settings(PAGINATION_COUNT_CACHE_TIMEOUT=60)
+class ZaakPaginationCountCacheTests(JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+    list_url = reverse_lazy("zaak-list")
+
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        self.addCleanup(cache.clear)
+
+    def test_count_cached_for_next_pages(self):
+        ZaakFactory.create_batch(3)
+
+        response = self.client.get(self.list_url, **ZAAK_READ_KWARGS)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["count"], 3)
+        self.assertTrue(response.json()["countExact"])
+
+        ZaakFactory.create()
+
+        with self.subTest("same filters"):
+            response = self.client.get(
+                self.list_url, {"pageSize": 2}, **ZAAK_READ_KWARGS
+            )
+
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertEqual(response.json()["count"], 3)
+            self.assertFalse(response.json()["countExact"])
+
+        with self.subTest("other filters"):
+            response = self.client.get(
+                self.list_url,
+                {"archiefstatus": "nog_te_archiveren"},
+                **ZAAK_READ_KWARGS,
+            )
+
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertEqual(response.json()["count"], 4)
+            self.assertTrue(response.json()["countExact"])
+
+    @override_settings(FUZZY_PAGINATION=True, FUZZY_PAGINATION_COUNT_LIMIT=10)
+    def test_fuzzy_count_not_shared_between_page_sizes(self):
+        ZaakFactory.create_batch(30)
+
+        response = self.client.get(
+            self.list_url, {"page": 2, "pageSize": 5}, **ZAAK_READ_KWARGS
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["count"], 15)
+
+        response = self.client.get(
+            self.list_url, {"page": 2, "pageSize": 20}, **ZAAK_READ_KWARGS
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["count"], 30)
+        self.assertEqual(len(response.json()["results"]), 10)
+
+    def test_count_not_shared_between_applicaties(self):
+        ZaakFactory.create_batch(2)
+
+        response = self.client.get(self.list_url, **ZAAK_READ_KWARGS)
+
+        self.assertEqual(response.json()["count"], 2)
+
+        self.applicatie.heeft_alle_autorisaties = False
+        self.applicatie.save()
+
+        response = self.client.get(self.list_url, **ZAAK_READ_KWARGS)
+
+        self.assertEqual(response.json()["count"], 0)
+        self.assertTrue(response.json()["countExact"])
+
+
+class EstimatedCountTests(TestCase):
+    def test_no_estimate_by_default(self):
+        self.assertIsNone(get_estimated_count(Zaak.objects.all()))
+
+    @override_settings(PAGINATION_COUNT_ESTIMATE_THRESHOLD=1)
+    def test_estimate_unfiltered_queryset(self):
+        ZaakFactory.create_batch(2)
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE zaken_zaak")
+
+        self.assertEqual(get_estimated_count(Zaak.objects.order_by("-pk")), 2)
+        self.assertIsNone(get_estimated_count(Zaak.objects.filter(pk__gt=0)))
+
+    @override_settings(PAGINATION_COUNT_ESTIMATE_THRESHOLD=100)
+    def test_no_estimate_below_threshold(self):
+        ZaakFactory.create_batch(2)
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE zaken_zaak")
+
+        self.assertIsNone(get_estimated_count(Zaak.objects.all()))
+
+    @override_settings(PAGINATION_COUNT_ESTIMATE_THRESHOLD=100)
+    @patch("openzaak.utils.pagination.get_estimated_count", return_value=1000)
+    def test_estimated_count_paginator(self, m):
+        ZaakFactory.create()
+
+        paginator = ExactPaginator(Zaak.objects.all(), 100)
+
+        self.assertEqual(paginator.count, 1000)
+        self.assertFalse(paginator.count_exact)
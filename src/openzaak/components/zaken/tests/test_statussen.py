@@ -18,7 +18,7 @@ from openzaak.components.catalogi.tests.factories import (
 )
 from openzaak.tests.utils import JWTAuthMixin, mock_ztc_oas_get
 
-from ..models import Status
+from ..models import Status, Zaak
 from .factories import ResultaatFactory, RolFactory, StatusFactory, ZaakFactory
 from .utils import (
     ZAAK_READ_KWARGS,
@@ -104,6 +104,18 @@ class StatusTests(JWTAuthMixin, APITestCase):
             response.json()["status"], f"http://testserver{reverse(status1)}"
         )
 
+    def test_current_status_kept_when_saving_stale_zaak(self):
+        zaak = ZaakFactory.create()
+        stale_zaak = Zaak.objects.get(pk=zaak.pk)
+        status1 = StatusFactory.create(zaak=zaak)
+
+        stale_zaak.omschrijving = "changed"
+        stale_zaak.save()
+
+        zaak.refresh_from_db()
+        self.assertEqual(zaak.omschrijving, "changed")
+        self.assertEqual(zaak.current_status, status1)
+
     def test_create_status_with_rol(self):
         url = reverse("status-list")
         zaak = ZaakFactory.create()
@@ -1,7 +1,10 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2022 Dimpact
 from django.contrib.gis.geos import Point
+from django.core.cache import cache
+from django.db import connection
 from django.test import override_settings, tag
+from django.test.utils import CaptureQueriesContext
 
 import requests_mock
 from rest_framework import status
@@ -18,6 +21,7 @@ from openzaak.tests.utils.auth import JWTAuthMixin
 from .constants import POLYGON_AMSTERDAM_CENTRUM
 from .factories import (
     ResultaatFactory,
+    RolFactory,
     StatusFactory,
     ZaakEigenschapFactory,
     ZaakFactory,
@@ -282,6 +286,50 @@ class ZakenIncludeTests(JWTAuthMixin, APITestCase):
         self.assertEqual(data, expected_results)
 
 
+@tag("expand")
+class ZakenIncludeQueriesTests(JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+    url = reverse_lazy("zaak-list")
+    expand = (
+        "zaaktype,status,status.statustype,resultaat,resultaat.resultaattype,"
+        "rollen,rollen.roltype"
+    )
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.zaaktype = ZaakTypeFactory.create(concept=False)
+
+        super().setUpTestData()
+
+    def _create_zaken(self, amount: int):
+        for _ in range(amount):
+            zaak = ZaakFactory.create(zaaktype=self.zaaktype)
+            StatusFactory.create(zaak=zaak, statustype__zaaktype=self.zaaktype)
+            ResultaatFactory.create(zaak=zaak)
+            RolFactory.create(zaak=zaak, roltype__zaaktype=self.zaaktype)
+
+    def _get_num_queries(self) -> int:
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(
+                self.url, {"expand": self.expand}, **ZAAK_READ_KWARGS
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        for zaak in response.json()["results"]:
+            self.assertEqual(
+                set(zaak["_expand"]), {"zaaktype", "status", "resultaat", "rollen"}
+            )
+        return len(context.captured_queries)
+
+    def test_number_of_queries_independent_of_page_size(self):
+        self._create_zaken(2)
+        num_queries = self._get_num_queries()
+
+        self._create_zaken(5)
+
+        self.assertEqual(self._get_num_queries(), num_queries)
+
+
 @tag("external-urls", "expand")
 @override_settings(ALLOWED_HOSTS=["testserver"])
 class ZakenExternalIncludeTests(JWTAuthMixin, APITestCase):
@@ -374,6 +422,62 @@ class ZakenExternalIncludeTests(JWTAuthMixin, APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(len(m.request_history), 1)
 
+    def test_zaak_list_include_multiple_external_objects(self):
+        catalogus = "https://externe.catalogus.nl/api/v1/catalogussen/1c8e36be-338c-4c07-ac5e-1adf55bec04a"
+        zaaktypen = [
+            f"https://externe.catalogus.nl/api/v1/zaaktypen/{uuid}"
+            for uuid in (
+                "b71f72ef-198d-44d8-af64-ae1932df830a",
+                "b3a2d0e6-1b6c-4d39-a8e5-0fbc3fe0a5a4",
+                "c2fdd8ef-5b4c-4b5a-9a37-6f5b0b3c7f1e",
+            )
+        ]
+        for zaaktype in zaaktypen:
+            ZaakFactory.create_batch(2, zaaktype=zaaktype)
+
+        with requests_mock.Mocker() as m:
+            for zaaktype in zaaktypen:
+                m.get(zaaktype, json=get_zaaktype_response(catalogus, zaaktype))
+
+            response = self.client.get(
+                self.url,
+                {"expand": "zaaktype"},
+                **ZAAK_READ_KWARGS,
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            sorted(request.url for request in m.request_history), sorted(zaaktypen)
+        )
+        for zaak in response.json()["results"]:
+            self.assertEqual(zaak["_expand"]["zaaktype"]["url"], zaak["zaaktype"])
+
+    @override_settings(EXTERNAL_OBJECTS_CACHE_TIMEOUT=60)
+    def test_zaak_list_include_shared_cache(self):
+        catalogus = "https://externe.catalogus.nl/api/v1/catalogussen/1c8e36be-338c-4c07-ac5e-1adf55bec04a"
+        zaaktype = "https://externe.catalogus.nl/api/v1/zaaktypen/b71f72ef-198d-44d8-af64-ae1932df830a"
+        zaaktype_data = get_zaaktype_response(catalogus, zaaktype)
+        ZaakFactory.create(zaaktype=zaaktype)
+        self.addCleanup(cache.clear)
+
+        with requests_mock.Mocker() as m:
+            m.get(zaaktype, json=zaaktype_data)
+
+            for _ in range(2):
+                response = self.client.get(
+                    self.url,
+                    {"expand": "zaaktype"},
+                    **ZAAK_READ_KWARGS,
+                )
+
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                self.assertEqual(
+                    response.json()["results"][0]["_expand"]["zaaktype"],
+                    zaaktype_data,
+                )
+
+        self.assertEqual(len(m.request_history), 1)
+
     def test_connection_error(self):
         """
         test that connection errors for external urls don't crash the response
@@ -0,0 +1,76 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+from rest_framework import status
+from rest_framework.test import APITestCase
+from vng_api_common.tests import reverse, reverse_lazy
+
+from openzaak.tests.utils import JWTAuthMixin
+
+from .factories import (
+    RolFactory,
+    ZaakEigenschapFactory,
+    ZaakFactory,
+    ZaakInformatieObjectFactory,
+    ZaakObjectFactory,
+)
+from .utils import ZAAK_READ_KWARGS
+
+HYPERLINKED_COLLECTIONS = (
+    "deelzaken",
+    "eigenschappen",
+    "rollen",
+    "zaakinformatieobjecten",
+    "zaakobjecten",
+)
+
+
+class ZaakListHyperlinkedCollectionsTests(JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+    list_url = reverse_lazy("zaak-list")
+
+    def setUp(self):
+        super().setUp()
+
+        self.zaak = ZaakFactory.create()
+        ZaakFactory.create_batch(2, hoofdzaak=self.zaak, zaaktype=self.zaak.zaaktype)
+        ZaakEigenschapFactory.create_batch(2, zaak=self.zaak)
+        RolFactory.create_batch(2, zaak=self.zaak)
+        ZaakInformatieObjectFactory.create_batch(2, zaak=self.zaak)
+        ZaakObjectFactory.create_batch(2, zaak=self.zaak)
+
+    def _get_list_data(self, **params) -> dict:
+        response = self.client.get(self.list_url, params, **ZAAK_READ_KWARGS)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        zaak_url = f"http://testserver{reverse(self.zaak)}"
+        return next(
+            result for result in response.json()["results"] if result["url"] == zaak_url
+        )
+
+    def test_list_renders_same_urls_as_detail(self):
+        detail_data = self.client.get(reverse(self.zaak), **ZAAK_READ_KWARGS).json()
+
+        list_data = self._get_list_data()
+
+        for field in HYPERLINKED_COLLECTIONS:
+            with self.subTest(field=field):
+                self.assertEqual(len(list_data[field]), 2)
+                self.assertCountEqual(list_data[field], detail_data[field])
+
+    def test_list_with_expand_renders_same_urls(self):
+        detail_data = self.client.get(reverse(self.zaak), **ZAAK_READ_KWARGS).json()
+
+        list_data = self._get_list_data(expand="rollen,eigenschappen")
+
+        for field in HYPERLINKED_COLLECTIONS:
+            with self.subTest(field=field):
+                self.assertCountEqual(list_data[field], detail_data[field])
+
+        self.assertCountEqual(
+            [rol["url"] for rol in list_data["_expand"]["rollen"]],
+            detail_data["rollen"],
+        )
+        self.assertCountEqual(
+            [eigenschap["url"] for eigenschap in list_data["_expand"]["eigenschappen"]],
+            detail_data["eigenschappen"],
+        )
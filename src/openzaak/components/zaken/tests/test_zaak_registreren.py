@@ -7,10 +7,12 @@ from django.test import override_settings, tag
 from freezegun import freeze_time
 from rest_framework import status
 from rest_framework.test import APITestCase
+from vng_api_common.audittrails.models import AuditTrail
 from vng_api_common.authorizations.models import Applicatie, Autorisatie
 from vng_api_common.constants import (
     ComponentTypes,
     RelatieAarden,
+    RolOmschrijving,
     RolTypes,
     VertrouwelijkheidsAanduiding,
     ZaakobjectTypes,
@@ -737,3 +739,79 @@ class ZaakRegistrerenValidationTests(JWTAuthMixin, APITestCase):
         )
         error = get_validation_errors(response, "zaak.bronorganisatie")
         self.assertEqual(error["code"], "required")
+
+    def test_register_zaak_multiple_related_objects(self):
+        roltype = RolTypeFactory.create(
+            zaaktype=self.zaaktype, omschrijving_generiek=RolOmschrijving.belanghebbende
+        )
+        rol = self.rol | {"roltype": f"http://testserver{reverse(roltype)}"}
+        informatieobject = EnkelvoudigInformatieObjectFactory.create(
+            informatieobjecttype=self.informatieobjecttype
+        )
+        content = {
+            "zaak": self.zaak,
+            "rollen": [rol, rol | {"roltoelichting": "other"}],
+            "zaakinformatieobjecten": [
+                self.zio,
+                self.zio
+                | {"informatieobject": self.check_for_instance(informatieobject)},
+            ],
+            "zaakobjecten": [self.zaakobject, self.zaakobject],
+            "status": self.status,
+        }
+
+        response = self.client.post(self.url, content)
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.data)
+
+        zaak = Zaak.objects.get()
+        self.assertEqual(zaak.rol_set.count(), 2)
+        self.assertEqual(zaak.zaakinformatieobject_set.count(), 2)
+        self.assertEqual(zaak.zaakobject_set.count(), 2)
+        self.assertEqual(
+            [rol["roltoelichting"] for rol in response.json()["rollen"]],
+            ["awerw", "other"],
+        )
+        # zaak, 2 rollen, 2 zaakinformatieobjecten, 2 zaakobjecten and the status
+        self.assertEqual(AuditTrail.objects.count(), 8)
+
+    def test_register_zaak_duplicate_informatieobject(self):
+        content = {
+            "zaak": self.zaak,
+            "rollen": [self.rol],
+            "zaakinformatieobjecten": [self.zio, self.zio],
+            "status": self.status,
+        }
+
+        response = self.client.post(self.url, content)
+
+        self.assertEqual(
+            response.status_code, status.HTTP_400_BAD_REQUEST, response.data
+        )
+
+        error = get_validation_errors(
+            response, "zaakinformatieobjecten.1.nonFieldErrors"
+        )
+        self.assertEqual(error["code"], "unique")
+        self.assertFalse(Zaak.objects.exists())
+
+    def test_register_zaak_multiple_initiators(self):
+        roltype = RolTypeFactory.create(
+            zaaktype=self.zaaktype, omschrijving_generiek=RolOmschrijving.initiator
+        )
+        rol = self.rol | {"roltype": f"http://testserver{reverse(roltype)}"}
+        content = {
+            "zaak": self.zaak,
+            "rollen": [rol, rol],
+            "status": self.status,
+        }
+
+        response = self.client.post(self.url, content)
+
+        self.assertEqual(
+            response.status_code, status.HTTP_400_BAD_REQUEST, response.data
+        )
+
+        error = get_validation_errors(response, "rollen.1.roltype")
+        self.assertEqual(error["code"], "max-occurences")
+        self.assertFalse(Zaak.objects.exists())
@@ -237,6 +237,36 @@ DOCUMENTEN_UPLOAD_READ_CHUNK = config(
     ),
     auto_display_default=False,
 )  # 6 MB default
+DOCUMENTEN_UPLOAD_ASYNC_ASSEMBLY = config(
+    "DOCUMENTEN_UPLOAD_ASYNC_ASSEMBLY",
+    False,
+    help_text=(
+        "if enabled, the upload chunks of large file uploads are merged by a "
+        "background task after the document is unlocked, instead of during the unlock "
+        "request. Until the task is finished, ``inhoud`` is empty and downloading the "
+        "document responds with HTTP 409. The progress is shown in the admin"
+    ),
+)
+DOCUMENTEN_UPLOAD_ASSEMBLY_TIMEOUT = config(
+    "DOCUMENTEN_UPLOAD_ASSEMBLY_TIMEOUT",
+    3600,
+    help_text=(
+        "the number of seconds after which the background merge of upload chunks "
+        "is started again if it made no progress, for example because the worker "
+        "was lost. Only used if ``DOCUMENTEN_UPLOAD_ASYNC_ASSEMBLY`` is enabled"
+    ),
+)
+DOCUMENTEN_CONTENT_ADDRESSED_STORAGE = config(
+    "DOCUMENTEN_CONTENT_ADDRESSED_STORAGE",
+    False,
+    help_text=(
+        "if enabled, the content of documents that is sent with the request is stored "
+        "by its SHA-256 hash, so versions and documents with the same content share "
+        "a single file, which is deleted once it's no longer used. The ``integriteit`` "
+        "of these documents is filled with the SHA-256 hash, unless another algorithm "
+        "is provided"
+    ),
+)
 DOCUMENTEN_UPLOAD_DEFAULT_EXTENSION = "bin"
 # Change the User-Agent value for the outgoing requests
 USER_AGENT = "Open Zaak"
@@ -315,6 +345,55 @@ LOOSE_FK_LOCAL_BASE_URLS = config(
         "http://api.example.nl/ozgv-t/catalogi/,http://api.example.nl/ozgv-t/autorisaties/``"
     ),
 )
+EXTERNAL_OBJECTS_MAX_WORKERS = config(
+    "EXTERNAL_OBJECTS_MAX_WORKERS",
+    default=10,
+    help_text=(
+        "the maximum number of external objects (for example zaaktypen from an "
+        "external Catalogi API) that are fetched concurrently when they are included "
+        "with the ``expand`` parameter."
+    ),
+)
+EXTERNAL_OBJECTS_CACHE_TIMEOUT = config(
+    "EXTERNAL_OBJECTS_CACHE_TIMEOUT",
+    default=0,
+    help_text=(
+        "the number of seconds external objects that are included with the "
+        "``expand`` parameter are cached, so they are not fetched again for every "
+        "request. Set to ``0`` to disable the cache."
+    ),
+)
+EXTERNAL_HTTP_CACHE = config(
+    "EXTERNAL_HTTP_CACHE",
+    default="",
+    help_text=(
+        "the name of the cache (for example ``default``) in which the responses of "
+        "external APIs (for example zaaktypen from an external Catalogi API) are "
+        "cached. The ``Cache-Control`` and ``ETag`` headers of the responses are "
+        "honoured. Leave empty to disable the cache."
+    ),
+)
+EXTERNAL_HTTP_CACHE_TIMEOUT = config(
+    "EXTERNAL_HTTP_CACHE_TIMEOUT",
+    default=300,
+    help_text=(
+        "the number of seconds responses of external APIs without a ``Cache-Control`` "
+        "header are cached, if ``EXTERNAL_HTTP_CACHE`` is set."
+    ),
+)
+AUDIT_TRAIL_SINK = config(
+    "AUDIT_TRAIL_SINK",
+    default="immediate",
+    help_text=(
+        "how the audit trails of the API are written. ``immediate`` writes them "
+        "within the transaction of the request. ``buffered`` writes the audit trails "
+        "of a transaction with a single query after it is committed, audit trails "
+        "are lost if this write fails. ``celery`` stores the audit trails in an "
+        "outbox within the transaction, which is written by a Celery task after the "
+        "transaction is committed. Possible values are: ``immediate``, ``buffered``, "
+        "``celery``."
+    ),
+)
 
 #
 # MAYKIN-2FA
@@ -373,7 +452,15 @@ CELERY_BEAT_SCHEDULE = {
     "daily-remove-imports": {
         "task": "openzaak.import_data.tasks.remove_imports",
         "schedule": crontab(hour="9"),
-    }
+    },
+    "requeue-stale-document-assemblies": {
+        "task": "openzaak.components.documenten.tasks.requeue_stale_assemblies",
+        "schedule": crontab(minute="*/10"),
+    },
+    "write-stale-audittrails": {
+        "task": "openzaak.utils.tasks.write_stale_audittrails",
+        "schedule": crontab(minute="*/10"),
+    },
 }
 CELERY_RESULT_EXPIRES = config(
     "CELERY_RESULT_EXPIRES",
@@ -493,6 +580,48 @@ FUZZY_PAGINATION_COUNT_LIMIT = config(
         "count is calculated in pagination when ``FUZZY_PAGINATION`` is enabled"
     ),
 )
+PAGINATION_COUNT_CACHE_TIMEOUT = config(
+    "PAGINATION_COUNT_CACHE_TIMEOUT",
+    default=0,
+    help_text=(
+        "the number of seconds the ``count`` of paginated list endpoints is cached "
+        "for the same filters and client, so requesting the next pages of a list "
+        "does not count all objects again. A cached count is reported with "
+        "``countExact`` set to ``false``. Set to ``0`` to disable the cache."
+    ),
+)
+PAGINATION_COUNT_ESTIMATE_THRESHOLD = config(
+    "PAGINATION_COUNT_ESTIMATE_THRESHOLD",
+    default=0,
+    help_text=(
+        "the number of rows from which the ``count`` of unfiltered paginated list "
+        "endpoints is taken from the database statistics instead of counting all "
+        "objects. An estimated count is reported with ``countExact`` set to "
+        "``false``. Set to ``0`` to always count the objects."
+    ),
+)
+AUTORISATIES_FILTERS_CACHE_TIMEOUT = config(
+    "AUTORISATIES_FILTERS_CACHE_TIMEOUT",
+    default=300,
+    help_text=(
+        "the number of seconds the authorization filters of list endpoints are cached "
+        "for each ``Applicatie``. Changes to ``Applicatie``, ``Autorisatie`` and "
+        "``CatalogusAutorisatie`` records or to the catalogi invalidate the cache "
+        "immediately, so the timeout only applies to changes made outside of Open Zaak. "
+        "Set to ``0`` to disable the cache."
+    ),
+)
+AUTORISATIES_FILTERS_VALUES_JOIN = config(
+    "AUTORISATIES_FILTERS_VALUES_JOIN",
+    default=False,
+    help_text=(
+        "if this variable is set to ``true``, ``yes`` or ``1``, list endpoints filter "
+        "the objects a client is authorized for by joining against an inline list of "
+        "the authorized types and their maximum ``vertrouwelijkheidaanduiding``, "
+        "instead of combining a filter for each ``vertrouwelijkheidaanduiding``. "
+        "This can improve the performance for clients authorized for many types."
+    ),
+)
 
 # Import settings
 IMPORT_RETENTION_DAYS = config(
@@ -526,6 +655,18 @@ IMPORT_DOCUMENTEN_BATCH_SIZE = config(
     group="Documenten import",
 )
 
+IMPORT_DOCUMENTEN_SHARDS = config(
+    "IMPORT_DOCUMENTEN_SHARDS",
+    1,
+    help_text=(
+        "is the number of parts the import metadata file is split in, which are "
+        "processed in parallel by the Celery workers. Used for bulk importing "
+        "``EnkelvoudigInformatieObject``'s. Requires a Celery result backend if "
+        "larger than ``1``."
+    ),
+    group="Documenten import",
+)
+
 NOTIFICATIONS_API_GET_DOMAIN = "openzaak.utils.get_openzaak_domain"
 
 ENABLE_CLOUD_EVENTS = config(
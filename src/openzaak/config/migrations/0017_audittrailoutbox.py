@@ -0,0 +1,45 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+# Generated by Django 5.2.3 on 2026-10-18 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("config", "0016_cloudeventconfig"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="AuditTrailOutbox",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "trails",
+                    models.JSONField(
+                        help_text="The serialized audit trails, in the order of the actions.",
+                        verbose_name="audit trails",
+                    ),
+                ),
+                (
+                    "created_on",
+                    models.DateTimeField(
+                        auto_now_add=True, db_index=True, verbose_name="created on"
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "audit trail outbox entry",
+                "verbose_name_plural": "audit trail outbox entries",
+            },
+        ),
+    ]
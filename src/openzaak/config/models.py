@@ -97,3 +97,27 @@ class CloudEventConfig(SingletonModel):
     class Meta:
         verbose_name = _("CloudEvents configuration")
         verbose_name_plural = _("CloudEvents configurations")
+
+
+class AuditTrailOutbox(models.Model):
+    """
+    Audit trails which are yet to be written by Celery.
+
+    The ``celery`` audit trail sink stores the audit trails within the transaction of
+    the request, so they are committed or rolled back along with the data they
+    describe. The entries are removed once the audit trails are written.
+    """
+
+    trails = models.JSONField(
+        _("audit trails"),
+        help_text=_("The serialized audit trails, in the order of the actions."),
+    )
+    created_on = models.DateTimeField(
+        _("created on"),
+        auto_now_add=True,
+        db_index=True,
+    )
+
+    class Meta:
+        verbose_name = _("audit trail outbox entry")
+        verbose_name_plural = _("audit trail outbox entries")
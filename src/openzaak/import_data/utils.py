@@ -7,10 +7,11 @@ from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 from time import monotonic
-from typing import Generator, Optional
+from typing import Callable, Generator, Optional
 
 from django.core.cache import cache
 from django.db import DatabaseError
+from django.db.models import F
 from django.utils import timezone
 
 import structlog
@@ -33,6 +34,38 @@ def get_csv_generator(filename: str) -> Generator[tuple[int, list], None, None]:
             index += 1
 
 
+def get_csv_offsets_generator(
+    filename: str, start: int = 0, end: Optional[int] = None, first_index: int = 1
+) -> Generator[tuple[int, list, int], None, None]:
+    """
+    Yields the rows between the byte offsets ``start`` and ``end`` together with the
+    byte offset at which each row ends.
+
+    The offsets of rows are always aligned on record boundaries (multiline quoted
+    values included), which makes them usable to split the file in shards.
+    """
+    offset = start
+
+    def get_lines():
+        nonlocal offset
+
+        with open(filename, "rb") as csv_file:
+            csv_file.seek(start)
+
+            for line in csv_file:
+                if end is not None and offset >= end:
+                    return
+
+                offset += len(line)
+                yield line.decode()
+
+    # the reader does not read ahead, so `offset` is at the end of the current row
+    csv_reader = csv.reader(get_lines(), delimiter=",", quotechar='"')
+
+    for index, row in enumerate(csv_reader, start=first_index):
+        yield index, row, offset
+
+
 def get_total_count(filename: str, include_header: bool = False) -> int:
     with open(filename) as csv_file:
         csv_reader = csv.reader(csv_file, delimiter=",", quotechar='"')
@@ -127,6 +160,32 @@ def finish_batch(import_instance: Import, batch: list, headers: list) -> None:
     cleanup_import_files(batch)
 
 
+def finish_shard_batch(import_instance: Import, shard: int, batch: list) -> None:
+    """
+    Like `finish_batch`, for batches of shards which are processed concurrently.
+    """
+    _processed, _fail_count, _success_count = get_batch_statistics(batch)
+
+    try:
+        Import.objects.filter(pk=import_instance.pk).update(
+            processed=F("processed") + _processed,
+            processed_successfully=F("processed_successfully") + _success_count,
+            processed_invalid=F("processed_invalid") + _fail_count,
+        )
+    except DatabaseError as e:
+        logger.critical(
+            "unable_to_save_batch_statistics_due_to_database_error",
+            shard=shard,
+            error=str(e),
+        )
+
+    logger.info("writing_batch_to_shard_report_file", shard=shard)
+    write_shard_report(import_instance, shard, batch)
+
+    logger.info("removing_files_for_unimported_rows", shard=shard)
+    cleanup_import_files(batch)
+
+
 def cleanup_import_files(batch: list) -> None:
     for row in batch:
         if row.succeeded:
@@ -203,11 +262,68 @@ def write_to_file(instance: Import, batch: list, headers: list) -> None:
         )
 
 
+def get_shard_report_path(instance: Import, shard: int) -> Path:
+    default_dir = get_default_path(Import.report_file.field)
+    return default_dir / f"report-{instance.pk}-{shard}.csv"
+
+
+def write_shard_report(instance: Import, shard: int, batch: list) -> None:
+    """
+    Appends the batch to the (headerless) report of a single shard.
+    """
+    path = get_shard_report_path(instance, shard)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    with open(path, "a") as _export_file:
+        csv_writer = csv.writer(_export_file, delimiter=",", quotechar='"')
+
+        for row in batch:
+            data = row.as_export_data()
+            csv_writer.writerow(data.values())
+
+
+def merge_shard_reports(instance: Import, shard_count: int, headers: list) -> None:
+    """
+    Concatenates the reports of all shards, in order, into the report of the import.
+    """
+    default_dir = get_default_path(Import.report_file.field)
+    default_name = f"report-{instance.pk}.csv"
+
+    if not default_dir.exists():
+        default_dir.mkdir(parents=True)
+
+    with open(default_dir / default_name, "w") as _export_file:
+        csv_writer = csv.writer(_export_file, delimiter=",", quotechar='"')
+        csv_writer.writerow(headers)
+
+        for shard in range(shard_count):
+            path = get_shard_report_path(instance, shard)
+
+            if not path.exists():
+                continue
+
+            with open(path) as shard_file:
+                shutil.copyfileobj(shard_file, _export_file)
+
+            path.unlink()
+
+    relative_path = Path(instance.report_file.field.upload_to) / default_name
+    instance.report_file.name = str(relative_path)
+
+    try:
+        instance.save(update_fields=["report_file"])
+    except DatabaseError as e:
+        logger.critical(
+            "unable_to_save_new_report_file_due_to_database_error",
+            error=str(e),
+        )
+
+
 LOCK_EXPIRE = 60 * (60 * 24)  # 24 hours
 
 
 @contextmanager
-def task_lock(lock_id, oid):
+def task_lock(lock_id, oid, keep: Callable[[], bool] = lambda: False):
     timeout_at = monotonic() + LOCK_EXPIRE - 3
     logger.info(
         "lock_cache_added",
@@ -218,7 +334,7 @@ def task_lock(lock_id, oid):
     try:
         yield status
     finally:
-        if monotonic() < timeout_at and status:
+        if monotonic() < timeout_at and status and not keep():
             logger.warning(
                 "lock_cache_deleted",
                 lock_id=lock_id,
@@ -227,13 +343,36 @@ def task_lock(lock_id, oid):
             cache.delete(lock_id)
 
 
+def get_task_lock_id(task_name: str) -> str:
+    return f"{task_name}_lock"
+
+
+def keep_task_lock(task) -> None:
+    """
+    Keep the lock of the running task (see :func:`task_locker`) after it returns, for
+    example until the tasks it dispatched are finished. The lock must be released
+    with :func:`release_task_lock`.
+    """
+    task.request.keep_task_lock = True
+
+
+def release_task_lock(task_name: str) -> None:
+    lock_id = get_task_lock_id(task_name)
+    logger.warning("lock_cache_deleted", lock_id=lock_id)
+    cache.delete(lock_id)
+
+
 # Note that this not will not work with per process caches (e.g LocMemCache)
 def task_locker(func):
     @functools.wraps(func)
     def wrapped(*args, **kwargs):
         instance = args[0]
-        lock_id = f"{instance.name}_lock"
-        with task_lock(lock_id, instance.app.oid) as acquired:
+        lock_id = get_task_lock_id(instance.name)
+
+        def keep() -> bool:
+            return getattr(instance.request, "keep_task_lock", False)
+
+        with task_lock(lock_id, instance.app.oid, keep=keep) as acquired:
             if acquired:
                 return func(*args, **kwargs)
         logger.warning(
@@ -1,19 +1,122 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2019 - 2020 Dimpact
+import hashlib
 import json
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from contextvars import ContextVar
 from inspect import getmembers
-from typing import Any, Dict
+from typing import Any, Dict, Iterable, Iterator, Optional, Union
 
+from django.conf import settings
+from django.core.cache import cache
 from django.db import models
 from django.db.models.base import ModelBase
 
 import requests
+import structlog
 from django_loose_fk.loaders import BaseLoader, FetchError, FetchJsonError
 from django_loose_fk.virtual_models import virtual_model_factory
 from djangorestframework_camel_case.util import underscoreize
 from vng_api_common.descriptors import GegevensGroepType
 
-from openzaak.utils.auth import get_auth
+from openzaak.client import get_session
+
+logger = structlog.stdlib.get_logger(__name__)
+
+# objects fetched up front by `fetch_objects`, see `use_prefetched_objects`
+_prefetched_objects: ContextVar[Optional[Dict[str, Union[dict, FetchError]]]] = (
+    ContextVar("prefetched_objects", default=None)
+)
+
+
+def request_object(url: str, session: Optional[requests.Session] = None) -> dict:
+    """
+    Fetch the (camelCased) data of a single external API object.
+
+    :param session: the pooled client of the service of the URL, which is looked up
+      if not provided.
+    """
+    try:
+        response = (session or get_session(url)).get(url)
+    except requests.exceptions.RequestException as exc:
+        raise FetchError(exc.args[0]) from exc
+
+    try:
+        response.raise_for_status()
+    except requests.HTTPError as exc:
+        raise FetchError(exc.args[0]) from exc
+
+    try:
+        return response.json()
+    except json.JSONDecodeError as exc:
+        raise FetchJsonError(exc.args[0]) from exc
+
+
+def _get_object_cache_key(url: str) -> str:
+    return f"loaders:object:{hashlib.sha256(url.encode()).hexdigest()}"
+
+
+def fetch_objects(urls: Iterable[str]) -> Dict[str, Union[dict, FetchError]]:
+    """
+    ⚡️ Fetch multiple external API objects concurrently.
+
+    The objects are fetched with a bounded thread pool sharing the pooled clients, and
+    are cached for ``EXTERNAL_OBJECTS_CACHE_TIMEOUT`` seconds. Objects that could not
+    be fetched are mapped to the raised error.
+    """
+    urls = list(dict.fromkeys(urls))
+    results: Dict[str, Union[dict, FetchError]] = {}
+
+    cache_timeout = settings.EXTERNAL_OBJECTS_CACHE_TIMEOUT
+    if cache_timeout:
+        cache_keys = {_get_object_cache_key(url): url for url in urls}
+        for cache_key, data in cache.get_many(cache_keys.keys()).items():
+            results[cache_keys[cache_key]] = data
+
+    to_fetch = [url for url in urls if url not in results]
+    if not to_fetch:
+        return results
+
+    # resolve the clients up front, to keep database access out of the threads
+    sessions = {url: get_session(url) for url in to_fetch}
+
+    max_workers = max(min(settings.EXTERNAL_OBJECTS_MAX_WORKERS, len(to_fetch)), 1)
+    fetched = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(request_object, url, sessions[url]): url for url in to_fetch
+        }
+        for future in as_completed(futures):
+            url = futures[future]
+            try:
+                results[url] = fetched[url] = future.result()
+            except (FetchError, FetchJsonError) as exc:
+                logger.warning("external_object_fetch_failed", url=url, error=str(exc))
+                results[url] = exc
+
+    if cache_timeout and fetched:
+        cache.set_many(
+            {_get_object_cache_key(url): data for url, data in fetched.items()},
+            timeout=cache_timeout,
+        )
+
+    return results
+
+
+@contextmanager
+def use_prefetched_objects(
+    objects: Dict[str, Union[dict, FetchError]],
+) -> Iterator[None]:
+    """
+    Let :meth:`AuthorizedRequestsLoader.fetch_object` use the objects fetched by
+    :func:`fetch_objects` instead of requesting them again.
+    """
+    token = _prefetched_objects.set(objects)
+    try:
+        yield
+    finally:
+        _prefetched_objects.reset(token)
 
 
 class AuthorizedRequestsLoader(BaseLoader):
@@ -23,24 +126,13 @@ class AuthorizedRequestsLoader(BaseLoader):
 
     @staticmethod
     def fetch_object(url: str, do_underscoreize=True) -> dict:
-        # TODO should we replace it with Service.get_client() and use it instead of requests?
-        # but in this case we couldn't catch separate FetchJsonError
-        headers = get_auth(url)
-
-        try:
-            response = requests.get(url, headers=headers)
-        except requests.exceptions.RequestException as exc:
-            raise FetchError(exc.args[0]) from exc
-
-        try:
-            response.raise_for_status()
-        except requests.HTTPError as exc:
-            raise FetchError(exc.args[0]) from exc
-
-        try:
-            data = response.json()
-        except json.JSONDecodeError as exc:
-            raise FetchJsonError(exc.args[0]) from exc
+        prefetched = _prefetched_objects.get() or {}
+        if url in prefetched:
+            data = prefetched[url]
+            if isinstance(data, (FetchError, FetchJsonError)):
+                raise data
+        else:
+            data = request_object(url)
 
         if not do_underscoreize:
             return data
@@ -85,6 +85,9 @@ from openzaak.components.zaken.api.scopes import (
     SCOPE_ZAKEN_BIJWERKEN,
     SCOPE_ZAKEN_CREATE,
 )
+from openzaak.components.zaken.management.commands.backfill_current_status import (
+    backfill_current_status,
+)
 from openzaak.components.zaken.models import (
     Resultaat,
     Rol,
@@ -481,6 +484,8 @@ class Command(BaseCommand):
             ]
         )
         self.bulk_create(Status, statussen_generator)
+        # bulk_create bypasses the signals that maintain the current status
+        backfill_current_status()
 
         # 1 mln resultaten
         resultaattypen = ResultaatType.objects.order_by("zaaktype", "id")
@@ -21,18 +21,26 @@ class MultipleNotificationMixin(NotificationMixin):
         super().notify(status_code, data, instance)
 
     def _message(self, data, instance=None):
+        messages = []
         for field, config in self.notification_fields.items():
             field_data = data[field]
             notifications = field_data if isinstance(field_data, list) else [field_data]
 
             for notif in notifications:
                 # build the content of the notification
-                message = self.construct_message(
-                    notif,
-                    instance=instance,
-                    kanaal=config["notifications_kanaal"],
-                    model=config["model"],
-                    action=config.get("action"),
+                messages.append(
+                    self.construct_message(
+                        notif,
+                        instance=instance,
+                        kanaal=config["notifications_kanaal"],
+                        model=config["model"],
+                        action=config.get("action"),
+                    )
                 )
 
-                transaction.on_commit(lambda msg=message: send_notification.delay(msg))
+        # ⚡️ schedule all notifications with one commit hook
+        def send_notifications():
+            for message in messages:
+                send_notification.delay(message)
+
+        transaction.on_commit(send_notifications)
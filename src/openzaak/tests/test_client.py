@@ -0,0 +1,127 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+from django.core.cache import caches
+from django.test import TestCase, override_settings
+
+import requests_mock
+from zgw_consumers.constants import APITypes, AuthTypes
+from zgw_consumers.test.factories import ServiceFactory
+
+from openzaak.client import fetch_object, get_pooled_client
+from openzaak.loaders import AuthorizedRequestsLoader
+from openzaak.utils.auth import get_auth
+
+ZAAKTYPE = "https://externe.catalogus.nl/api/v1/zaaktypen/1"
+
+
+class PooledClientTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        cls.service = ServiceFactory.create(
+            api_root="https://externe.catalogus.nl/api/v1/",
+            api_type=APITypes.ztc,
+            auth_type=AuthTypes.zgw,
+            client_id="client-id",
+            secret="secret",
+        )
+
+    def test_client_reused(self):
+        client = get_pooled_client(self.service)
+
+        self.assertIs(get_pooled_client(self.service), client)
+        # the JWT is not generated again
+        self.assertEqual(get_auth(ZAAKTYPE), get_auth(ZAAKTYPE))
+
+    def test_client_rebuilt_for_changed_configuration(self):
+        client = get_pooled_client(self.service)
+
+        self.service.secret = "other-secret"
+        self.service.save()
+
+        self.assertIsNot(get_pooled_client(self.service), client)
+
+    def test_client_rebuilt_before_jwt_expires(self):
+        self.service.jwt_valid_for = 30
+        self.service.save()
+
+        client = get_pooled_client(self.service)
+
+        self.assertIsNot(get_pooled_client(self.service), client)
+
+    def test_connections_reused(self):
+        with requests_mock.Mocker() as m:
+            m.get(ZAAKTYPE, json={"url": ZAAKTYPE})
+
+            fetch_object(ZAAKTYPE)
+            AuthorizedRequestsLoader.fetch_object(ZAAKTYPE)
+
+        self.assertEqual(m.call_count, 2)
+        # the pooled client is not closed after the request
+        self.assertTrue(get_pooled_client(self.service)._in_context_manager)
+
+
+@override_settings(EXTERNAL_HTTP_CACHE="import_requests")
+class HTTPCacheTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        ServiceFactory.create(
+            api_root="https://externe.catalogus.nl/api/v1/",
+            api_type=APITypes.ztc,
+            auth_type=AuthTypes.zgw,
+        )
+
+    def setUp(self):
+        super().setUp()
+
+        self.addCleanup(caches["import_requests"].clear)
+
+    def test_cache_control(self):
+        with requests_mock.Mocker() as m:
+            m.get(
+                ZAAKTYPE,
+                json={"url": ZAAKTYPE},
+                headers={"Cache-Control": "max-age=60"},
+            )
+
+            AuthorizedRequestsLoader.fetch_object(ZAAKTYPE)
+            data = AuthorizedRequestsLoader.fetch_object(ZAAKTYPE)
+
+        self.assertEqual(data, {"url": ZAAKTYPE})
+        self.assertEqual(m.call_count, 1)
+
+    def test_revalidate_etag(self):
+        with requests_mock.Mocker() as m:
+            m.get(
+                ZAAKTYPE,
+                [
+                    {
+                        "json": {"url": ZAAKTYPE},
+                        "headers": {"Cache-Control": "no-cache", "ETag": '"abc"'},
+                    },
+                    {"status_code": 304, "headers": {"ETag": '"abc"'}},
+                ],
+            )
+
+            fetch_object(ZAAKTYPE)
+            data = fetch_object(ZAAKTYPE)
+
+        self.assertEqual(data, {"url": ZAAKTYPE})
+        self.assertEqual(m.call_count, 2)
+        self.assertEqual(m.last_request.headers["If-None-Match"], '"abc"')
+
+    def test_no_store(self):
+        with requests_mock.Mocker() as m:
+            m.get(
+                ZAAKTYPE,
+                json={"url": ZAAKTYPE},
+                headers={"Cache-Control": "no-store"},
+            )
+
+            fetch_object(ZAAKTYPE)
+            fetch_object(ZAAKTYPE)
+
+        self.assertEqual(m.call_count, 2)
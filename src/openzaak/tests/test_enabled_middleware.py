@@ -46,3 +46,27 @@ class EnabledMiddlewareDatabaseQueryTest(TestCase):
             response = self.middleware.process_view(request, None, None, None)
 
         self.assertIsNone(response)
+
+    def test_disabled_services_cached(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            service, _ = InternalService.objects.update_or_create(
+                api_type=ComponentTypes.zrc, defaults={"enabled": False}
+            )
+
+        request = self.factory.get("/zaken/api/v1/")
+
+        with self.assertNumQueries(1):
+            self.middleware.process_view(request, None, None, None)
+        with self.assertNumQueries(0):
+            response = self.middleware.process_view(request, None, None, None)
+
+        self.assertIsInstance(response, HttpResponseNotFound)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            service.enabled = True
+            service.save()
+
+        with self.assertNumQueries(1):
+            response = self.middleware.process_view(request, None, None, None)
+
+        self.assertIsNone(response)
@@ -8,6 +8,8 @@ from vng_api_common.constants import ComponentTypes, VertrouwelijkheidsAanduidin
 from vng_api_common.models import JWTSecret
 from vng_api_common.tests import reverse
 
+from openzaak.components.autorisaties.cache import bump_autorisaties_version
+
 
 class JWTAuthMixin:
     """
@@ -71,6 +73,9 @@ class JWTAuthMixin:
     def setUp(self):
         super().setUp()
 
+        # the cached authorization filters don't survive the rollback of a test
+        bump_autorisaties_version()
+
         token = generate_jwt(
             self.client_id,
             self.secret,
@@ -3,7 +3,7 @@
 from django.apps import AppConfig
 from django.conf import settings
 from django.db import models
-from django.db.models.signals import post_migrate
+from django.db.models.signals import post_delete, post_migrate, post_save
 
 from django_loose_fk.virtual_models import HANDLERS, FKHandler
 from requests import utils
@@ -14,6 +14,10 @@ class UtilsConfig(AppConfig):
     name = "openzaak.utils"
 
     def ready(self):
+        from zgw_consumers.models import Service
+
+        from openzaak.config.models import InternalService
+
         from . import (  # noqa
             checks,
             fields,
@@ -22,12 +26,26 @@ class UtilsConfig(AppConfig):
             oas_extensions,
             serializer_fields,
         )
+        from .middleware import (
+            internal_service_changed,
+            invalidate_disabled_api_types,
+        )
+        from .services import invalidate_service_index, service_changed
         from .signals import update_admin_index
 
         utils.default_user_agent = default_user_agent
 
         post_migrate.connect(update_admin_index, sender=self)
 
+        # keep the service index and the disabled internal services in sync, the
+        # test database is flushed with post_migrate as well
+        post_save.connect(service_changed, sender=Service)
+        post_delete.connect(service_changed, sender=Service)
+        post_migrate.connect(invalidate_service_index)
+        post_save.connect(internal_service_changed, sender=InternalService)
+        post_delete.connect(internal_service_changed, sender=InternalService)
+        post_migrate.connect(invalidate_disabled_api_types)
+
         # register FKOrServiceUrlField drf field
         mapping = serializers.ModelSerializer.serializer_field_mapping
         mapping[fields.FkOrServiceUrlField] = serializer_fields.FKOrServiceUrlField
@@ -0,0 +1,281 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+"""
+Write the audit trails of the API through a configurable sink.
+
+The sink is selected with the ``AUDIT_TRAIL_SINK`` setting:
+
+* ``immediate``: the audit trails are inserted right away, within the transaction
+  of the request.
+* ``buffered``: the audit trails of a transaction are collected and inserted with
+  a single query after the transaction is committed, on a best effort basis.
+* ``celery``: the audit trails are stored in an outbox within the transaction and
+  inserted by a Celery task after the transaction is committed.
+"""
+
+import json
+import threading
+from functools import partial
+from typing import Callable, Dict, List, Set
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django.utils import timezone
+
+import structlog
+from kombu.exceptions import OperationalError
+from vng_api_common.audittrails.models import AuditTrail
+from vng_api_common.audittrails.viewsets import (
+    AuditTrailCreateMixin as _AuditTrailCreateMixin,
+    AuditTrailDestroyMixin as _AuditTrailDestroyMixin,
+    AuditTrailMixin as _AuditTrailMixin,
+    AuditTrailUpdateMixin as _AuditTrailUpdateMixin,
+)
+from vng_api_common.compat import get_header
+from vng_api_common.constants import CommonResourceAction
+
+from openzaak.config.models import AuditTrailOutbox
+
+logger = structlog.stdlib.get_logger(__name__)
+
+ACTION_LABELS = dict(zip(CommonResourceAction.names, CommonResourceAction.labels))
+
+
+def write_audittrails(trails: List[AuditTrail]) -> None:
+    AuditTrail.objects.bulk_create(trails)
+
+
+def serialize_audittrail(trail: AuditTrail) -> dict:
+    """
+    Convert the (unsaved) audit trail to JSON-serializable data for a Celery task.
+    """
+    data = {
+        field.attname: field.value_from_object(trail)
+        for field in AuditTrail._meta.concrete_fields
+        if not field.primary_key
+    }
+    return json.loads(json.dumps(data, cls=DjangoJSONEncoder))
+
+
+class AuditTrailSink:
+    def add(self, trails: List[AuditTrail]) -> None:
+        raise NotImplementedError
+
+
+class ImmediateAuditTrailSink(AuditTrailSink):
+    def add(self, trails: List[AuditTrail]) -> None:
+        write_audittrails(trails)
+
+
+class _TransactionBuffer:
+    def __init__(self, savepoint_ids: Set[str], flush: Callable):
+        self.savepoint_ids = savepoint_ids
+        self.items: list = []
+        self.hook = partial(flush, self)
+
+
+class BufferedAuditTrailSink(AuditTrailSink):
+    """
+    ⚡️ Collect the audit trails of a transaction and write them once it is committed.
+
+    Audit trails added outside of a transaction are written right away. Audit trails
+    added in a savepoint which started after the first audit trail of the transaction
+    are written right away too, so they are rolled back along with the savepoint.
+
+    This is best effort: the audit trails are lost if the process stops between the
+    commit and the write, or if the write fails.
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+
+    def _get_buffer(self, connection) -> _TransactionBuffer:
+        """
+        Return the buffer of the current transaction, flushed once it is committed.
+        """
+        buffer = getattr(self._local, "buffer", None)
+        # the commit hook of the buffer is discarded by Django when the transaction
+        # or savepoint it was registered in is rolled back
+        if buffer is None or not any(
+            hook is buffer.hook for _, hook, _ in connection.run_on_commit
+        ):
+            buffer = self._local.buffer = _TransactionBuffer(
+                set(connection.savepoint_ids), self._flush
+            )
+            # the data is committed at this point, so a failing flush should not
+            # fail the request
+            transaction.on_commit(buffer.hook, robust=True)
+        return buffer
+
+    def _flush(self, buffer: _TransactionBuffer) -> None:
+        if getattr(self._local, "buffer", None) is buffer:
+            self._local.buffer = None
+        if buffer.items:
+            self.flush(buffer.items)
+
+    def add(self, trails: List[AuditTrail]) -> None:
+        connection = transaction.get_connection()
+        if not connection.in_atomic_block:
+            self.flush(trails)
+            return
+
+        buffer = self._get_buffer(connection)
+        # the savepoints of the buffer which are not active anymore are released,
+        # otherwise the buffer would have been discarded
+        if set(connection.savepoint_ids) <= buffer.savepoint_ids:
+            buffer.items.extend(trails)
+        else:
+            write_audittrails(trails)
+
+    def flush(self, trails: List[AuditTrail]) -> None:
+        write_audittrails(trails)
+
+
+class CeleryAuditTrailSink(BufferedAuditTrailSink):
+    """
+    Hand the audit trails to a Celery task through an outbox.
+
+    The audit trails are stored in the outbox within the transaction, with a single
+    query, and the outbox entries of a transaction are sent as one task once it is
+    committed. Entries which are not written, because the message broker can't be
+    reached or the task is lost, are picked up by a periodic task, so the audit
+    trails of committed transactions are always written.
+    """
+
+    def add(self, trails: List[AuditTrail]) -> None:
+        entry = AuditTrailOutbox.objects.create(
+            trails=[serialize_audittrail(trail) for trail in trails]
+        )
+
+        connection = transaction.get_connection()
+        if not connection.in_atomic_block:
+            self.flush([entry.pk])
+            return
+
+        # entries of rolled back savepoints don't exist and are skipped by the task
+        self._get_buffer(connection).items.append(entry.pk)
+
+    def flush(self, outbox_ids: List[int]) -> None:
+        from .tasks import write_audittrails as write_audittrails_task
+
+        try:
+            write_audittrails_task.delay(outbox_ids)
+        except OperationalError as exc:
+            # the audit trails are left in the outbox for the periodic task
+            logger.warning("audittrail_queue_unavailable", exc_info=exc)
+
+
+SINKS: Dict[str, AuditTrailSink] = {
+    "immediate": ImmediateAuditTrailSink(),
+    "buffered": BufferedAuditTrailSink(),
+    "celery": CeleryAuditTrailSink(),
+}
+
+
+def get_audittrail_sink() -> AuditTrailSink:
+    try:
+        return SINKS[settings.AUDIT_TRAIL_SINK]
+    except KeyError:
+        raise ImproperlyConfigured(
+            f"AUDIT_TRAIL_SINK should be one of {', '.join(SINKS)}, "
+            f"got '{settings.AUDIT_TRAIL_SINK}'"
+        )
+
+
+class AuditTrailMixin(_AuditTrailMixin):
+    """
+    Audit trail mixin that writes the audit trails through the configured sink.
+
+    Viewsets creating many objects can build the audit trails with
+    :meth:`build_audittrail` and write them at once with :meth:`create_audittrails`.
+    """
+
+    def build_audittrail(
+        self,
+        status_code,
+        action,
+        version_before_edit,
+        version_after_edit,
+        unique_representation,
+        audit=None,
+        basename=None,
+        main_object=None,
+    ) -> AuditTrail:
+        """
+        Build the (unsaved) audittrail for the action that has been carried out.
+
+        Copy of :meth:`vng_api_common.audittrails.viewsets.AuditTrailMixin.create_audittrail`
+        of the pinned version of vng-api-common, without saving the audittrail. The
+        tests check that both build the same audittrail.
+        """
+        data = version_after_edit or version_before_edit
+
+        audit = audit or self.audit
+        basename = basename or self.basename
+        main_object = main_object or self.get_audittrail_main_object_url(
+            data, self.audit.main_resource
+        )
+
+        jwt_auth = self.request.jwt_auth
+        applications = jwt_auth.applicaties
+        if len(applications) > 1:
+            logger.warning("unexpected_applications", count=len(applications))
+
+        if applications:
+            application = applications[0]
+            app_id, app_presentation = str(application.uuid), application.label
+        else:
+            app_id = get_header(self.request, "X-NLX-Request-Application-Id")
+            app_presentation = app_id  # we don't have any extra information...
+
+        return AuditTrail(
+            bron=audit.component_name,
+            logrecord_id=get_header(self.request, "X-NLX-Logrecord-ID") or "",
+            applicatie_id=app_id,
+            applicatie_weergave=app_presentation,
+            actie=action,
+            actie_weergave=ACTION_LABELS.get(action, ""),
+            gebruikers_id=jwt_auth.payload.get("user_id") or "",
+            gebruikers_weergave=jwt_auth.payload.get("user_representation") or "",
+            resultaat=status_code,
+            hoofd_object=main_object,
+            resource=basename,
+            resource_url=data["url"],
+            # overwritten on insert, but kept for audit trails written by Celery
+            aanmaakdatum=timezone.now(),
+            toelichting=get_header(self.request, "X-Audit-Toelichting") or "",
+            resource_weergave=unique_representation,
+            oud=version_before_edit,
+            nieuw=version_after_edit,
+        )
+
+    def create_audittrail(self, *args, **kwargs) -> None:
+        self.create_audittrails([self.build_audittrail(*args, **kwargs)])
+
+    @staticmethod
+    def create_audittrails(trails: List[AuditTrail]) -> None:
+        """
+        ⚡️ Write the audit trails built with :meth:`build_audittrail` at once.
+        """
+        if trails:
+            get_audittrail_sink().add(trails)
+
+
+class AuditTrailCreateMixin(_AuditTrailCreateMixin, AuditTrailMixin):
+    pass
+
+
+class AuditTrailUpdateMixin(_AuditTrailUpdateMixin, AuditTrailMixin):
+    pass
+
+
+class AuditTrailDestroyMixin(_AuditTrailDestroyMixin, AuditTrailMixin):
+    pass
+
+
+class AuditTrailViewsetMixin(
+    AuditTrailCreateMixin, AuditTrailUpdateMixin, AuditTrailDestroyMixin
+):
+    pass
@@ -7,21 +7,23 @@ logger = structlog.stdlib.get_logger(__name__)
 
 
 def get_auth(url: str) -> dict:
-    from zgw_consumers.client import ServiceConfigAdapter
-    from zgw_consumers.models import Service
+    from openzaak.client import get_pooled_client
+
+    from .services import get_service
 
     logger.info("authenticating_for_url", url=url)
-    service = Service.get_service(url)
+    service = get_service(url)
 
     if not service:
         logger.warning("no_service_found_for_url", url=url)
         return {}
 
+    # ⚡️ reuse the auth of the pooled client, instead of generating a JWT every call
     if service.auth_type == AuthTypes.zgw:
-        auth = ServiceConfigAdapter(service).get_client_session_kwargs()["auth"]
+        auth = get_pooled_client(service).auth
         return {"Authorization": f"Bearer {auth._token}"}
     elif service.auth_type == AuthTypes.api_key:
-        auth = ServiceConfigAdapter(service).get_client_session_kwargs()["auth"]
+        auth = get_pooled_client(service).auth
         return {auth.header: auth.key}
 
     logger.debug("no_auth_configured_for_service", url=url)
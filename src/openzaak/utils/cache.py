@@ -3,12 +3,14 @@
 from contextlib import contextmanager
 from typing import Iterable
 
+from django.conf import settings
 from django.core.cache import caches
 
 import requests_cache
 from requests_cache import BaseCache, clear, install_cache, uninstall_cache
 from requests_cache.policy import CacheSettings
 from requests_cache.session import CachedSession
+from vng_api_common.client import Client
 
 
 class DjangoCacheStorage(requests_cache.BaseStorage):
@@ -87,6 +89,31 @@ class DjangoRequestsCache(requests_cache.BaseCache):
         return f"<{self.__class__.__name__}(name={self.cache_name})>"
 
 
+class DjangoCachedSession(CachedSession):
+    """
+    Session caching the responses of external APIs in the Django cache configured with
+    ``EXTERNAL_HTTP_CACHE``.
+
+    The ``Cache-Control`` headers of the responses are honoured, and expired responses
+    with an ``ETag`` are revalidated with a conditional request.
+    """
+
+    def __init__(self, *args, **kwargs):
+        cache_name = settings.EXTERNAL_HTTP_CACHE
+        super().__init__(
+            *args,
+            cache_name=cache_name,
+            backend=DjangoRequestsCache(cache_name),
+            expire_after=settings.EXTERNAL_HTTP_CACHE_TIMEOUT,
+            cache_control=True,
+            **kwargs,
+        )
+
+
+class CachedClient(Client, DjangoCachedSession):
+    pass
+
+
 @contextmanager
 def requests_cache_enabled(*args, **kwargs):
     """
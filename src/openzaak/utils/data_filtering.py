@@ -42,5 +42,8 @@ class ListFilterByAuthorizationsMixin:
             component
         )
         return base.filter_for_authorizations(
-            scope_needed, authorizations, catalogus_authorizations
+            scope_needed,
+            authorizations,
+            catalogus_authorizations,
+            cache_key=self.request.jwt_auth.get_filters_cache_key(component),
         )
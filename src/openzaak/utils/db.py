@@ -1,9 +1,11 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2022 Open Zaak maintainers
+import threading
 import zlib
 from contextlib import contextmanager
+from typing import Callable
 
-from django.db import connections, transaction
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
 
 
 @contextmanager
@@ -15,3 +17,45 @@ def pg_advisory_lock(lock_id: str, using="default"):
             sql = f"SELECT pg_advisory_xact_lock({_lock_id})"
             cursor.execute(sql)
             yield
+
+
+class UncommittedChanges:
+    """
+    Track changes that are made in a transaction of the current thread, which is not
+    committed yet.
+
+    Caches filled from the database inside such a transaction can't be trusted,
+    since the changes can be rolled back without any signal to invalidate the cache.
+
+    :param invalidate: callable invalidating the cache, called on every change, and
+      when the transaction has ended.
+    """
+
+    def __init__(self, invalidate: Callable[[], None]):
+        self.invalidate = invalidate
+        self._local = threading.local()
+
+    def changed(self, using: str = DEFAULT_DB_ALIAS) -> None:
+        self.invalidate()
+
+        if transaction.get_connection(using).in_atomic_block:
+            self._local.pending = True
+            transaction.on_commit(self._ended, using=using)
+
+    def pending(self, using: str = DEFAULT_DB_ALIAS) -> bool:
+        """
+        Return if the cache should be bypassed by the current thread.
+        """
+        if not getattr(self._local, "pending", False):
+            return False
+
+        if transaction.get_connection(using).in_atomic_block:
+            return True
+
+        # the transaction was rolled back
+        self._ended()
+        return False
+
+    def _ended(self) -> None:
+        self._local.pending = False
+        self.invalidate()
@@ -0,0 +1,159 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+import os
+import re
+from typing import Iterator, Optional, Tuple
+
+from django.conf import settings
+from django.http import (
+    FileResponse,
+    HttpRequest,
+    HttpResponse,
+    HttpResponseBase,
+    StreamingHttpResponse,
+)
+from django.utils.cache import get_conditional_response
+from django.utils.http import (
+    content_disposition_header,
+    http_date,
+    parse_http_date_safe,
+)
+
+from django_sendfile import sendfile
+
+# sendfile backends that serve the file from Django, instead of handing it off to the
+# web server (which handles byte ranges itself)
+SELF_SERVING_BACKENDS = (
+    "django_sendfile.backends.development",
+    "django_sendfile.backends.simple",
+)
+
+RANGE_RE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+class RangeNotSatisfiable(Exception):
+    pass
+
+
+def parse_range(header: str, size: int) -> Optional[Tuple[int, int]]:
+    """
+    Parse the ``Range`` header into the first and last (inclusive) byte position.
+
+    Returns ``None`` if the header should be ignored, which is the case for invalid
+    headers and for multiple ranges, in which case the complete file is sent.
+
+    :raises RangeNotSatisfiable: if the range lies outside of the file.
+    """
+    match = RANGE_RE.match(header.strip())
+    if not match:
+        return None
+
+    first, last = match.groups()
+    if not first and not last:
+        return None
+
+    # suffix range, the last N bytes
+    if not first:
+        length = int(last)
+        if length == 0 or size == 0:
+            raise RangeNotSatisfiable()
+        return max(size - length, 0), size - 1
+
+    start = int(first)
+    if last and int(last) < start:
+        return None
+    if start >= size:
+        raise RangeNotSatisfiable()
+    end = min(int(last), size - 1) if last else size - 1
+    return start, end
+
+
+def _read_range(path: str, start: int, length: int) -> Iterator[bytes]:
+    with open(path, "rb") as file:
+        file.seek(start)
+        while length > 0:
+            data = file.read(min(FileResponse.block_size, length))
+            if not data:
+                break
+            length -= len(data)
+            yield data
+
+
+def _serve_file(
+    request: HttpRequest,
+    path: str,
+    etag: str,
+    last_modified: int,
+    attachment: bool = False,
+    attachment_filename: Optional[str] = None,
+    mimetype: Optional[str] = None,
+) -> HttpResponseBase:
+    size = os.path.getsize(path)
+    filename = attachment_filename or os.path.basename(path)
+
+    byte_range = None
+    range_header = request.headers.get("Range")
+    if_range = request.headers.get("If-Range")
+    # the range only applies if the file was not changed since
+    if range_header and (
+        not if_range
+        or if_range == etag
+        or parse_http_date_safe(if_range) == last_modified
+    ):
+        try:
+            byte_range = parse_range(range_header, size)
+        except RangeNotSatisfiable:
+            response = HttpResponse(status=416)
+            response["Content-Range"] = f"bytes */{size}"
+            return response
+
+    if byte_range is None:
+        # ⚡️ stream the file, instead of reading it completely in memory like the
+        # simple backend does
+        response = FileResponse(
+            open(path, "rb"),  # noqa: SIM115 - closed by the response
+            as_attachment=attachment,
+            filename=filename,
+            content_type=mimetype,
+        )
+    else:
+        start, end = byte_range
+        length = end - start + 1
+        response = StreamingHttpResponse(
+            _read_range(path, start, length),
+            status=206,
+            content_type=mimetype or "application/octet-stream",
+        )
+        response["Content-Range"] = f"bytes {start}-{end}/{size}"
+        response["Content-Length"] = str(length)
+        response["Content-Disposition"] = content_disposition_header(
+            attachment, filename
+        )
+
+    response["Accept-Ranges"] = "bytes"
+    return response
+
+
+def send_file(request: HttpRequest, path: str, etag: str, **kwargs) -> HttpResponseBase:
+    """
+    Send the file at ``path`` with the configured sendfile backend.
+
+    Conditional requests are answered with ``304 Not Modified`` (or ``412
+    Precondition Failed``) without sending the file. Byte ranges are served by
+    Django for the backends that serve the file themselves, and left to the web server
+    for the others.
+
+    :param etag: a strong ETag of the file contents.
+    """
+    last_modified = int(os.stat(path).st_mtime)
+
+    response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if response is None:
+        if settings.SENDFILE_BACKEND in SELF_SERVING_BACKENDS:
+            response = _serve_file(request, path, etag, last_modified, **kwargs)
+        else:
+            response = sendfile(request, path, **kwargs)
+
+    response["ETag"] = etag
+    response["Last-Modified"] = http_date(last_modified)
+    return response
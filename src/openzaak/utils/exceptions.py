@@ -1,6 +1,8 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2019 - 2020 Dimpact
 
+from django.utils.translation import gettext_lazy as _
+
 from rest_framework import status
 from rest_framework.exceptions import APIException
 from vng_api_common.schema import HTTP_STATUS_CODE_TITLES
@@ -14,3 +16,19 @@ class RequestEntityTooLargeException(APIException):
     status_code = status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
     default_code = "request_entity_too_large"
     default_detail = HTTP_STATUS_CODE_TITLES[status.HTTP_413_REQUEST_ENTITY_TOO_LARGE]
+
+
+class DocumentBeingAssembledException(APIException):
+    status_code = status.HTTP_409_CONFLICT
+    default_code = "being-assembled"
+    default_detail = _(
+        "The part files of the document are still being merged, try again later."
+    )
+
+
+class DocumentAssemblyFailedException(APIException):
+    status_code = status.HTTP_409_CONFLICT
+    default_code = "assembly-failed"
+    default_detail = _(
+        "The part files of the document could not be merged, contact the administrator."
+    )
@@ -3,14 +3,22 @@
 from typing import Dict, Iterator, List, Optional, Tuple, Type, Union
 
 from django.db import models
+from django.db.models import prefetch_related_objects
 from django.utils.module_loading import import_string
 
 import structlog
+from django_loose_fk.fields import FkOrURLField
 from django_loose_fk.loaders import FetchError
 from django_loose_fk.virtual_models import ProxyMixin
 from djangorestframework_camel_case.render import CamelCaseJSONRenderer
 from rest_framework.request import Request
-from rest_framework.serializers import BaseSerializer, Field, Serializer
+from rest_framework.serializers import (
+    BaseSerializer,
+    Field,
+    ListSerializer,
+    Serializer,
+    SerializerMethodField,
+)
 from rest_framework_inclusions.core import InclusionLoader
 from rest_framework_inclusions.renderer import (
     InclusionJSONRenderer,
@@ -18,6 +26,11 @@ from rest_framework_inclusions.renderer import (
     should_skip_inclusions,
 )
 
+from openzaak.loaders import (
+    AuthorizedRequestsLoader,
+    fetch_objects,
+    use_prefetched_objects,
+)
 from openzaak.utils.serializer_fields import FKOrServiceUrlField
 
 logger = structlog.stdlib.get_logger(__name__)
@@ -45,6 +58,7 @@ class InclusionNode:
         self.many = many
         self.parent = parent
         self._children = []
+        self._child_ids = set()
 
         if self.parent:
             self.parent.add_child(self)
@@ -54,6 +68,7 @@ class InclusionNode:
 
     def add_child(self, node: "InclusionNode"):
         self._children.append(node)
+        self._child_ids.add(node.id)
 
     def display_children(self) -> dict:
         """
@@ -75,42 +90,114 @@ class InclusionNode:
         return data
 
     def has_child(self, id) -> bool:
-        return any(child.id == id for child in self._children)
+        return id in self._child_ids
 
 
 class InclusionTree:
     """
     strictly speaking it's not a tree but a collection of nodes
     It's a little helper class to display nested inclusions
+
+    ⚡️ the same object can be included multiple times (for example the same
+    statustype for different statussen), so the nodes are indexed by their id to
+    find all parents of a new node without scanning the whole collection.
     """
 
     def __init__(self):
-        self._nodes = []
+        self._root_nodes: List[InclusionNode] = []
+        self._nodes_by_id: Dict[str, List[InclusionNode]] = {}
 
     def add_node(
         self, id: str, value: dict, label: str, many: bool, parent_id: str = None
     ) -> None:
         if not parent_id:
             node = InclusionNode(id, value, label, many)
-            self._nodes.append(node)
+            self._root_nodes.append(node)
+            self._nodes_by_id.setdefault(id, []).append(node)
             return
 
         parent_nodes = [
-            n for n in self._nodes if n.id == parent_id and not n.has_child(id)
+            n for n in self._nodes_by_id.get(parent_id, []) if not n.has_child(id)
         ]
         for parent_node in parent_nodes:
             node = InclusionNode(id, value, label, many, parent=parent_node)
-            self._nodes.append(node)
+            self._nodes_by_id.setdefault(id, []).append(node)
 
     def display_tree(self) -> dict:
         result = {}
-        root_nodes = [n for n in self._nodes if n.parent is None]
-
-        for node in root_nodes:
+        for node in self._root_nodes:
             result[node.id] = node.display_children()
         return result
 
 
+def _get_relation(model: Type[models.Model], name: str) -> Optional[models.Field]:
+    for model_field in model._meta.get_fields():
+        if model_field.auto_created and not model_field.concrete:
+            field_name = model_field.get_accessor_name()
+        else:
+            field_name = model_field.name
+        if field_name == name:
+            is_relation = model_field.is_relation or isinstance(
+                model_field, FkOrURLField
+            )
+            return model_field if is_relation else None
+    return None
+
+
+def get_prefetch_lookup(model: Type[models.Model], field: Field) -> str:
+    """
+    Return the lookup to prefetch the relation(s) a serializer field is sourced
+    from, for example ``zaaktype__catalogus`` for ``source="zaaktype.catalogus"``.
+
+    An empty string is returned if the field doesn't represent a (local) relation.
+    """
+    if (
+        field.write_only
+        or isinstance(field, SerializerMethodField)
+        or not field.source
+        or field.source == "*"
+    ):
+        return ""
+
+    lookups = []
+    for name in field.source.split("."):
+        model_field = _get_relation(model, name) if model else None
+        if model_field is None:
+            break
+
+        # loose-fk fields are resolved through their local FK
+        if isinstance(model_field, FkOrURLField):
+            lookups.append(model_field.fk_field)
+            model_field = model._meta.get_field(model_field.fk_field)
+        else:
+            lookups.append(name)
+        model = model_field.related_model
+
+    return "__".join(lookups)
+
+
+def prefetch_for_field(field: Field, instances: List[models.Model]) -> None:
+    """
+    ⚡️ prefetch the relation of the serializer field for all (local) instances at
+    once, rather than resolving it for each instance separately
+    """
+    local_instances = [
+        instance
+        for instance in instances
+        if isinstance(instance, models.Model) and not isinstance(instance, ProxyMixin)
+    ]
+    if not local_instances:
+        return
+
+    models_ = {type(instance) for instance in local_instances}
+    if len(models_) > 1:
+        return
+
+    lookup = get_prefetch_lookup(models_.pop(), field)
+    if lookup:
+        prefetch_related_objects(local_instances, lookup)
+
+
 class ExpandLoader(InclusionLoader):
     """
     ExpandLoader is hugely inspired by 'InclusionLoader' from 'djangorestframework-inclusions'
@@ -164,13 +251,14 @@ class ExpandLoader(InclusionLoader):
                 many=False,
             )
 
-        entries = self._inclusions((), serializer, serializer.instance)
+        entries = list(self._bulk_inclusions((), serializer, instances))
+        serialized = self._serialize_inclusions(entries, serializer.context)
 
         for obj, inclusion_serializer, parent, path, many in entries:
             data = (
                 obj._initial_data
                 if isinstance(obj, ProxyMixin)
-                else inclusion_serializer(instance=obj, context=serializer.context).data
+                else serialized[self._get_key(obj, inclusion_serializer)]
             )
             tree.add_node(
                 id=data["url"],
@@ -183,6 +271,127 @@ class ExpandLoader(InclusionLoader):
         result = tree.display_tree()
         return result
 
+    @staticmethod
+    def _get_key(
+        obj: models.Model, inclusion_serializer: Type[Serializer]
+    ) -> Tuple[Type[Serializer], Type[models.Model], int]:
+        return (inclusion_serializer, type(obj), obj.pk)
+
+    def _bulk_inclusions(
+        self,
+        path: Tuple[str, ...],
+        serializer: Serializer,
+        instances: List[models.Model],
+        inclusion_serializers: Optional[dict] = None,
+    ) -> Iterator[
+        Tuple[models.Model, Type[Serializer], models.Model, Tuple[str, ...], bool]
+    ]:
+        """
+        ⚡️ collect the inclusions of all instances one path at a time, so the related
+        objects of each path can be prefetched for all instances at once.
+
+        Yields the same entries as ``_field_inclusions``, the entries of a parent
+        always precede the entries of its children.
+        """
+        if isinstance(serializer, ListSerializer):
+            serializer = serializer.child
+
+        inclusion_serializers = inclusion_serializers or getattr(
+            serializer, "inclusion_serializers", {}
+        )
+        instances = [instance for instance in instances if instance is not None]
+
+        for name, field in serializer.fields.items():
+            new_path = path + (name,)
+            if isinstance(field, BaseSerializer):
+                for instance in instances:
+                    yield from self._sub_serializer_inclusions(
+                        new_path, field, instance
+                    )
+                continue
+
+            inclusion_serializer = inclusion_serializers.get(".".join(new_path))
+            if inclusion_serializer is None:
+                continue
+            if self.allowed_paths is not None and new_path not in self.allowed_paths:
+                continue
+            if isinstance(inclusion_serializer, str):
+                inclusion_serializer = import_string(inclusion_serializer)
+
+            many = hasattr(field, "child_relation")
+            prefetch_for_field(field, instances)
+
+            entries, included = [], {}
+            with use_prefetched_objects(self._fetch_external(field, instances)):
+                for instance in instances:
+                    for obj in self._some_related_field_inclusions(
+                        new_path, field, instance, inclusion_serializer
+                    ):
+                        included.setdefault(id(obj), obj)
+                        entries.append(
+                            (obj, inclusion_serializer, instance, new_path, many)
+                        )
+            yield from entries
+
+            # when we do inclusions in inclusions, we base path off our
+            # parent object path, not the sub-field
+            yield from self._bulk_inclusions(
+                new_path,
+                inclusion_serializer(instance=object),
+                list(included.values()),
+                inclusion_serializers,
+            )
+
+    def _fetch_external(self, field: Field, instances: List[models.Model]) -> dict:
+        """
+        ⚡️ fetch the external objects of a loose-fk field for all instances at once,
+        so they are requested concurrently instead of one by one.
+        """
+        if not isinstance(field, FKOrServiceUrlField):
+            return {}
+
+        loader = AuthorizedRequestsLoader()
+        urls = set()
+        for instance in instances:
+            if isinstance(instance, ProxyMixin):
+                continue
+            value = field.get_attribute(instance)
+            if (
+                isinstance(value, str)
+                and value not in self._seen_external
+                and not loader.is_local_url(value)
+            ):
+                urls.add(value)
+
+        if not urls:
+            return {}
+        return fetch_objects(urls)
+
+    def _serialize_inclusions(self, entries: list, context: dict) -> dict:
+        """
+        ⚡️ serialize the (local) included objects in bulk for each inclusion
+        serializer, with their relations prefetched. Objects that are included
+        multiple times are only serialized once.
+        """
+        groups: Dict[Type[Serializer], Dict[tuple, models.Model]] = {}
+        for obj, inclusion_serializer, *_ in entries:
+            if isinstance(obj, ProxyMixin):
+                continue
+            groups.setdefault(inclusion_serializer, {}).setdefault(
+                self._get_key(obj, inclusion_serializer), obj
+            )
+
+        serialized = {}
+        for inclusion_serializer, objects in groups.items():
+            objs = list(objects.values())
+            for field in inclusion_serializer(instance=object).fields.values():
+                prefetch_for_field(field, objs)
+
+            data = inclusion_serializer(instance=objs, many=True, context=context).data
+            serialized.update(zip(objects.keys(), data))
+
+        return serialized
+
     def _instance_inclusions(
         self,
         path: Tuple[str, ...],
@@ -12,10 +12,15 @@ from django.utils.translation import gettext_lazy as _
 
 from django_loose_fk.fields import FkOrURLField
 from relativedeltafield import RelativeDeltaField
-from zgw_consumers.models import ServiceUrlField
+from zgw_consumers.models import ServiceUrlField as _ServiceUrlField
+from zgw_consumers.models.fields import (
+    ServiceUrlDescriptor as _ServiceUrlDescriptor,
+)
 
 from openzaak.forms.fields import RelativeDeltaField as RelativeDeltaFormField
 
+from .services import get_service
+
 
 class DurationField(RelativeDeltaField):
     def formfield(self, form_class=None, **kwargs):
@@ -24,6 +29,28 @@ class DurationField(RelativeDeltaField):
         return super().formfield(form_class=form_class, **kwargs)
 
 
+class ServiceUrlDescriptor(_ServiceUrlDescriptor):
+    def get_base_val(self, detail_url: str):
+        # ⚡️ resolve the service from the service index, instead of a query per URL
+        return get_service(detail_url)
+
+
+class ServiceUrlField(_ServiceUrlField):
+    """
+    :class:`zgw_consumers.models.ServiceUrlField` which resolves the services of URLs
+    from the service index, both when assigning URLs and when filtering on them.
+
+    See :mod:`openzaak.utils.services` and :mod:`openzaak.utils.lookups`.
+    """
+
+    descriptor_class = ServiceUrlDescriptor
+
+    def deconstruct(self):
+        # the field is stored the same, keep the migrations on the upstream field
+        name, _path, args, kwargs = super().deconstruct()
+        return name, "zgw_consumers.models.fields.ServiceUrlField", args, kwargs
+
+
 class AliasMixin:
     def contribute_to_class(self, cls, name, private_only=False):
         super().contribute_to_class(cls, name, private_only=True)
@@ -15,22 +15,29 @@ class CharArrayFilter(filters.BaseInFilter, filters.CharFilter):
 
 
 class MaximaleVertrouwelijkheidaanduidingFilter(filters.ChoiceFilter):
-    def __init__(self, *args, **kwargs):
+    def __init__(self, *args, order_field_name: str = "", **kwargs):
+        """
+        :param order_field_name: the name of a field storing the order of the
+          vertrouwelijkheidaanduiding. If not provided, the order is annotated.
+        """
         kwargs.setdefault("choices", VertrouwelijkheidsAanduiding.choices)
         kwargs.setdefault("lookup_expr", "lte")
         super().__init__(*args, **kwargs)
 
         # rewrite the field_name correctly
         self._field_name = self.field_name
-        self.field_name = f"_{self._field_name}_order"
+        self.order_field_name = order_field_name
+        self.field_name = order_field_name or f"_{self._field_name}_order"
 
     def filter(self, qs, value):
         if value in filters.EMPTY_VALUES:
             return qs
-        order_expression = VertrouwelijkheidsAanduiding.get_order_expression(
-            self._field_name
-        )
-        qs = qs.annotate(**{self.field_name: order_expression})
+        # ⚡️ a stored order can be filtered on directly, using its index
+        if not self.order_field_name:
+            order_expression = VertrouwelijkheidsAanduiding.get_order_expression(
+                self._field_name
+            )
+            qs = qs.annotate(**{self.field_name: order_expression})
         numeric_value = VertrouwelijkheidsAanduiding.get_choice_order(value)
         return super().filter(qs, numeric_value)
 
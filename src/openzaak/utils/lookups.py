@@ -7,9 +7,13 @@ from django.db.models.lookups import Exact as _Exact, In as _In
 
 from django_loose_fk.lookups import get_normalized_value
 from django_loose_fk.virtual_models import ProxyMixin
-from zgw_consumers.models.lookups import decompose_value
+from zgw_consumers.models.lookups import (
+    Exact as _ServiceUrlExact,
+    In as _ServiceUrlIn,
+)
 
-from .fields import FkOrServiceUrlField
+from .fields import FkOrServiceUrlField, ServiceUrlField
+from .services import decompose_url
 
 
 class FkOrServiceUrlFieldMixin:
@@ -62,7 +66,7 @@ class FkOrServiceUrlFieldMixin:
 
             if isinstance(rhs_value, str):
                 # dealing with a remote composite URL - return list
-                base_value, relative_value = decompose_value(rhs_value)
+                base_value, relative_value = decompose_url(rhs_value)
                 base_normalized_value = get_normalized_value(base_value)[0]
                 relative__normalized_value = get_normalized_value(relative_value)[0]
                 prepared_value = [
@@ -276,3 +280,48 @@ class NotIn(In):
         sql, params = super().as_sql(compiler, connection)
         sql = "NOT {}".format(sql)
         return sql, params
+
+
+class ServiceUrlFieldMixin:
+    """
+    ⚡️ Decompose the URLs of the ``zgw_consumers`` lookups with the service index.
+    """
+
+    def get_prep_lookup(self) -> list:
+        if not self.rhs_is_direct_value():
+            return super().get_prep_lookup()
+
+        target = self.lhs.target
+        rhs_values = (
+            self.rhs if self.get_db_prep_lookup_value_is_iterable else [self.rhs]
+        )
+
+        prepared_values = []
+        for rhs_value in rhs_values:
+            base_value, relative_value = decompose_url(rhs_value)
+            prepared_values.append(
+                [
+                    target._base_field.get_prep_value(
+                        get_normalized_value(base_value)[0]
+                    ),
+                    target._relative_field.get_prep_value(
+                        get_normalized_value(relative_value)[0]
+                    ),
+                ]
+            )
+
+        return (
+            prepared_values[0]
+            if not self.get_db_prep_lookup_value_is_iterable
+            else prepared_values
+        )
+
+
+@ServiceUrlField.register_lookup
+class ServiceUrlExact(ServiceUrlFieldMixin, _ServiceUrlExact):
+    pass
+
+
+@ServiceUrlField.register_lookup
+class ServiceUrlIn(ServiceUrlFieldMixin, _ServiceUrlIn):
+    pass
@@ -1,10 +1,13 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2019 - 2020 Dimpact
 import os
+import time
 from dataclasses import dataclass
-from typing import Dict, Optional
+from typing import Dict, FrozenSet, Optional, Tuple
 
 from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
 from django.http import HttpRequest, HttpResponse, HttpResponseNotFound
 
 import structlog
@@ -18,6 +21,7 @@ from vng_api_common.middleware import (
 from openzaak.config.models import InternalService
 
 from .constants import COMPONENT_MAPPING
+from .db import UncommittedChanges
 
 logger = structlog.stdlib.get_logger(__name__)
 
@@ -128,6 +132,65 @@ class APIVersionHeaderMiddleware(_APIVersionHeaderMiddleware):
         return None
 
 
+DISABLED_API_TYPES_CACHE_KEY = "openzaak:disabled-api-types"
+# seconds the disabled API types are kept in the shared cache and in process memory,
+# in case an invalidation is missed
+DISABLED_API_TYPES_CACHE_TIMEOUT = 60
+DISABLED_API_TYPES_LOCAL_TIMEOUT = 5
+
+# (expiry, disabled API types)
+_disabled_api_types: Optional[Tuple[float, FrozenSet[str]]] = None
+
+
+def _query_disabled_api_types() -> FrozenSet[str]:
+    return frozenset(
+        InternalService.objects.filter(enabled=False).values_list("api_type", flat=True)
+    )
+
+
+def get_disabled_api_types() -> FrozenSet[str]:
+    """
+    ⚡️ Return the API types of the internal services that are disabled.
+
+    The result is cached in process memory for a few seconds, and in the shared cache
+    for other processes. Both are invalidated when an internal service is changed.
+    """
+    global _disabled_api_types
+
+    if _uncommitted_changes.pending():
+        return _query_disabled_api_types()
+
+    now = time.monotonic()
+    if _disabled_api_types is not None and _disabled_api_types[0] > now:
+        return _disabled_api_types[1]
+
+    api_types = cache.get(DISABLED_API_TYPES_CACHE_KEY)
+    if api_types is None:
+        api_types = _query_disabled_api_types()
+        cache.set(
+            DISABLED_API_TYPES_CACHE_KEY,
+            api_types,
+            timeout=DISABLED_API_TYPES_CACHE_TIMEOUT,
+        )
+
+    _disabled_api_types = (now + DISABLED_API_TYPES_LOCAL_TIMEOUT, api_types)
+    return api_types
+
+
+def invalidate_disabled_api_types(**kwargs) -> None:
+    global _disabled_api_types
+
+    cache.delete(DISABLED_API_TYPES_CACHE_KEY)
+    _disabled_api_types = None
+
+
+_uncommitted_changes = UncommittedChanges(invalidate_disabled_api_types)
+
+
+def internal_service_changed(sender, using: str = DEFAULT_DB_ALIAS, **kwargs) -> None:
+    _uncommitted_changes.changed(using)
+
+
 class EnabledMiddleware:
     def __init__(self, get_response):
         self.get_response = get_response
@@ -151,10 +214,7 @@ class EnabledMiddleware:
         if not component_type:
             return None
 
-        disabled = InternalService.objects.filter(
-            api_type=component_type, enabled=False
-        ).exists()
-        if not disabled:
+        if component_type not in get_disabled_api_types():
             return None
         return HttpResponseNotFound()
 
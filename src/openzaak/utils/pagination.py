@@ -1,35 +1,214 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2023 Dimpact
+import binascii
+import hashlib
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
 from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from functools import partial
+from typing import Any, List, Optional, Sequence
 
 from django.conf import settings
-from django.core.paginator import Paginator as DjangoPaginator
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.core.paginator import Page, Paginator as DjangoPaginator
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connections, models
+from django.db.models import Q
 from django.utils.functional import cached_property
+from django.utils.translation import gettext_lazy as _
 
+from rest_framework.exceptions import NotFound
 from rest_framework.pagination import PageNumberPagination, _positive_int
+from rest_framework.request import Request
 from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
 from vng_api_common.pagination import DynamicPageSizeMixin
 
+from ..components.autorisaties.cache import get_autorisaties_version
 from .help_text import mark_experimental
 
 
-class ExactPaginator(DjangoPaginator):
+def count_strategies_enabled() -> bool:
+    return bool(
+        settings.PAGINATION_COUNT_CACHE_TIMEOUT
+        or settings.PAGINATION_COUNT_ESTIMATE_THRESHOLD
+    )
+
+
+def get_estimated_count(queryset: models.QuerySet) -> Optional[int]:
+    """
+    Return the planner estimate of the number of rows of an unfiltered queryset.
+
+    Only estimates of at least ``PAGINATION_COUNT_ESTIMATE_THRESHOLD`` rows are
+    returned, smaller tables are cheap enough to count.
+    """
+    threshold = settings.PAGINATION_COUNT_ESTIMATE_THRESHOLD
+    if not threshold:
+        return None
+
+    query = queryset.query
+    if query.where or query.distinct_fields or query.combinator or query.is_sliced:
+        return None
+
+    with connections[queryset.db].cursor() as cursor:
+        cursor.execute(
+            "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass",
+            [queryset.model._meta.db_table],
+        )
+        row = cursor.fetchone()
+
+    # the estimate is -1 if the table was never analyzed
+    if row is None or row[0] < threshold:
+        return None
+    return row[0]
+
+
+def get_count_cache_key(request: Request) -> str:
+    """
+    Return the key to cache the count of a list request under.
+
+    The key is derived from the endpoint, the filters (query parameters and search
+    body, excluding the pagination parameters) and the authorizations of the client,
+    since the authorizations filter the results as well.
+    """
+    if not settings.PAGINATION_COUNT_CACHE_TIMEOUT:
+        return ""
+
+    excluded = {"page", "pageSize", "cursor"}
+    params = sorted(
+        (key, sorted(request.query_params.getlist(key)))
+        for key in request.query_params
+        if key not in excluded
+    )
+
+    jwt_auth = getattr(request, "jwt_auth", None)
+    applicaties = jwt_auth.applicaties if jwt_auth else []
+    fingerprint = [
+        sorted(app.id for app in applicaties),
+        get_autorisaties_version() if applicaties else "",
+    ]
+
+    data = request.data if request.method == "POST" else None
+    key_data = json.dumps(
+        [request.path, params, data, fingerprint], sort_keys=True, default=str
+    )
+    return f"pagination:count:{hashlib.sha256(key_data.encode()).hexdigest()}"
+
+
+class CountStrategyPaginator(DjangoPaginator):
+    """
+    ⚡️ Paginator that avoids counting all rows for every requested page.
+
+    The count is determined with the first applicable strategy:
+
+    * the planner estimate for unfiltered querysets of large tables
+    * the count cached for the same request by a previous page
+    * an exact count, which is cached if ``count_cache_key`` is provided
+
+    ``count_exact`` indicates whether the count was determined exactly for this
+    request.
+    """
+
+    def __init__(self, *args, count_cache_key: str = "", **kwargs):
+        super().__init__(*args, **kwargs)
+        self.count_cache_key = count_cache_key
+        self.count_exact = True
+
+    def get_exact_count(self) -> int:  # pragma: no cover
+        raise NotImplementedError
+
+    def get_count_cache_key(self) -> str:
+        return self.count_cache_key
+
     @cached_property
     def count(self):
+        estimate = get_estimated_count(self.object_list)
+        if estimate is not None:
+            self.count_exact = False
+            return estimate
+
+        cache_key = self.get_count_cache_key()
+        if cache_key:
+            count = cache.get(cache_key)
+            if count is not None:
+                self.count_exact = False
+                return count
+
+        count = self.get_exact_count()
+        if cache_key:
+            cache.set(cache_key, count, timeout=settings.PAGINATION_COUNT_CACHE_TIMEOUT)
+        return count
+
+
+class ExactPaginator(CountStrategyPaginator):
+    def get_exact_count(self) -> int:
         """
         ⚡ restricts values to PK to remove implicit join from SQL query
         """
         return self.object_list.values("pk").count()
 
 
-class ExactPagination(DynamicPageSizeMixin, PageNumberPagination):
-    django_paginator_class = ExactPaginator
+class CountStrategyPaginationMixin:
+    paginator_class = None
 
+    @property
+    def django_paginator_class(self):
+        return partial(
+            self.paginator_class, count_cache_key=get_count_cache_key(self.request)
+        )
 
-class FuzzyPaginator(DjangoPaginator):
-    def __init__(self, object_list, per_page, orphans=0, allow_empty_first_page=True):
-        super().__init__(object_list, per_page, orphans, allow_empty_first_page)
-        self.page_number = None
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        return super().paginate_queryset(queryset, request, view=view)
+
+    def include_count_exact(self) -> bool:
+        return count_strategies_enabled()
+
+    def get_count_exact(self) -> bool:
+        return self.page.paginator.count_exact
+
+    def get_paginated_response(self, data):
+        response_data = [
+            ("count", self.page.paginator.count),
+            ("next", self.get_next_link()),
+            ("previous", self.get_previous_link()),
+            ("results", data),
+        ]
+
+        if self.include_count_exact():
+            response_data.insert(3, ("count_exact", self.get_count_exact()))
+
+        return Response(OrderedDict(response_data))
+
+    def get_paginated_response_schema(self, schema):
+        paginated_schema = super().get_paginated_response_schema(schema)
+        if self.include_count_exact():
+            paginated_schema["properties"]["countExact"] = {
+                "type": "boolean",
+                "description": mark_experimental(
+                    "Geeft aan of de `count` exact is, of dat deze wegens "
+                    "performance doeleinden niet exact berekend is."
+                ),
+            }
+
+        return paginated_schema
+
+
+class ExactPagination(
+    CountStrategyPaginationMixin, DynamicPageSizeMixin, PageNumberPagination
+):
+    paginator_class = ExactPaginator
+
+
+class FuzzyPaginator(CountStrategyPaginator):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # set by `page`, the first page is assumed if the paginator is only used to
+        # count (see `CursorPaginationMixin`)
+        self.page_number = 1
 
     def page(self, number):
         # Pass the page number to the paginator, to calculate the limit in count
@@ -37,41 +216,296 @@ class FuzzyPaginator(DjangoPaginator):
 
         return super().page(number)
 
-    @cached_property
-    def count(self):
+    def get_count_cache_key(self) -> str:
+        # the count is limited relative to the page and its size
+        if not self.count_cache_key:
+            return ""
+        return f"{self.count_cache_key}:{self.page_number}:{self.per_page}"
+
+    def get_exact_count(self) -> int:
         offset = (_positive_int(self.page_number) - 1) * self.per_page
         return self.object_list.values("pk")[
             : offset + settings.FUZZY_PAGINATION_COUNT_LIMIT
         ].count()
 
 
-class FuzzyPagination(DynamicPageSizeMixin, PageNumberPagination):
-    django_paginator_class = FuzzyPaginator
+class FuzzyPagination(
+    CountStrategyPaginationMixin, DynamicPageSizeMixin, PageNumberPagination
+):
+    paginator_class = FuzzyPaginator
 
-    def get_paginated_response(self, data):
-        response_data = [
-            ("count", self.page.paginator.count),
-            ("next", self.get_next_link()),
-            ("previous", self.get_previous_link()),
-            ("results", data),
-        ]
+    def include_count_exact(self) -> bool:
+        return True
 
-        count_exact = self.page.paginator.count % self.page_size != 0
-        response_data.insert(3, ("count_exact", count_exact))
+    def get_count_exact(self) -> bool:
+        return (
+            super().get_count_exact()
+            and self.page.paginator.count % self.page_size != 0
+        )
 
-        return Response(OrderedDict(response_data))
+
+OptimizedPagination = FuzzyPagination if settings.FUZZY_PAGINATION else ExactPagination
+
+
+class CursorEncoder(DjangoJSONEncoder):
+    def default(self, o):
+        # keep the microseconds, which are truncated by `DjangoJSONEncoder`
+        if isinstance(o, datetime):
+            return o.isoformat()
+        return super().default(o)
+
+
+@dataclass
+class Cursor:
+    ordering: List[str]
+    values: List[Any]
+    reverse: bool = False
+
+
+def _invert(order: str) -> str:
+    return order[1:] if order.startswith("-") else f"-{order}"
+
+
+def _after(order: str, value) -> tuple[Q, Q]:
+    """
+    Return the conditions for rows positioned after and at ``value`` for ``order``.
+
+    PostgreSQL sorts ``NULL`` values as if they are larger than any other value,
+    which is taken into account for nullable fields.
+    """
+    field = order.lstrip("-")
+    if order.startswith("-"):
+        if value is None:
+            return Q(**{f"{field}__isnull": False}), Q(**{f"{field}__isnull": True})
+        return Q(**{f"{field}__lt": value}), Q(**{field: value})
+
+    if value is None:
+        return Q(pk__in=[]), Q(**{f"{field}__isnull": True})
+    return (
+        Q(**{f"{field}__gt": value}) | Q(**{f"{field}__isnull": True}),
+        Q(**{field: value}),
+    )
+
+
+class CursorPaginationMixin:
+    """
+    ⚡️ Opt-in keyset pagination, which is used if the ``cursor`` query parameter
+    is provided.
+
+    Contrary to page numbers, which translate to an ``OFFSET`` that requires the
+    database to skip all preceding rows, the cursor points to the position of the
+    last (or first) row of the page in the ordering of the queryset. The next page
+    is selected with a ``WHERE`` clause on the ordering fields, so the cost per page
+    is the same for every page. The primary key is added to the ordering to break
+    ties, unless the queryset uses ``DISTINCT ON``, in which case its fields are
+    unique in the results.
+
+    An empty ``cursor`` selects the first page. The ``next`` and ``previous`` links
+    contain the cursors for the adjacent pages.
+    """
+
+    cursor_query_param = "cursor"
+    cursor_query_description = mark_experimental(
+        "Een cursor die een positie binnen de gepagineerde set resultaten aangeeft. "
+        "Geef een lege waarde op om de eerste pagina met cursor paginering op te "
+        "vragen, de `next` en `previous` links bevatten de cursors voor de volgende en "
+        "vorige pagina. Het opvragen van pagina's met een cursor is even snel, "
+        "ongeacht het aantal voorgaande pagina's."
+    )
+
+    def use_cursor(self, request) -> bool:
+        return self.cursor_query_param in request.query_params
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.cursor = None
+        if not self.use_cursor(request):
+            return super().paginate_queryset(queryset, request, view=view)
+
+        page_size = self.get_page_size(request)
+        if not page_size:
+            return None
+
+        self.request = request
+        self.page_size = page_size
+
+        keys, trailing = self.get_ordering(queryset)
+        cursor = self.decode_cursor(request, keys, queryset.model)
+        reverse = cursor.reverse if cursor else False
+
+        ordering = [_invert(key) for key in keys] if reverse else keys
+        queryset = queryset.order_by(*ordering, *trailing)
+        page_queryset = queryset
+        if cursor:
+            page_queryset = queryset.filter(self._get_position_filter(ordering, cursor))
+
+        results = list(page_queryset[: page_size + 1])
+        has_more = len(results) > page_size
+        results = results[:page_size]
+        if reverse:
+            results.reverse()
+
+        self.cursor = cursor
+        self.keys = keys
+        self.has_next = True if reverse else has_more
+        self.has_previous = has_more if reverse else cursor is not None
+
+        # the count is still reported, with the strategy of the regular paginator
+        paginator = self.django_paginator_class(queryset, page_size)
+        self.page = Page(results, 1, paginator)
+        return results
+
+    def get_ordering(self, queryset: models.QuerySet) -> tuple[List[str], List[str]]:
+        """
+        Return the ordering fields that define the position of a row and the
+        remaining ordering.
+        """
+        ordering = list(queryset.query.order_by or queryset.model._meta.ordering)
+        if not all(isinstance(order, str) for order in ordering) or any(
+            "__" in order or order == "?" for order in ordering
+        ):
+            raise NotFound(
+                _("Cursor paginering wordt niet ondersteund voor deze sortering.")
+            )
+
+        distinct_fields = queryset.query.distinct_fields
+        if distinct_fields:
+            # the fields of DISTINCT ON must be the leading ordering fields
+            return ordering[: len(distinct_fields)], ordering[len(distinct_fields) :]
+
+        pk_name = queryset.model._meta.pk.name
+        if not any(order.lstrip("-") in ("pk", pk_name) for order in ordering):
+            ordering.append("-pk")
+        return ordering, []
+
+    def decode_cursor(
+        self, request, keys: List[str], model: type[models.Model]
+    ) -> Optional[Cursor]:
+        encoded = request.query_params[self.cursor_query_param]
+        if not encoded:
+            return None
+
+        try:
+            data = json.loads(urlsafe_b64decode(encoded.encode("ascii")))
+            cursor = Cursor(
+                ordering=data["o"], values=data["v"], reverse=bool(data.get("r"))
+            )
+        except (
+            binascii.Error,
+            KeyError,
+            TypeError,
+            UnicodeError,
+            ValueError,
+        ) as exc:
+            raise NotFound(_("Ongeldige cursor.")) from exc
+
+        # the cursor is only valid for the ordering it was created for
+        if cursor.ordering != keys or len(cursor.values) != len(keys):
+            raise NotFound(_("Ongeldige cursor."))
+
+        # the values are used in the query, so they must be valid for their fields
+        try:
+            cursor.values = [
+                self._to_python(model, key.lstrip("-"), value)
+                for key, value in zip(keys, cursor.values)
+            ]
+        except (TypeError, ValidationError, ValueError) as exc:
+            raise NotFound(_("Ongeldige cursor.")) from exc
+        return cursor
+
+    @staticmethod
+    def _to_python(model: type[models.Model], field_name: str, value):
+        if value is None:
+            return None
+
+        field = (
+            model._meta.pk if field_name == "pk" else model._meta.get_field(field_name)
+        )
+        if field.generated:
+            field = field.output_field
+
+        value = field.to_python(value)
+        field.get_prep_value(value)
+        return value
+
+    def encode_cursor(self, instance: models.Model, reverse: bool) -> str:
+        values = [self._get_value(instance, key.lstrip("-")) for key in self.keys]
+        data = {"o": self.keys, "v": values, "r": reverse}
+        return urlsafe_b64encode(
+            json.dumps(data, cls=CursorEncoder).encode("ascii")
+        ).decode("ascii")
+
+    @staticmethod
+    def _get_value(instance: models.Model, field_name: str):
+        if field_name == "pk":
+            return instance.pk
+        return getattr(instance, instance._meta.get_field(field_name).attname)
+
+    @staticmethod
+    def _get_position_filter(ordering: Sequence[str], cursor: Cursor) -> Q:
+        # (a, b, c) > (x, y, z) <=> a > x OR (a = x AND b > y) OR (a = x AND ...)
+        filters = Q(pk__in=[])
+        equal = Q()
+        for order, value in zip(ordering, cursor.values):
+            after, at = _after(order, value)
+            filters |= equal & after
+            equal &= at
+        return filters
+
+    def _get_link(self, instance: models.Model, reverse: bool) -> str:
+        url = self.request.build_absolute_uri()
+        url = remove_query_param(url, self.page_query_param)
+        return replace_query_param(
+            url, self.cursor_query_param, self.encode_cursor(instance, reverse)
+        )
+
+    def get_next_link(self):
+        if not self.use_cursor(self.request):
+            return super().get_next_link()
+        if not self.has_next or not self.page.object_list:
+            return None
+        return self._get_link(self.page.object_list[-1], reverse=False)
+
+    def get_previous_link(self):
+        if not self.use_cursor(self.request):
+            return super().get_previous_link()
+        if not self.has_previous or not self.page.object_list:
+            return None
+        return self._get_link(self.page.object_list[0], reverse=True)
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            *super().get_schema_operation_parameters(view),
+            {
+                "name": self.cursor_query_param,
+                "required": False,
+                "in": "query",
+                "description": str(self.cursor_query_description),
+                "schema": {"type": "string"},
+            },
+        ]
 
     def get_paginated_response_schema(self, schema):
         paginated_schema = super().get_paginated_response_schema(schema)
-        paginated_schema["properties"]["countExact"] = {
-            "type": "boolean",
-            "description": mark_experimental(
-                "Geeft aan of de `count` exact is, of dat deze wegens "
-                "performance doeleinden niet exact berekend is."
-            ),
-        }
-
+        properties = paginated_schema["properties"]
+        properties["next"]["description"] = (
+            "De URL van de volgende pagina. Bevat een `cursor` als de huidige pagina "
+            "met een cursor is opgevraagd."
+        )
+        properties["previous"]["description"] = (
+            "De URL van de vorige pagina. Bevat een `cursor` als de huidige pagina "
+            "met een cursor is opgevraagd."
+        )
         return paginated_schema
 
 
-OptimizedPagination = FuzzyPagination if settings.FUZZY_PAGINATION else ExactPagination
+class ExactCursorPagination(CursorPaginationMixin, ExactPagination):
+    pass
+
+
+class FuzzyCursorPagination(CursorPaginationMixin, FuzzyPagination):
+    pass
+
+
+OptimizedCursorPagination = (
+    FuzzyCursorPagination if settings.FUZZY_PAGINATION else ExactCursorPagination
+)
@@ -1,22 +1,72 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2019 - 2020 Dimpact
-from collections import defaultdict
+from collections import defaultdict, namedtuple
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 from urllib.parse import urlparse
 
 from django.conf import settings
+from django.core.cache import cache
 from django.db import models
-from django.db.models import Q
+from django.db.models import F, Q
 from django.http.request import validate_host
 
 from vng_api_common.constants import VertrouwelijkheidsAanduiding
 from vng_api_common.scopes import Scope
 from vng_api_common.utils import get_resources_for_paths
 
+PREFETCHED_VALUES_ATTR = "_prefetched_values"
+
 
 class QueryBlocked(Exception):
     pass
 
 
+def prefetch_related_values(
+    instances: Sequence[models.Model], lookups: Dict[str, Iterable[str]]
+) -> None:
+    """
+    ⚡️ Lightweight alternative for ``prefetch_related`` for reverse relations.
+
+    Instead of creating model instances for all related objects, only the requested
+    columns are selected with ``values_list``. For every instance, the rows are stored
+    as named tuples in ``instance._prefetched_values[<relation name>]``, in the
+    default ordering of the related model. The named tuples also refer back to the
+    instance through the name of the foreign key, so nested lookups like
+    ``zaak__uuid`` can be resolved.
+
+    :param instances: the (already evaluated) instances to prefetch the values for
+    :param lookups: mapping of reverse relation names to the columns to select
+    """
+    if not instances:
+        return
+
+    model = type(instances[0])
+    instances_by_pk = {instance.pk: instance for instance in instances}
+    for instance in instances:
+        setattr(instance, PREFETCHED_VALUES_ATTR, {})
+
+    for relation_name, columns in lookups.items():
+        fk_field = getattr(model, relation_name).field
+        columns = tuple(columns)
+        row_class = namedtuple(
+            f"Prefetched_{relation_name}", columns + (fk_field.name,)
+        )
+
+        values = {pk: [] for pk in instances_by_pk}
+        rows = (
+            fk_field.model._default_manager.filter(
+                **{f"{fk_field.attname}__in": list(instances_by_pk)}
+            )
+            .values_list(fk_field.attname, *columns)
+            .iterator()
+        )
+        for parent_pk, *row in rows:
+            values[parent_pk].append(row_class(*row, instances_by_pk[parent_pk]))
+
+        for pk, instance in instances_by_pk.items():
+            getattr(instance, PREFETCHED_VALUES_ATTR)[relation_name] = values[pk]
+
+
 class BlockChangeMixin:
     def _block(self, method: str):
         raise QueryBlocked(
@@ -27,6 +77,13 @@ class BlockChangeMixin:
     def bulk_create(self, *args, **kwargs):
         self._block("bulk_create")
 
+    def trusted_bulk_create(self, objs, **kwargs):
+        """
+        ⚡️ ``bulk_create`` for trusted internal callers, which take care of the
+        effects of the signals themselves.
+        """
+        return super().bulk_create(objs, **kwargs)
+
     def bulk_update(self, *args, **kwargs):
         self._block("bulk_update")
 
@@ -40,6 +97,61 @@ class BlockChangeMixin:
     delete.queryset_only = True
 
 
+class AuthorizedValues(models.Expression):
+    """
+    ⚡️ Semi-join against an inline ``VALUES`` relation of authorized primary keys.
+
+    Without a confidentiality order this compiles to
+    ``<column> IN (VALUES (%s), ...)``, otherwise to::
+
+        EXISTS (
+            SELECT 1 FROM (VALUES (%s, %s), ...) AS _authorized (pk, max_va_order)
+            WHERE _authorized.pk = <column> AND <va_order> <= _authorized.max_va_order
+        )
+
+    Contrary to a tree of ``OR``-ed ``IN`` lists per confidentiality level, the planner
+    can hash the relation and probe it for every row.
+
+    :param column: expression resolving to the (foreign key) column to match
+    :param values: mapping of the authorized primary keys to their maximum
+      confidentiality order, or ``None`` if the order is not checked
+    :param va_order: expression resolving to the confidentiality order of a row
+    """
+
+    output_field = models.BooleanField()
+    conditional = True
+
+    def __init__(self, column, values: Dict[int, Optional[int]], va_order=None):
+        super().__init__()
+        self.column = column
+        self.values = values
+        self.va_order = va_order
+
+    def get_source_expressions(self):
+        return [self.column, self.va_order]
+
+    def set_source_expressions(self, exprs):
+        self.column, self.va_order = exprs
+
+    def as_sql(self, compiler, connection):
+        column_sql, column_params = compiler.compile(self.column)
+
+        if self.va_order is None:
+            rows = ", ".join(["(%s)"] * len(self.values))
+            sql = f"{column_sql} IN (VALUES {rows})"
+            return sql, (*column_params, *self.values)
+
+        va_order_sql, va_order_params = compiler.compile(self.va_order)
+        rows = ", ".join(["(%s, %s::integer)"] * len(self.values))
+        sql = (
+            f"EXISTS (SELECT 1 FROM (VALUES {rows}) AS _authorized (pk, max_va_order) "
+            f"WHERE _authorized.pk = {column_sql} "
+            f"AND {va_order_sql} <= _authorized.max_va_order)"
+        )
+        values_params = [param for row in self.values.items() for param in row]
+        return sql, (*values_params, *column_params, *va_order_params)
+
+
 class LooseFkAuthorizationsFilterMixin:
     auth_fields = []
     loose_fk_field = None
@@ -54,11 +166,9 @@ class LooseFkAuthorizationsFilterMixin:
 
     def build_queryset(self, local_filters, external_filters) -> models.QuerySet:
         if self.vertrouwelijkheidaanduiding_use:
-            # annotate the queryset so we can map a string value to a logical number
-            order_case = VertrouwelijkheidsAanduiding.get_order_expression(
-                f"{self.prefix}vertrouwelijkheidaanduiding"
-            )
-            annotations = {"_va_order": order_case}
+            # ⚡️ the order of the vertrouwelijkheidaanduiding is stored, which allows
+            # the (zaaktype, va_order) index to be used
+            annotations = {"_va_order": F(f"{self.prefix}va_order")}
             # bring it all together now to build the resulting queryset
             queryset = self.annotate(**annotations).filter(
                 local_filters | external_filters
@@ -68,58 +178,60 @@ class LooseFkAuthorizationsFilterMixin:
             queryset = self.filter(local_filters | external_filters)
         return queryset
 
-    def get_filters(
+    def resolve_authorizations(
         self,
-        scope,
         authorizations,
         catalogus_authorizations=None,
         local=True,
-        use_va=True,
-    ) -> Q:
-        prefix = self.prefix
-        loose_fk_field = (
-            f"_{self.loose_fk_field}" if local else f"_{self.loose_fk_field}_url"
-        )
-
+    ) -> Tuple[List, Dict[int, List]]:
+        """
+        Resolve the authorizations to the allowed loose-fk values.
+
+        :return: the allowed values (primary keys for local objects, URLs for
+          external objects) and a mapping of the maximum confidentiality order to the
+          values it applies to
+        """
         # resource URLs to either use as-is or resolve to database records
         resource_urls = [
             getattr(authorization, self.loose_fk_field)
             for authorization in authorizations
         ]
 
-        # keep a list of allowed loose-fk objects
-        loose_fk_objecten = []
+        # keep a list of allowed loose-fk values
+        loose_fk_values = []
         # build the case/when to map the max_vertrouwelijkheidaanduiding based
         # on the ``zaaktype``
         va_mapping = defaultdict(list)
 
         if not local:
-            loose_fk_object_map = dict(zip(resource_urls, resource_urls))
+            loose_fk_value_map = dict(zip(resource_urls, resource_urls))
         else:
             # prepare to get the loose_fk_objects in bulk from the DB
             loose_fk_object_paths = [urlparse(url).path for url in resource_urls]
             loose_fk_objects = get_resources_for_paths(loose_fk_object_paths)
             # nothing to resolve
             if loose_fk_objects is None:
-                loose_fk_object_map = {}
+                loose_fk_value_map = {}
             else:
                 # keep the sorting so we can zip them correctly
                 sorted_objects = sorted(
                     loose_fk_objects, key=lambda o: o.get_absolute_api_url()
                 )
-                loose_fk_object_map = dict(zip(sorted(resource_urls), sorted_objects))
+                loose_fk_value_map = dict(
+                    zip(sorted(resource_urls), [obj.pk for obj in sorted_objects])
+                )
 
         for authorization in authorizations:
             resource_url = getattr(authorization, self.loose_fk_field)
-            loose_fk_object = loose_fk_object_map[resource_url]
-            loose_fk_objecten.append(loose_fk_object)
+            loose_fk_value = loose_fk_value_map[resource_url]
+            loose_fk_values.append(loose_fk_value)
 
             # extract the order and map it to the database value
             if authorization.max_vertrouwelijkheidaanduiding:
                 choice_item_order = VertrouwelijkheidsAanduiding.get_choice_order(
                     authorization.max_vertrouwelijkheidaanduiding
                 )
-                va_mapping[choice_item_order].append(loose_fk_object)
+                va_mapping[choice_item_order].append(loose_fk_value)
 
         if catalogus_authorizations:
             for catalogus_authorisation in catalogus_authorizations:
@@ -128,7 +240,7 @@ class LooseFkAuthorizationsFilterMixin:
                 ).all()
 
                 for instance in resources:
-                    loose_fk_objecten.append(instance)
+                    loose_fk_values.append(instance.pk)
 
                     # extract the order and map it to the database value
                     if catalogus_authorisation.max_vertrouwelijkheidaanduiding:
@@ -137,18 +249,51 @@ class LooseFkAuthorizationsFilterMixin:
                                 catalogus_authorisation.max_vertrouwelijkheidaanduiding
                             )
                         )
-                        va_mapping[choice_item_order].append(instance)
+                        va_mapping[choice_item_order].append(instance.pk)
+
+        return loose_fk_values, dict(va_mapping)
+
+    def build_filters(self, loose_fk_values, va_mapping, local=True, use_va=True) -> Q:
+        prefix = self.prefix
+        loose_fk_field = (
+            f"_{self.loose_fk_field}" if local else f"_{self.loose_fk_field}_url"
+        )
+
+        # external loose-fk values are composite URLs, which are matched with the
+        # dedicated lookups
+        use_values_join = local and settings.AUTORISATIES_FILTERS_VALUES_JOIN
 
         if not use_va:
-            return Q(**{f"{prefix}{loose_fk_field}__in": loose_fk_objecten})
+            if use_values_join and loose_fk_values:
+                return Q(
+                    AuthorizedValues(
+                        F(f"{prefix}{loose_fk_field}"), dict.fromkeys(loose_fk_values)
+                    )
+                )
+            return Q(**{f"{prefix}{loose_fk_field}__in": loose_fk_values})
+
+        if use_values_join and va_mapping:
+            # only the least strict confidentiality level matters if the same
+            # object is authorized multiple times
+            max_va_orders = {}
+            for max_va, values in va_mapping.items():
+                for value in values:
+                    max_va_orders[value] = max(max_va, max_va_orders.get(value, max_va))
+            return Q(
+                AuthorizedValues(
+                    F(f"{prefix}{loose_fk_field}"),
+                    max_va_orders,
+                    va_order=F("_va_order"),
+                )
+            )
 
         # Combine the filters: group the minimum required confidentiality with
         # the instances (zaaktypen/informatieobjecttypen) for which this constraint
         # applies
         filters = Q()
-        for max_va, instances in va_mapping.items():
+        for max_va, values in va_mapping.items():
             filters |= Q(_va_order__lte=max_va) & Q(
-                **{f"{prefix}{loose_fk_field}__in": instances}
+                **{f"{prefix}{loose_fk_field}__in": values}
             )
         return filters
 
@@ -175,23 +320,52 @@ class LooseFkAuthorizationsFilterMixin:
         scope: Scope,
         authorizations: models.QuerySet,
         catalogus_authorizations: models.QuerySet,
+        cache_key: str = "",
     ) -> models.QuerySet:
+        """
+        :param cache_key: optional (versioned) key prefix to cache the resolved
+          authorizations under, see
+          :meth:`openzaak.components.autorisaties.middleware.JWTAuth.get_filters_cache_key`
+        """
         # todo implement error if no loose-fk field
 
-        authorizations_local, authorizations_external = self.get_authorizations(
-            scope, authorizations
-        )
+        # ⚡️ resolving the authorizations takes several queries, which yield the same
+        # result for every request of the same applicaties, so only the primary keys
+        # and URLs are cached
+        if cache_key:
+            cache_key = f"{cache_key}:{self.loose_fk_field}:{scope.label}"
+            resolved = cache.get(cache_key)
+        else:
+            resolved = None
+
+        if resolved is None:
+            authorizations_local, authorizations_external = self.get_authorizations(
+                scope, authorizations
+            )
+            resolved = {
+                "local": self.resolve_authorizations(
+                    authorizations_local,
+                    catalogus_authorizations=catalogus_authorizations,
+                    local=True,
+                ),
+                "external": self.resolve_authorizations(
+                    authorizations_external, local=False
+                ),
+            }
+            if cache_key:
+                cache.set(
+                    cache_key,
+                    resolved,
+                    timeout=settings.AUTORISATIES_FILTERS_CACHE_TIMEOUT,
+                )
 
-        local_filters = self.get_filters(
-            scope,
-            authorizations_local,
-            catalogus_authorizations=catalogus_authorizations,
+        local_filters = self.build_filters(
+            *resolved["local"],
             local=True,
             use_va=self.vertrouwelijkheidaanduiding_use,
         )
-        external_filters = self.get_filters(
-            scope,
-            authorizations_external,
+        external_filters = self.build_filters(
+            *resolved["external"],
             local=False,
             use_va=self.vertrouwelijkheidaanduiding_use,
         )
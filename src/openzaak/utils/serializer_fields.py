@@ -5,8 +5,15 @@ from django.utils.translation import gettext_lazy as _
 from django_loose_fk.drf import FKOrURLField, FKOrURLValidator
 from rest_framework import serializers
 from rest_framework.exceptions import ValidationError
+from rest_framework.relations import MANY_RELATION_KWARGS
+from vng_api_common.serializers import (
+    CachedHyperlinkedRelatedField,
+    CachedNestedHyperlinkedRelatedField,
+)
 from vng_api_common.validators import URLValidator
 
+from .query import PREFETCHED_VALUES_ATTR
+
 
 class LengthValidationMixin:
     default_error_messages = {
@@ -60,8 +67,9 @@ class FKOrServiceUrlValidator(FKOrURLValidator):
         # ⚡️ the field context is the same as the serializer context, so once one
         # validator subclassing `FKOrServiceUrlValidator` has resolved the instance, we
         # can use the cached result to avoid repeating the same queries/network calls
-        # over and over again.
-        context_key = self.get_context_cache_key(serializer_field)
+        # over and over again. The context is shared by the items of a list
+        # serializer as well, which reuse the instances resolved for the same URL.
+        context_key = self.get_context_cache_key(serializer_field, url)
         if serializer_field.context.get(context_key) is not None:
             return
 
@@ -81,12 +89,12 @@ class FKOrServiceUrlValidator(FKOrURLValidator):
         serializer_field.context[context_key] = resolved_instance
 
     @staticmethod
-    def get_context_cache_key(field):
+    def get_context_cache_key(field, url: str) -> str:
         field_names = [field.field_name]
         while (field := field.parent) and field.field_name:
             field_names.append(field.field_name)
         names = "__".join(field_names)
-        return f"_resolved_{names}"
+        return f"_resolved_{names}:{url}"
 
 
 class FKOrServiceUrlField(FKOrURLField):
@@ -116,3 +124,39 @@ class FKOrServiceUrlField(FKOrURLField):
         source = source.split("__")[0]
         model_field = model_class._meta.get_field(source)
         return model_class, model_field
+
+
+class PrefetchedValuesManyRelatedField(serializers.ManyRelatedField):
+    """
+    ⚡️ Use the lightweight rows from
+    :func:`openzaak.utils.query.prefetch_related_values` when they are available,
+    instead of model instances.
+    """
+
+    def get_attribute(self, instance):
+        prefetched_values = getattr(instance, PREFETCHED_VALUES_ATTR, {})
+        if self.source in prefetched_values:
+            return prefetched_values[self.source]
+        return super().get_attribute(instance)
+
+
+class PrefetchedValuesMixin:
+    @classmethod
+    def many_init(cls, *args, **kwargs):
+        list_kwargs = {"child_relation": cls(*args, **kwargs)}
+        for key in kwargs:
+            if key in MANY_RELATION_KWARGS:
+                list_kwargs[key] = kwargs[key]
+        return PrefetchedValuesManyRelatedField(**list_kwargs)
+
+
+class PrefetchedHyperlinkedRelatedField(
+    PrefetchedValuesMixin, CachedHyperlinkedRelatedField
+):
+    pass
+
+
+class PrefetchedNestedHyperlinkedRelatedField(
+    PrefetchedValuesMixin, CachedNestedHyperlinkedRelatedField
+):
+    pass
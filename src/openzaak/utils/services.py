@@ -0,0 +1,110 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+"""
+Resolve the ``zgw_consumers`` service of a URL without querying the database.
+"""
+
+import copy
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
+
+from zgw_consumers.models import Service
+
+from .db import UncommittedChanges
+
+VERSION_CACHE_KEY = "openzaak:service-index-version"
+
+# seconds in between checks of the shared version, for changes made by other processes
+VERSION_CHECK_INTERVAL = 1
+
+_lock = threading.Lock()
+
+# (shared version, api root lengths from long to short, api root -> service)
+_index: Optional[Tuple[Optional[int], List[int], Dict[str, Service]]] = None
+_version_checked = 0.0
+
+
+def _build_index(version: Optional[int]):
+    services = {}
+    for service in Service.objects.order_by("pk"):
+        services.setdefault(service.api_root, service)
+
+    lengths = sorted({len(api_root) for api_root in services}, reverse=True)
+    return version, lengths, services
+
+
+def _get_index():
+    global _index, _version_checked
+
+    now = time.monotonic()
+    if _index is not None and now - _version_checked < VERSION_CHECK_INTERVAL:
+        return _index
+
+    version = cache.get(VERSION_CACHE_KEY)
+    with _lock:
+        if _index is None or _index[0] != version:
+            _index = _build_index(version)
+        _version_checked = now
+        return _index
+
+
+def get_service(url: str) -> Optional[Service]:
+    """
+    ⚡️ Return the service with the longest API root the URL starts with.
+
+    Equivalent to :meth:`zgw_consumers.models.Service.get_service`, but resolved from
+    an index of the API roots that is built once per process and invalidated when
+    services are changed.
+    """
+    if not url:
+        return None
+
+    # the index is not used until the transaction changing services has ended
+    if _uncommitted_changes.pending():
+        return Service.get_service(url)
+
+    _, lengths, services = _get_index()
+    for length in lengths:
+        service = services.get(url[:length])
+        if service is not None:
+            # model instances are mutable, don't share them across threads
+            return copy.copy(service)
+
+    return None
+
+
+def decompose_url(url: str) -> Tuple[Optional[Service], Optional[str]]:
+    """
+    Split the URL into its service and the URL relative to the API root.
+    """
+    service = get_service(url)
+    if not service:
+        return None, None
+
+    return service, url[len(service.api_root) :]
+
+
+def invalidate_service_index(**kwargs) -> None:
+    """
+    Invalidate the index of this process and of the other processes sharing the cache.
+    """
+    global _index
+
+    try:
+        cache.incr(VERSION_CACHE_KEY)
+    except ValueError:
+        cache.set(VERSION_CACHE_KEY, 1, timeout=None)
+
+    with _lock:
+        _index = None
+
+
+_uncommitted_changes = UncommittedChanges(invalidate_service_index)
+
+
+def service_changed(sender, using: str = DEFAULT_DB_ALIAS, **kwargs) -> None:
+    _uncommitted_changes.changed(using)
@@ -0,0 +1,91 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+from datetime import timedelta
+
+from django.db import DatabaseError, transaction
+from django.db.models import Case, DateTimeField, Value, When
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+import structlog
+from vng_api_common.audittrails.models import AuditTrail
+
+from openzaak import celery_app
+from openzaak.config.models import AuditTrailOutbox
+
+logger = structlog.stdlib.get_logger(__name__)
+
+# outbox entries are normally written right after the transaction is committed
+STALE_OUTBOX_AGE = timedelta(minutes=5)
+OUTBOX_BATCH_SIZE = 100
+
+
+@celery_app.task(
+    # the message is only acknowledged once the audit trails are written
+    acks_late=True,
+    reject_on_worker_lost=True,
+    autoretry_for=(DatabaseError,),
+    retry_backoff=True,
+    max_retries=None,
+)
+def write_audittrails(outbox_ids: list[int]) -> None:
+    """
+    Write the audit trails of the outbox entries stored by the Celery audit sink.
+
+    The entries are removed in the same transaction, so the task can be delivered
+    more than once. Entries of rolled back transactions don't exist and are skipped.
+    """
+    with transaction.atomic():
+        entries = list(
+            AuditTrailOutbox.objects.select_for_update(skip_locked=True)
+            .filter(pk__in=outbox_ids)
+            .order_by("pk")
+        )
+        trails = [data for entry in entries for data in entry.trails]
+        instances = [AuditTrail(**data) for data in trails]
+
+        AuditTrail.objects.bulk_create(instances)
+
+        # `aanmaakdatum` is set to the time of insertion, restore the time of the
+        # action so the audit trails keep their order
+        if instances:
+            AuditTrail.objects.filter(
+                uuid__in=[instance.uuid for instance in instances]
+            ).update(
+                aanmaakdatum=Case(
+                    *[
+                        When(
+                            uuid=instance.uuid,
+                            then=Value(parse_datetime(data["aanmaakdatum"])),
+                        )
+                        for instance, data in zip(instances, trails)
+                    ],
+                    output_field=DateTimeField(),
+                )
+            )
+
+        AuditTrailOutbox.objects.filter(pk__in=[entry.pk for entry in entries]).delete()
+
+    logger.info("audittrails_written", count=len(instances))
+
+
+@celery_app.task
+def write_stale_audittrails() -> None:
+    """
+    Write the audit trails left in the outbox.
+
+    This covers the transactions committed while the message broker couldn't be
+    reached, or of which the task was lost.
+    """
+    outbox_ids = list(
+        AuditTrailOutbox.objects.filter(
+            created_on__lt=timezone.now() - STALE_OUTBOX_AGE
+        )
+        .order_by("pk")
+        .values_list("pk", flat=True)
+    )
+    if outbox_ids:
+        logger.warning("stale_audittrails_found", count=len(outbox_ids))
+
+    for start in range(0, len(outbox_ids), OUTBOX_BATCH_SIZE):
+        write_audittrails(outbox_ids[start : start + OUTBOX_BATCH_SIZE])
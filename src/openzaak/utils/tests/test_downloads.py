@@ -0,0 +1,31 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+from django.test import SimpleTestCase
+
+from openzaak.utils.downloads import RangeNotSatisfiable, parse_range
+
+
+class ParseRangeTests(SimpleTestCase):
+    def test_valid_ranges(self):
+        cases = [
+            ("bytes=0-9", (0, 9)),
+            ("bytes=5-", (5, 9)),
+            ("bytes=-3", (7, 9)),
+            ("bytes=-30", (0, 9)),
+            ("bytes=8-100", (8, 9)),
+        ]
+
+        for header, expected in cases:
+            with self.subTest(header=header):
+                self.assertEqual(parse_range(header, 10), expected)
+
+    def test_ignored_ranges(self):
+        for header in ["bytes=3-1", "bytes=0-1,3-4", "bytes=-", "items=0-1", "foo"]:
+            with self.subTest(header=header):
+                self.assertIsNone(parse_range(header, 10))
+
+    def test_not_satisfiable_ranges(self):
+        for header in ["bytes=10-", "bytes=-0"]:
+            with self.subTest(header=header):
+                with self.assertRaises(RangeNotSatisfiable):
+                    parse_range(header, 10)
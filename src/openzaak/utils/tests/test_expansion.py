@@ -0,0 +1,63 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+from django.test import SimpleTestCase
+
+from openzaak.utils.expansion import InclusionTree
+
+
+class InclusionTreeTests(SimpleTestCase):
+    def test_display_tree(self):
+        tree = InclusionTree()
+        tree.add_node("zaak1", {}, "", many=False)
+        tree.add_node("zaak2", {}, "", many=False)
+        tree.add_node("status1", {"url": "status1"}, "status", False, "zaak1")
+        tree.add_node("status2", {"url": "status2"}, "status", False, "zaak2")
+        tree.add_node("rol1", {"url": "rol1"}, "rollen", True, "zaak1")
+        tree.add_node("rol2", {"url": "rol2"}, "rollen", True, "zaak1")
+        # the same statustype is included for both statussen
+        tree.add_node("st", {"url": "st"}, "statustype", False, "status1")
+        tree.add_node("st", {"url": "st"}, "statustype", False, "status2")
+        # duplicate entries are only added once per parent
+        tree.add_node("rol1", {"url": "rol1"}, "rollen", True, "zaak1")
+
+        self.assertEqual(
+            tree.display_tree(),
+            {
+                "zaak1": {
+                    "status": {
+                        "url": "status1",
+                        "_expand": {"statustype": {"url": "st"}},
+                    },
+                    "rollen": [{"url": "rol1"}, {"url": "rol2"}],
+                },
+                "zaak2": {
+                    "status": {
+                        "url": "status2",
+                        "_expand": {"statustype": {"url": "st"}},
+                    },
+                },
+            },
+        )
+
+    def test_node_added_to_all_parents_with_the_same_id(self):
+        tree = InclusionTree()
+        tree.add_node("zaak1", {}, "", many=False)
+        tree.add_node("zaak2", {}, "", many=False)
+        tree.add_node("zt", {"url": "zt"}, "zaaktype", False, "zaak1")
+        tree.add_node("zt", {"url": "zt"}, "zaaktype", False, "zaak2")
+        tree.add_node("cat", {"url": "cat"}, "catalogus", False, "zt")
+
+        result = tree.display_tree()
+
+        for zaak in ("zaak1", "zaak2"):
+            self.assertEqual(
+                result[zaak]["zaaktype"],
+                {"url": "zt", "_expand": {"catalogus": {"url": "cat"}}},
+            )
+
+    def test_unknown_parent(self):
+        tree = InclusionTree()
+        tree.add_node("zaak1", {}, "", many=False)
+        tree.add_node("rol1", {"url": "rol1"}, "rollen", True, "zaak2")
+
+        self.assertEqual(tree.display_tree(), {"zaak1": {}})
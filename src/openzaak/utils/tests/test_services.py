@@ -0,0 +1,112 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+from django.test import TestCase
+
+from zgw_consumers.models import Service
+from zgw_consumers.test.factories import ServiceFactory
+
+from openzaak.components.zaken.models import ZaakInformatieObject
+from openzaak.components.zaken.tests.factories import ZaakInformatieObjectFactory
+
+from ..fields import ServiceUrlField
+from ..services import decompose_url, get_service
+
+
+class ServiceIndexTests(TestCase):
+    def setUp(self):
+        super().setUp()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.service = ServiceFactory.create(
+                api_root="https://externe.drc.nl/api/v1/"
+            )
+            self.nested_service = ServiceFactory.create(
+                api_root="https://externe.drc.nl/api/v1/nested/"
+            )
+
+    def test_longest_prefix(self):
+        with self.assertNumQueries(1):
+            service = get_service("https://externe.drc.nl/api/v1/documenten/1")
+            nested_service = get_service(
+                "https://externe.drc.nl/api/v1/nested/documenten/1"
+            )
+            unknown = get_service("https://externe.drc.nl/api/v2/documenten/1")
+
+        self.assertEqual(service, self.service)
+        self.assertEqual(nested_service, self.nested_service)
+        self.assertIsNone(unknown)
+        self.assertEqual(
+            decompose_url("https://externe.drc.nl/api/v1/documenten/1"),
+            (self.service, "documenten/1"),
+        )
+
+    def test_invalidated_on_change(self):
+        get_service("https://externe.drc.nl/api/v1/documenten/1")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.nested_service.api_root = "https://externe.drc.nl/api/v1/documenten/"
+            self.nested_service.save()
+
+        self.assertEqual(
+            get_service("https://externe.drc.nl/api/v1/documenten/1"),
+            self.nested_service,
+        )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.nested_service.delete()
+
+        self.assertEqual(
+            get_service("https://externe.drc.nl/api/v1/documenten/1"), self.service
+        )
+
+    def test_uncommitted_changes(self):
+        get_service("https://externe.drc.nl/api/v1/documenten/1")
+
+        # the commit callbacks are not executed, like a rolled back transaction
+        with self.captureOnCommitCallbacks():
+            service = ServiceFactory.create(api_root="https://andere.drc.nl/api/v1/")
+
+        with self.assertNumQueries(1):
+            self.assertEqual(get_service("https://andere.drc.nl/api/v1/1"), service)
+
+        Service.objects.filter(pk=service.pk).delete()
+
+        with self.assertNumQueries(1):
+            self.assertIsNone(get_service("https://andere.drc.nl/api/v1/1"))
+
+    def test_filter_service_url(self):
+        document = "https://externe.drc.nl/api/v1/documenten/1"
+        zio = ZaakInformatieObjectFactory.create(informatieobject=document)
+
+        with self.assertNumQueries(1):
+            result = ZaakInformatieObject.objects.filter(informatieobject=document)
+
+            self.assertEqual(list(result), [zio])
+
+    def test_service_url_field(self):
+        document = "https://externe.drc.nl/api/v1/documenten/1"
+        zio = ZaakInformatieObjectFactory.create(informatieobject=document)
+        get_service(document)
+
+        with self.subTest("assign"), self.assertNumQueries(0):
+            zio._informatieobject_url = document
+
+            self.assertEqual(zio._informatieobject_base_url, self.service)
+
+        with self.subTest("filter"), self.assertNumQueries(2):
+            exact = ZaakInformatieObject.objects.filter(_informatieobject_url=document)
+            in_ = ZaakInformatieObject.objects.filter(
+                _informatieobject_url__in=[document]
+            )
+
+            self.assertEqual(list(exact), [zio])
+            self.assertEqual(list(in_), [zio])
+
+    def test_service_url_field_migrations(self):
+        field = ZaakInformatieObject._meta.get_field("_informatieobject_url")
+
+        self.assertIsInstance(field, ServiceUrlField)
+        # the migrations refer to the upstream field
+        self.assertEqual(
+            field.deconstruct()[1], "zgw_consumers.models.fields.ServiceUrlField"
+        )
@@ -46,7 +46,7 @@ class PublishValidator(FKOrServiceUrlValidator):
                 return
 
             # the super class has added the resolved instance to the context
-            context_key = self.get_context_cache_key(serializer_field)
+            context_key = self.get_context_cache_key(serializer_field, value)
             value = serializer_field.context[context_key]
 
         if value.concept:
@@ -82,7 +82,7 @@ class LooseFkIsImmutableValidator(FKOrServiceUrlValidator):
                 return
 
             # the super class has added the resolved instance to the context
-            context_key = self.get_context_cache_key(serializer_field)
+            context_key = self.get_context_cache_key(serializer_field, new_value)
             new_value = serializer_field.context[context_key]
 
         if isinstance(current_value, EnkelvoudigInformatieObject) and isinstance(
@@ -131,7 +131,7 @@ class LooseFkResourceValidator(ResourceValidatorMixin, FKOrServiceUrlValidator):
             return
 
         # the super class has added the resolved instance to the context
-        context_key = self.get_context_cache_key(serializer_field)
+        context_key = self.get_context_cache_key(serializer_field, value)
         resolved_instance = serializer_field.context[context_key]
         is_local = not isinstance(resolved_instance, ProxyMixin)
         # if local - do nothing